@@ -1,13 +1,19 @@
 """Market-aware alerting (Discord-first, extensible later)."""
 from __future__ import annotations
 
+import atexit
+import functools
+import itertools
 import json
 import os
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Any
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 
-from db.database import query
+from db.database import is_postgres, query
 
 DEFAULT_THRESHOLDS: dict[str, dict[str, Any]] = {
     "*": {"signals": ["BET", "LEAN"], "min_score": 70, "max_rows": 5},
@@ -15,9 +21,26 @@ DEFAULT_THRESHOLDS: dict[str, dict[str, Any]] = {
     "K": {"signals": ["BET", "LEAN"], "min_score": 70, "max_rows": 5},
 }
 
+# Keep-alive session so repeated alert sends reuse one TLS connection.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+_SESSION.headers["Content-Type"] = "application/json"
+
+# Background sender for async_send=True; drained at interpreter exit.
+_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="alerts")
+atexit.register(_EXECUTOR.shutdown, wait=True)
+
+# Discord rejects webhook messages whose content exceeds this length.
+DISCORD_CONTENT_LIMIT = 2000
+
 
 def _load_thresholds() -> dict[str, dict[str, Any]]:
-    raw = os.getenv("ALERT_THRESHOLDS_JSON", "").strip()
+    return _parse_thresholds(os.getenv("ALERT_THRESHOLDS_JSON", "").strip())
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_thresholds(raw: str) -> dict[str, dict[str, Any]]:
+    """Parse ALERT_THRESHOLDS_JSON once per distinct value."""
     if not raw:
         return DEFAULT_THRESHOLDS
     try:
@@ -34,13 +57,26 @@ def _threshold_for_market(market: str) -> dict[str, Any]:
     return thresholds.get(market, thresholds.get("*", DEFAULT_THRESHOLDS["*"]))
 
 
+def _in_clause(column: str, values: list[Any]) -> tuple[str, tuple]:
+    """
+    Membership filter for a variable-length value list.
+
+    On Postgres this is `column = ANY(?)` with the list bound as one array
+    parameter, so the SQL text is identical whatever the list length and
+    the server can reuse its plan. sqlite has no arrays and keeps IN (?, ...).
+    """
+    if is_postgres():
+        return f"{column} = ANY(?)", (list(values),)
+    return f"{column} IN ({','.join(['?'] * len(values))})", tuple(values)
+
+
 def _top_rows(game_date: str, market: str) -> list[dict[str, Any]]:
     t = _threshold_for_market(market)
     signals = [str(s).upper() for s in t.get("signals", ["BET"])]
     min_score = float(t.get("min_score", 70))
     max_rows = int(t.get("max_rows", 5))
-    placeholders = ",".join(["?"] * len(signals))
-    params = (game_date, market, *signals, min_score, max_rows)
+    signal_clause, signal_params = _in_clause("signal", signals)
+    params = (game_date, market, *signal_params, min_score, max_rows)
     return query(
         f"""
         SELECT game_date, market, player_name, team_abbr, side, line, selection_key,
@@ -50,7 +86,7 @@ def _top_rows(game_date: str, market: str) -> list[dict[str, Any]]:
         WHERE game_date = ?
           AND market = ?
           AND COALESCE(is_active, 1) = 1
-          AND signal IN ({placeholders})
+          AND {signal_clause}
           AND model_score >= ?
         ORDER BY model_score DESC, edge DESC
         LIMIT ?
@@ -59,37 +95,111 @@ def _top_rows(game_date: str, market: str) -> list[dict[str, Any]]:
     )
 
 
-def _build_payload(game_date: str, market: str, rows: list[dict[str, Any]], dashboard_url: str | None = None) -> dict[str, Any]:
-    title = f"MLBPredicts Alerts — {game_date} {market}"
+def _top_rows_by_market(game_date: str, markets: list[str]) -> dict[str, list[dict[str, Any]]]:
+    """
+    Top alert rows for several markets from one query.
+
+    SQL filters on the loosest signal set / min_score across the markets;
+    each market's own threshold and max_rows are then applied per group.
+    """
+    thresholds = {m: _threshold_for_market(m) for m in markets}
+    signals = sorted({str(s).upper() for t in thresholds.values() for s in t.get("signals", ["BET"])})
+    min_score = min(float(t.get("min_score", 70)) for t in thresholds.values())
+    market_clause, market_params = _in_clause("market", markets)
+    signal_clause, signal_params = _in_clause("signal", signals)
+    rows = query(
+        f"""
+        SELECT game_date, market, player_name, team_abbr, side, line, selection_key,
+               model_score, edge, signal, confidence_band, sportsbook,
+               lineup_confirmed, reasons_json, risk_flags_json
+        FROM mlb_model_scores
+        WHERE game_date = ?
+          AND {market_clause}
+          AND COALESCE(is_active, 1) = 1
+          AND {signal_clause}
+          AND model_score >= ?
+        ORDER BY market, model_score DESC, edge DESC
+        """,
+        (game_date, *market_params, *signal_params, min_score),
+    )
+
+    by_market: dict[str, list[dict[str, Any]]] = {m: [] for m in markets}
+    for market, group in itertools.groupby(rows, key=lambda r: r.get("market")):
+        t = thresholds.get(market)
+        if t is None:
+            continue
+        market_signals = {str(s).upper() for s in t.get("signals", ["BET"])}
+        market_min = float(t.get("min_score", 70))
+        kept = (
+            r for r in group
+            if str(r.get("signal")).upper() in market_signals and float(r.get("model_score") or 0) >= market_min
+        )
+        by_market[market] = list(itertools.islice(kept, int(t.get("max_rows", 5))))
+    return by_market
+
+
+def _format_lines(rows: list[dict[str, Any]]) -> list[str]:
     lines = []
     for row in rows:
-        reasons = row.get("reasons_json") or "[]"
-        risk = row.get("risk_flags_json") or "[]"
         try:
-            reasons_list = json.loads(reasons)[:2]
+            reasons_list = orjson.loads(row.get("reasons_json") or "[]")[:2]
         except Exception:
             reasons_list = []
         try:
-            risk_list = json.loads(risk)[:2]
+            risk_list = orjson.loads(row.get("risk_flags_json") or "[]")[:2]
         except Exception:
             risk_list = []
-        lines.append(
-            " • "
-            + f"{row.get('signal')} {row.get('player_name') or row.get('selection_key') or row.get('team_abbr')} "
-            + f"{row.get('side') or ''} {row.get('line') or ''} "
-            + f"score={round(float(row.get('model_score') or 0),1)} edge={round(float(row.get('edge') or 0),2)}% "
-            + f"lineup={'Y' if row.get('lineup_confirmed') else 'N'} "
-            + (f"reasons={'; '.join(reasons_list)} " if reasons_list else "")
-            + (f"risk={'; '.join(risk_list)}" if risk_list else "")
-        )
+        label = row.get("player_name") or row.get("selection_key") or row.get("team_abbr")
+        parts = [
+            f" • {row.get('signal')} {label} {row.get('side') or ''} {row.get('line') or ''} "
+            f"score={round(float(row.get('model_score') or 0),1)} edge={round(float(row.get('edge') or 0),2)}% "
+            f"lineup={'Y' if row.get('lineup_confirmed') else 'N'} "
+        ]
+        if reasons_list:
+            parts.append(f"reasons={'; '.join(reasons_list)} ")
+        if risk_list:
+            parts.append(f"risk={'; '.join(risk_list)}")
+        lines.append("".join(parts))
+    return lines
+
 
-    content = "\n".join([title, *lines])
+def _build_payload(game_date: str, market: str, rows: list[dict[str, Any]], dashboard_url: str | None = None) -> dict[str, Any]:
+    title = f"MLBPredicts Alerts — {game_date} {market}"
+    content = "\n".join([title, *_format_lines(rows)])
     if dashboard_url:
         content += f"\nDashboard: {dashboard_url}"
     return {"content": content[:1900]}
 
 
-def send_market_alerts(game_date: str, market: str, dashboard_url: str | None = None) -> dict[str, Any]:
+def _post_webhook(webhook: str, payload: dict[str, Any]) -> requests.Response:
+    resp = _SESSION.post(webhook, data=orjson.dumps(payload), timeout=15)
+    resp.raise_for_status()
+    return resp
+
+
+def _report_async_failure(future: Future) -> None:
+    exc = future.exception()
+    if exc is not None:
+        print(f"  ⚠️  Queued Discord alert failed: {exc}")
+
+
+def _queue_webhook(webhook: str, payload: dict[str, Any]) -> None:
+    future = _EXECUTOR.submit(_post_webhook, webhook, payload)
+    future.add_done_callback(_report_async_failure)
+
+
+def send_market_alerts(
+    game_date: str,
+    market: str,
+    dashboard_url: str | None = None,
+    async_send: bool = False,
+) -> dict[str, Any]:
+    """
+    Post the market's top rows to Discord.
+
+    With async_send=True the POST is handed to a background thread and the
+    call returns {"sent": "queued", ...} without waiting on the round trip.
+    """
     webhook = os.getenv("DISCORD_WEBHOOK_URL", "").strip()
     rows = _top_rows(game_date, market)
     if not rows:
@@ -98,6 +208,88 @@ def send_market_alerts(game_date: str, market: str, dashboard_url: str | None =
         return {"sent": False, "reason": "webhook_not_set", "count": len(rows)}
 
     payload = _build_payload(game_date, market, rows, dashboard_url=dashboard_url)
-    resp = requests.post(webhook, json=payload, timeout=15)
-    resp.raise_for_status()
+    if async_send:
+        _queue_webhook(webhook, payload)
+        return {"sent": "queued", "count": len(rows)}
+    resp = _post_webhook(webhook, payload)
     return {"sent": True, "count": len(rows), "status_code": resp.status_code}
+
+
+def _pack_messages(sections: list[tuple[str | None, str]]) -> list[tuple[list[str], str]]:
+    """
+    Greedily pack (market, text) sections into as few messages as fit the
+    Discord content limit. Returns (markets, content) per message; a single
+    section longer than the limit is truncated on its own message.
+    """
+    messages: list[tuple[list[str], str]] = []
+    markets: list[str] = []
+    content = ""
+    for market, text in sections:
+        text = text[:DISCORD_CONTENT_LIMIT]
+        if content and len(content) + 1 + len(text) > DISCORD_CONTENT_LIMIT:
+            messages.append((markets, content))
+            markets, content = [], ""
+        content = f"{content}\n{text}" if content else text
+        if market is not None:
+            markets.append(market)
+    if content:
+        messages.append((markets, content))
+    return messages
+
+
+def send_market_alerts_batch(
+    game_date: str,
+    markets: list[str],
+    dashboard_url: str | None = None,
+    async_send: bool = False,
+) -> dict[str, Any]:
+    """
+    Send Discord alerts for several markets.
+
+    Rows for every market come from a single query, and the market sections
+    are packed into as few webhook POSTs as the content limit allows.
+    "market_results" holds a send_market_alerts()-style result per market;
+    a market only counts as sent when the message carrying it went out.
+    async_send behaves as in send_market_alerts().
+    """
+    webhook = os.getenv("DISCORD_WEBHOOK_URL", "").strip()
+    by_market = _top_rows_by_market(game_date, markets) if markets else {}
+    by_market = {m: rows for m, rows in by_market.items() if rows}
+    count = sum(len(rows) for rows in by_market.values())
+    if not count:
+        return {"sent": False, "reason": "no_rows", "count": 0}
+    if not webhook:
+        return {"sent": False, "reason": "webhook_not_set", "count": count}
+
+    sections: list[tuple[str | None, str]] = [
+        (market, "\n".join([f"MLBPredicts Alerts — {game_date} {market}", *_format_lines(rows)]))
+        for market, rows in by_market.items()
+    ]
+    if dashboard_url:
+        sections.append((None, f"Dashboard: {dashboard_url}"))
+    messages = _pack_messages(sections)
+
+    market_results: dict[str, dict[str, Any]] = {
+        m: {"sent": False, "reason": "no_rows", "count": 0} for m in markets if m not in by_market
+    }
+    for message_markets, content in messages:
+        if async_send:
+            _queue_webhook(webhook, {"content": content})
+            outcome: dict[str, Any] = {"sent": "queued"}
+        else:
+            try:
+                resp = _post_webhook(webhook, {"content": content})
+                outcome = {"sent": True, "status_code": resp.status_code}
+            except Exception as exc:
+                outcome = {"sent": False, "reason": f"error:{exc}"}
+        for market in message_markets:
+            market_results[market] = {**outcome, "count": len(by_market[market])}
+
+    delivered = {m: r["count"] for m, r in market_results.items() if r["sent"]}
+    return {
+        "sent": "queued" if async_send else len(delivered) == len(by_market),
+        "count": sum(delivered.values()),
+        "markets": delivered,
+        "messages": len(messages),
+        "market_results": market_results,
+    }
@@ -1,17 +1,32 @@
 """FastAPI service — health checks, status, and MLB data endpoints."""
 from __future__ import annotations
 
+import base64
+import binascii
+import functools
+import hashlib
 import os
-from datetime import datetime, timezone
-from typing import Any
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Any, Callable, Generator, Iterator
+
+import orjson
 
 from fastapi import Depends, FastAPI, Header, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 from slowapi.util import get_remote_address
 
+try:
+    from db.database import get_connection, get_status, query as db_query, query_iter as db_query_iter
+except Exception:  # noqa: BLE001 - keep /health serving if DB config is broken
+    get_connection = get_status = db_query = db_query_iter = None
+
 
 # ── Rate limiting ──────────────────────────────────────────────────────────────
 
@@ -23,7 +38,14 @@ def _rate_key(request: Request) -> str:
     return get_remote_address(request)
 
 
-limiter = Limiter(key_func=_rate_key)
+# Shared counters across uvicorn workers when REDIS_URL is set; otherwise
+# each process keeps its own in-memory window. If Redis becomes unreachable
+# the limiter falls back to in-memory counters instead of failing requests.
+limiter = Limiter(
+    key_func=_rate_key,
+    storage_uri=os.getenv("REDIS_URL", "memory://"),
+    in_memory_fallback_enabled=True,
+)
 
 app = FastAPI(title="MLBPredicts API", version="0.3.0")
 app.state.limiter = limiter
@@ -42,6 +64,12 @@ app.add_middleware(
 _JWT_SECRET = os.getenv("SUPABASE_JWT_SECRET", "")
 _JWT_ALGO = "HS256"
 
+# Verified tokens → (user_id, exp epoch), keyed by a short token digest so a
+# client's repeat requests skip the JWT decode until the token expires.
+_AUTH_CACHE_MAX_ENTRIES = 1024
+_auth_cache: dict[bytes, tuple[str, float]] = {}
+_auth_cache_lock = threading.Lock()
+
 
 def _get_bearer(authorization: str | None = Header(default=None)) -> str:
     if not authorization or not authorization.startswith("Bearer "):
@@ -64,26 +92,61 @@ def _require_auth(token: str = Depends(_get_bearer)) -> str:
             status_code=500,
             detail="Auth not configured on this service (SUPABASE_JWT_SECRET missing).",
         )
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    hit = _auth_cache.get(key)
+    if hit is not None and hit[1] > time.time():
+        return hit[0]
+
     try:
         payload = jwt.decode(
             token, _JWT_SECRET, algorithms=[_JWT_ALGO], audience="authenticated"
         )
-        return str(payload["sub"])
     except JWTError:
         raise HTTPException(status_code=401, detail="Invalid or expired token.")
 
+    user_id = str(payload["sub"])
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        with _auth_cache_lock:
+            if key not in _auth_cache and len(_auth_cache) >= _AUTH_CACHE_MAX_ENTRIES:
+                _auth_cache.pop(next(iter(_auth_cache)))
+            _auth_cache[key] = (user_id, float(exp))
+    return user_id
+
 
 # ── Helpers ────────────────────────────────────────────────────────────────────
 
+# (bucket, formatted) pairs, swapped atomically; recomputed once per bucket.
+_NOW_ISO: tuple[int, str] = (-1, "")
+_TODAY: tuple[int, str] = (-1, "")
+
+
+def _utc_now_iso() -> str:
+    """UTC timestamp string, reformatted at most once per second."""
+    global _NOW_ISO
+    now = time.time()
+    second, formatted = _NOW_ISO
+    if int(now) != second:
+        formatted = datetime.fromtimestamp(now, timezone.utc).isoformat()
+        _NOW_ISO = (int(now), formatted)
+    return formatted
+
+
 def _today() -> str:
-    return datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    global _TODAY
+    day = int(time.time() // 86400)
+    cached_day, formatted = _TODAY
+    if day != cached_day:
+        formatted = datetime.fromtimestamp(day * 86400, timezone.utc).strftime("%Y-%m-%d")
+        _TODAY = (day, formatted)
+    return formatted
 
 
 def _meta(date_str: str, count: int) -> dict[str, Any]:
     return {
         "sport": "MLB",
         "date": date_str,
-        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "generated_at": _utc_now_iso(),
         "count": count,
     }
 
@@ -92,27 +155,110 @@ def _envelope(data: list[Any], date_str: str) -> dict[str, Any]:
     return {"data": data, "meta": _meta(date_str, len(data))}
 
 
-def _period_clause(period: str) -> str:
-    mapping = {
-        "last7": "game_date >= CURRENT_DATE - INTERVAL '7 days'",
-        "last30": "game_date >= CURRENT_DATE - INTERVAL '30 days'",
-        "last90": "game_date >= CURRENT_DATE - INTERVAL '90 days'",
-        "alltime": "",
-    }
-    return mapping.get(period, mapping["last30"])
+STREAM_CHUNK_ROWS = 100
+
+
+def _json_default(obj: Any) -> Any:
+    if isinstance(obj, Decimal):
+        return float(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _stream_envelope(
+    first: dict[str, Any] | None,
+    rows: Generator[dict[str, Any], None, None],
+    date_str: str,
+) -> Iterator[bytes]:
+    """
+    Encode {"data": [...], "meta": {...}} incrementally.
+
+    Rows are flushed STREAM_CHUNK_ROWS at a time; meta comes last so its
+    count reflects what was actually sent.
+    """
+    count = 0
+    try:
+        yield b'{"data":['
+        if first is not None:
+            sep = b""
+            chunk = [orjson.dumps(first, default=_json_default)]
+            count = 1
+            for row in rows:
+                chunk.append(orjson.dumps(row, default=_json_default))
+                count += 1
+                if len(chunk) >= STREAM_CHUNK_ROWS:
+                    yield sep + b",".join(chunk)
+                    sep, chunk = b",", []
+            if chunk:
+                yield sep + b",".join(chunk)
+        yield b'],"meta":' + orjson.dumps(_meta(date_str, count)) + b"}"
+    finally:
+        rows.close()
+
+
+# Short-TTL cache for read-mostly endpoints (cards / summaries change at most
+# every few minutes). Stores the data list only; meta stays per-response.
+_READ_CACHE_TTL_SECONDS = 60
+_READ_CACHE_MAX_ENTRIES = 256
+_read_cache: dict[tuple, tuple[float, list[dict[str, Any]]]] = {}
+_read_cache_lock = threading.Lock()
+
+
+def _cached_rows(key: tuple, load: Callable[[], list[dict[str, Any]]]) -> list[dict[str, Any]]:
+    now = time.monotonic()
+    hit = _read_cache.get(key)
+    if hit is not None and hit[0] > now:
+        return hit[1]
+    data = load()
+    with _read_cache_lock:
+        if key not in _read_cache and len(_read_cache) >= _READ_CACHE_MAX_ENTRIES:
+            _read_cache.pop(next(iter(_read_cache)))
+        _read_cache[key] = (now + _READ_CACHE_TTL_SECONDS, data)
+    return data
+
+
+# Projection shared by every endpoint that lists mlb_model_scores rows.
+_MODEL_SCORE_COLUMNS = """
+        player_name, team_abbr, opponent_team_abbr,
+        market, bet_type, line, side,
+        ROUND(model_score::numeric, 2) AS model_score,
+        edge, signal, confidence_band, visibility_tier, result"""
+
+
+@functools.lru_cache(maxsize=32)
+def _select_model_scores(where_sql: str) -> str:
+    """Top-N mlb_model_scores SELECT for a WHERE clause; binds LIMIT last."""
+    return f"""
+    SELECT{_MODEL_SCORE_COLUMNS}
+    FROM mlb_model_scores
+    WHERE {where_sql}
+    ORDER BY model_score DESC
+    LIMIT ?
+    """
+
+
+_PERIOD_DAYS = {"last7": 7, "last30": 30, "last90": 90, "alltime": None}
+
+
+def _period_clause(period: str) -> tuple[str, list[Any]]:
+    """SQL fragment + bound cutoff date for a period ("" / [] for alltime)."""
+    days = _PERIOD_DAYS.get(period, _PERIOD_DAYS["last30"])
+    if days is None:
+        return "", []
+    cutoff = (datetime.fromisoformat(_today()) - timedelta(days=days)).date()
+    return "game_date >= ?", [cutoff]
 
 
 # ── Health / Status ────────────────────────────────────────────────────────────
 
 @app.get("/health")
 def health() -> dict:
-    return {"ok": True, "status": "ok", "timestamp": datetime.now(timezone.utc).isoformat()}
+    return {"ok": True, "status": "ok", "timestamp": _utc_now_iso()}
 
 
 @app.get("/status")
-def status() -> dict:
+@limiter.limit("30/minute")
+def status(request: Request) -> dict:
     try:
-        from db.database import get_status
         return {"status": "ok", "tables": get_status()}
     except Exception as exc:  # noqa: BLE001
         return {"status": "degraded", "tables": {}, "error": str(exc)}
@@ -120,34 +266,32 @@ def status() -> dict:
 
 # ── GET /api/mlb/games ─────────────────────────────────────────────────────────
 
+_SQL_GAMES = """
+    SELECT
+        game_id,
+        game_date,
+        home_team,
+        away_team,
+        home_pitcher_name,
+        away_pitcher_name,
+        status,
+        home_score,
+        away_score
+    FROM mlb_games
+    WHERE game_date = ?
+    ORDER BY game_id
+    """
+
+
 @app.get("/api/mlb/games")
 @limiter.limit("100/minute")
 def get_games(
     request: Request,
     date: str = Query(default=None, description="Game date YYYY-MM-DD (defaults to today)"),
 ) -> dict[str, Any]:
-    from db.database import query as db_query
-
     game_date = date or _today()
-    rows = db_query(
-        """
-        SELECT
-            game_id,
-            game_date,
-            home_team,
-            away_team,
-            home_pitcher_name,
-            away_pitcher_name,
-            status,
-            home_score,
-            away_score
-        FROM mlb_games
-        WHERE game_date = ?
-        ORDER BY game_id
-        """,
-        (game_date,),
-    )
-    return _envelope([dict(r) for r in rows], game_date)
+    rows = db_query(_SQL_GAMES, (game_date,))
+    return _envelope(rows, game_date)
 
 
 # ── GET /api/mlb/scores ────────────────────────────────────────────────────────
@@ -161,9 +305,7 @@ def get_scores(
     signal: str = Query(default=None, description="Signal filter e.g. BET, LEAN"),
     min_score: float = Query(default=0.0, description="Minimum model_score (0-100)"),
     limit: int = Query(default=100, ge=1, le=1000, description="Max rows to return"),
-) -> dict[str, Any]:
-    from db.database import query as db_query
-
+) -> StreamingResponse:
     game_date = date or _today()
 
     where_parts = ["game_date = ?", "COALESCE(is_active, 1) = 1"]
@@ -182,73 +324,117 @@ def get_scores(
     where_sql = " AND ".join(where_parts)
     params.append(limit)
 
-    rows = db_query(
-        f"""
-        SELECT
-            player_name,
-            team_abbr,
-            opponent_team_abbr,
-            market,
-            bet_type,
-            line,
-            side,
-            ROUND(model_score::numeric, 2) AS model_score,
-            edge,
-            signal,
-            confidence_band,
-            visibility_tier,
-            result
-        FROM mlb_model_scores
-        WHERE {where_sql}
-        ORDER BY model_score DESC
-        LIMIT ?
-        """,
-        tuple(params),
-    )
-    return _envelope([dict(r) for r in rows], game_date)
+    rows = db_query_iter(_select_model_scores(where_sql), tuple(params))
+    # Pull the first row here so query errors still surface as a normal 500.
+    first = next(rows, None)
+    return StreamingResponse(_stream_envelope(first, rows, game_date), media_type="application/json")
 
 
 # ── GET /api/mlb/daily-card ────────────────────────────────────────────────────
 
+_SQL_DAILY_CARD = "SELECT * FROM mlb_daily_cards WHERE card_date = ? LIMIT 1"
+
+DAILY_CARD_FALLBACK_ROWS = 10
+_SQL_DAILY_CARD_FALLBACK = _select_model_scores(
+    "game_date = ? AND signal IN ('BET', 'LEAN') AND COALESCE(is_active, 1) = 1"
+)
+
+
+def _load_daily_card(game_date: str) -> list[dict[str, Any]]:
+    rows = db_query(_SQL_DAILY_CARD, (game_date,))
+    if rows:
+        return rows[:1]
+
+    # Fallback: top BET/LEAN scores for the date
+    return db_query(_SQL_DAILY_CARD_FALLBACK, (game_date, DAILY_CARD_FALLBACK_ROWS))
+
+
 @app.get("/api/mlb/daily-card")
 @limiter.limit("100/minute")
 def get_daily_card(
     request: Request,
     date: str = Query(default=None, description="Card date YYYY-MM-DD (defaults to today)"),
 ) -> dict[str, Any]:
-    from db.database import query as db_query
-
     game_date = date or _today()
-
-    rows = db_query(
-        "SELECT * FROM mlb_daily_cards WHERE card_date = ? LIMIT 1",
-        (game_date,),
-    )
-    if rows:
-        return _envelope([dict(rows[0])], game_date)
-
-    # Fallback: top 10 BET/LEAN scores for the date
-    fallback = db_query(
-        """
-        SELECT
-            player_name, team_abbr, opponent_team_abbr,
-            market, bet_type, line, side,
-            ROUND(model_score::numeric, 2) AS model_score,
-            edge, signal, confidence_band, visibility_tier, result
-        FROM mlb_model_scores
-        WHERE game_date = ?
-          AND signal IN ('BET', 'LEAN')
-          AND COALESCE(is_active, 1) = 1
-        ORDER BY model_score DESC
-        LIMIT 10
-        """,
-        (game_date,),
-    )
-    return _envelope([dict(r) for r in fallback], game_date)
+    return _envelope(_cached_rows(("daily_card", game_date), lambda: _load_daily_card(game_date)), game_date)
 
 
 # ── GET /api/mlb/performance/summary ──────────────────────────────────────────
 
+_SQL_PERF_FROM_BANDS = """
+    SELECT
+        band,
+        SUM(total)::bigint AS total,
+        SUM(wins)::bigint AS wins,
+        ROUND((SUM(sum_score) / SUM(total))::numeric, 1) AS avg_score,
+        ROUND((SUM(sum_edge) / NULLIF(SUM(n_edge), 0))::numeric, 3) AS avg_edge
+    FROM mlb_perf_daily_bands
+    {where_sql}
+    GROUP BY band
+    ORDER BY band DESC
+"""
+
+_SQL_PERF_FROM_SCORES = """
+    SELECT
+        CASE
+            WHEN model_score >= 80 THEN '80+'
+            WHEN model_score >= 70 THEN '70-79'
+            WHEN model_score >= 60 THEN '60-69'
+            ELSE '<60'
+        END AS band,
+        COUNT(*) AS total,
+        SUM(CASE WHEN result = 'win' THEN 1 ELSE 0 END) AS wins,
+        ROUND(AVG(model_score)::numeric, 1) AS avg_score,
+        ROUND(AVG(edge)::numeric, 3) AS avg_edge
+    FROM mlb_model_scores
+    {where_sql}
+    GROUP BY band
+    ORDER BY band DESC
+"""
+
+
+def _missing_relation(exc: Exception, relation: str) -> bool:
+    msg = str(exc).lower()
+    return relation in msg and ("does not exist" in msg or "no such table" in msg)
+
+
+def _load_performance_summary(period: str, market: str | None) -> list[dict[str, Any]]:
+    where_parts: list[str] = []
+    params: list[Any] = []
+
+    if market:
+        where_parts.append("market = ?")
+        params.append(market)
+
+    period_clause, period_params = _period_clause(period)
+    if period_clause:
+        where_parts.append(period_clause)
+        params.extend(period_params)
+
+    where_sql = f"WHERE {' AND '.join(where_parts)}" if where_parts else ""
+
+    # mlb_perf_daily_bands (migration 008) pre-buckets graded scores per
+    # day/market/band, so this only sums the daily rows in the period.
+    # Until that migration runs, bucket mlb_model_scores directly.
+    try:
+        rows = db_query(_SQL_PERF_FROM_BANDS.format(where_sql=where_sql), tuple(params))
+    except Exception as exc:  # noqa: BLE001
+        if not _missing_relation(exc, "mlb_perf_daily_bands"):
+            raise
+        graded = ["result IS NOT NULL", "result != 'pending'", "result != 'void'", *where_parts]
+        rows = db_query(
+            _SQL_PERF_FROM_SCORES.format(where_sql=f"WHERE {' AND '.join(graded)}"),
+            tuple(params),
+        )
+
+    for row in rows:
+        total = row.get("total") or 0
+        wins = row.get("wins") or 0
+        row["win_rate"] = round(wins / total, 4) if total > 0 else None
+
+    return rows
+
+
 @app.get("/api/mlb/performance/summary")
 @limiter.limit("100/minute")
 def get_performance_summary(
@@ -256,8 +442,6 @@ def get_performance_summary(
     period: str = Query(default="last30", description="last7 | last30 | last90 | alltime"),
     market: str = Query(default=None, description="Optional market filter e.g. HR"),
 ) -> dict[str, Any]:
-    from db.database import query as db_query
-
     valid_periods = {"last7", "last30", "last90", "alltime"}
     if period not in valid_periods:
         raise HTTPException(
@@ -265,65 +449,77 @@ def get_performance_summary(
             detail=f"period must be one of: {', '.join(sorted(valid_periods))}",
         )
 
-    where_parts = ["result IS NOT NULL", "result != 'pending'", "result != 'void'"]
-    params: list[Any] = []
-
-    if market:
-        where_parts.append("market = ?")
-        params.append(market.upper())
-
-    period_clause = _period_clause(period)
-    if period_clause:
-        where_parts.append(period_clause)
-
-    rows = db_query(
-        f"""
-        SELECT
-            CASE
-                WHEN model_score >= 80 THEN '80+'
-                WHEN model_score >= 70 THEN '70-79'
-                WHEN model_score >= 60 THEN '60-69'
-                ELSE '<60'
-            END AS band,
-            COUNT(*) AS total,
-            SUM(CASE WHEN result = 'win' THEN 1 ELSE 0 END) AS wins,
-            ROUND(AVG(model_score)::numeric, 1) AS avg_score,
-            ROUND(AVG(edge)::numeric, 3) AS avg_edge
-        FROM mlb_model_scores
-        WHERE {' AND '.join(where_parts)}
-        GROUP BY band
-        ORDER BY band DESC
-        """,
-        tuple(params),
+    market_key = market.upper() if market else None
+    data = _cached_rows(
+        ("performance_summary", period, market_key),
+        lambda: _load_performance_summary(period, market_key),
     )
-
-    data = [dict(r) for r in rows]
-    for row in data:
-        total = row.get("total") or 0
-        wins = row.get("wins") or 0
-        row["win_rate"] = round(wins / total, 4) if total > 0 else None
-
     return _envelope(data, _today())
 
 
 # ── GET /api/mlb/players/{player_id} ──────────────────────────────────────────
 
+_SQL_PLAYER = "SELECT * FROM mlb_players WHERE player_id = ? LIMIT 1"
+
+
 @app.get("/api/mlb/players/{player_id}")
 @limiter.limit("100/minute")
 def get_player(request: Request, player_id: int) -> dict[str, Any]:
-    from db.database import query as db_query
-
-    rows = db_query(
-        "SELECT * FROM mlb_players WHERE player_id = ? LIMIT 1",
-        (player_id,),
-    )
+    rows = db_query(_SQL_PLAYER, (player_id,))
     if not rows:
         raise HTTPException(status_code=404, detail=f"Player {player_id} not found")
-    return _envelope([dict(rows[0])], _today())
+    return _envelope(rows[:1], _today())
 
 
 # ── Picks ──────────────────────────────────────────────────────────────────────
 
+_SQL_MY_PICKS_TEMPLATE = """
+    SELECT
+        p.id,
+        p.saved_at,
+        p.prediction_id AS model_score_id,
+        ms.game_date,
+        ms.market,
+        ms.player_name,
+        ms.team_abbr,
+        ms.opponent_team_abbr,
+        ms.bet_type,
+        ms.line,
+        ms.side,
+        ROUND(ms.model_score::numeric, 2) AS model_score,
+        ms.edge,
+        ms.signal,
+        ms.visibility_tier,
+        ms.result
+    FROM user_saved_picks p
+    LEFT JOIN mlb_model_scores ms ON ms.id = p.prediction_id
+    WHERE p.user_id = ?
+      AND p.sport = 'MLB'{keyset}
+    ORDER BY p.saved_at DESC, p.id DESC
+    LIMIT ?
+    """
+_SQL_MY_PICKS = _SQL_MY_PICKS_TEMPLATE.format(keyset="")
+_SQL_MY_PICKS_AFTER = _SQL_MY_PICKS_TEMPLATE.format(keyset="\n      AND (p.saved_at, p.id) < (?, ?)")
+
+MY_PICKS_PAGE_SIZE = 50
+MY_PICKS_MAX_PAGE_SIZE = 200
+
+
+def _encode_picks_cursor(row: dict[str, Any]) -> str:
+    saved_at = row["saved_at"]
+    saved_at = saved_at.isoformat() if hasattr(saved_at, "isoformat") else str(saved_at)
+    return base64.urlsafe_b64encode(f"{saved_at}|{row['id']}".encode()).decode()
+
+
+def _decode_picks_cursor(cursor: str) -> tuple[str, int]:
+    """Cursor → (saved_at, id) of the last row on the previous page."""
+    try:
+        saved_at, _, pick_id = base64.urlsafe_b64decode(cursor.encode()).decode().rpartition("|")
+        return saved_at, int(pick_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor.")
+
+
 class SavePickBody(BaseModel):
     model_score_id: int
 
@@ -335,8 +531,6 @@ def save_pick(
     body: SavePickBody,
     user_id: str = Depends(_require_auth),
 ) -> dict[str, Any]:
-    from db.database import get_connection, query as db_query
-
     if body.model_score_id <= 0:
         raise HTTPException(status_code=400, detail="model_score_id must be a positive integer.")
 
@@ -383,34 +577,17 @@ def save_pick(
 def get_my_picks(
     request: Request,
     user_id: str = Depends(_require_auth),
+    cursor: str = Query(default=None, description="next_cursor from the previous page"),
+    limit: int = Query(default=MY_PICKS_PAGE_SIZE, ge=1, le=MY_PICKS_MAX_PAGE_SIZE),
 ) -> dict[str, Any]:
-    from db.database import query as db_query
-
-    rows = db_query(
-        """
-        SELECT
-            p.id,
-            p.saved_at,
-            p.prediction_id AS model_score_id,
-            ms.game_date,
-            ms.market,
-            ms.player_name,
-            ms.team_abbr,
-            ms.opponent_team_abbr,
-            ms.bet_type,
-            ms.line,
-            ms.side,
-            ROUND(ms.model_score::numeric, 2) AS model_score,
-            ms.edge,
-            ms.signal,
-            ms.visibility_tier,
-            ms.result
-        FROM user_saved_picks p
-        LEFT JOIN mlb_model_scores ms ON ms.id = p.prediction_id
-        WHERE p.user_id = ?
-          AND p.sport = 'MLB'
-        ORDER BY p.saved_at DESC
-        """,
-        (user_id,),
-    )
-    return _envelope([dict(r) for r in rows], _today())
+    # Keyset pagination: newest first, one extra row tells us if more remain.
+    if cursor:
+        saved_at, pick_id = _decode_picks_cursor(cursor)
+        rows = db_query(_SQL_MY_PICKS_AFTER, (user_id, saved_at, pick_id, limit + 1))
+    else:
+        rows = db_query(_SQL_MY_PICKS, (user_id, limit + 1))
+
+    page = rows[:limit]
+    envelope = _envelope(page, _today())
+    envelope["meta"]["next_cursor"] = _encode_picks_cursor(page[-1]) if len(rows) > limit else None
+    return envelope
@@ -17,7 +17,9 @@ Legacy (--no-bulk):
 
 Concurrency:
   Features, scoring, and grading run in a thread pool (--workers, default 4).
-  Statcast fetch is always single-threaded to avoid rate-limiting.
+  Statcast, schedule, umpire and lineup fetches are always single-threaded
+  to avoid rate-limiting; in bulk mode the per-date stat computation from the
+  in-memory frame also uses the pool.
 
 Examples:
   # Fast bulk backfill (recommended):
@@ -33,22 +35,28 @@ from __future__ import annotations
 
 import argparse
 from concurrent.futures import ThreadPoolExecutor, as_completed
+import threading
 from datetime import datetime, timedelta
 from typing import Any
 
 import pandas as pd
 
 from build_features import run_build_features
-from db.database import query
+from db.database import COPY_UPSERT_MIN_ROWS, query, shared_connections
 from fetchers.lineups import fetch_lineups_for_date
-from fetchers.pitchers import compute_pitcher_stats_from_df, fetch_daily_pitcher_stats
-from fetchers.schedule import fetch_todays_games, fetch_umpire_assignments
+from fetchers.pitchers import (
+    compute_pitcher_stats_from_df,
+    fetch_daily_pitcher_stats,
+    pitcher_stat_rows_from_df,
+)
+from fetchers.schedule import fetch_schedule_and_umpires
 from fetchers.statcast import (
     compute_batter_stats_for_date,
     fetch_daily_batter_stats,
     fetch_statcast_bulk,
+    game_date_order,
 )
-from grade_results import grade_results_for_date
+from grade_results import grade_results_for_date, refresh_perf_daily_bands
 from score_markets import score_markets
 from db.database import upsert_many
 
@@ -60,84 +68,169 @@ def _parse_date(value: str) -> datetime:
     return datetime.strptime(value, DATE_FMT)
 
 
-def _iter_dates(start_date: str, end_date: str):
-    start = _parse_date(start_date)
-    end = _parse_date(end_date)
-    current = start
-    while current <= end:
-        yield current.strftime(DATE_FMT)
-        current += timedelta(days=1)
+def _date_range(start_date: str, end_date: str) -> list[str]:
+    """Inclusive list of YYYY-MM-DD dates, formatted in one vectorised call."""
+    return pd.date_range(start_date, end_date, freq="D").strftime(DATE_FMT).tolist()
 
 
 # ---------------------------------------------------------------------------
-# Existence checks — one per stage, fast COUNT queries
+# Existence checks — one per stage, stop at the first matching row
 # ---------------------------------------------------------------------------
 
 def _has_games(game_date: str) -> bool:
-    rows = query("SELECT COUNT(*) AS cnt FROM mlb_games WHERE game_date = ?", (game_date,))
-    return bool(rows and int(rows[0].get("cnt", 0)) > 0)
+    return bool(query("SELECT 1 FROM mlb_games WHERE game_date = ? LIMIT 1", (game_date,)))
 
 
 def _has_batter_stats(game_date: str) -> bool:
-    rows = query("SELECT COUNT(*) AS cnt FROM mlb_batter_stats WHERE stat_date = ?", (game_date,))
-    return bool(rows and int(rows[0].get("cnt", 0)) > 0)
+    return bool(query("SELECT 1 FROM mlb_batter_stats WHERE stat_date = ? LIMIT 1", (game_date,)))
 
 
 def _has_pitcher_stats(game_date: str) -> bool:
-    rows = query("SELECT COUNT(*) AS cnt FROM mlb_pitcher_stats WHERE stat_date = ?", (game_date,))
-    return bool(rows and int(rows[0].get("cnt", 0)) > 0)
+    return bool(query("SELECT 1 FROM mlb_pitcher_stats WHERE stat_date = ? LIMIT 1", (game_date,)))
 
 
 def _has_features(game_date: str) -> bool:
-    rows = query("SELECT COUNT(*) AS cnt FROM mlb_batter_daily_features WHERE game_date = ?", (game_date,))
-    return bool(rows and int(rows[0].get("cnt", 0)) > 0)
+    return bool(query("SELECT 1 FROM mlb_batter_daily_features WHERE game_date = ? LIMIT 1", (game_date,)))
 
 
 def _has_scores(game_date: str) -> bool:
     rows = query(
-        "SELECT COUNT(*) AS cnt FROM mlb_model_scores WHERE game_date = ? AND COALESCE(is_active, 1) = 1",
+        "SELECT 1 FROM mlb_model_scores WHERE game_date = ? AND COALESCE(is_active, 1) = 1 LIMIT 1",
         (game_date,),
     )
-    return bool(rows and int(rows[0].get("cnt", 0)) > 0)
+    return bool(rows)
 
 
 def _has_grades(game_date: str) -> bool:
-    rows = query("SELECT COUNT(*) AS cnt FROM mlb_market_outcomes WHERE game_date = ?", (game_date,))
-    return bool(rows and int(rows[0].get("cnt", 0)) > 0)
+    return bool(query("SELECT 1 FROM mlb_market_outcomes WHERE game_date = ? LIMIT 1", (game_date,)))
+
+
+_STAGE_CHECKS = {
+    "games": _has_games,
+    "batter_stats": _has_batter_stats,
+    "pitcher_stats": _has_pitcher_stats,
+    "features": _has_features,
+    "scores": _has_scores,
+    "grades": _has_grades,
+}
+
+# stage -> (table, date column, extra predicate) for the range scans below
+_STAGE_TABLES = {
+    "games": ("mlb_games", "game_date", ""),
+    "batter_stats": ("mlb_batter_stats", "stat_date", ""),
+    "pitcher_stats": ("mlb_pitcher_stats", "stat_date", ""),
+    "features": ("mlb_batter_daily_features", "game_date", ""),
+    "scores": ("mlb_model_scores", "game_date", " AND COALESCE(is_active, 1) = 1"),
+    "grades": ("mlb_market_outcomes", "game_date", ""),
+}
+
+
+def _populated_dates(stage: str, start_date: str, end_date: str) -> set[str]:
+    """All dates in [start_date, end_date] that already have rows for a stage."""
+    table, date_col, extra = _STAGE_TABLES[stage]
+    rows = query(
+        f"SELECT DISTINCT {date_col} AS d FROM {table} WHERE {date_col} BETWEEN ? AND ?{extra}",
+        (start_date, end_date),
+    )
+    return {str(r["d"])[:10] for r in rows if r.get("d") is not None}
+
+
+def _stage_done(stage: str, game_date: str, populated: dict[str, set[str]] | None) -> bool:
+    """Check a stage against the prefetched date sets, else query the DB."""
+    if populated is not None and stage in populated:
+        return game_date in populated[stage]
+    return _STAGE_CHECKS[stage](game_date)
+
 
+def _starters_from_games(games: list[dict[str, Any]]) -> dict[int, str | None]:
+    """Probable starter pitcher_id -> team from mlb_games-shaped rows."""
+    starters: dict[int, str | None] = {}
+    for g in games:
+        if g.get("home_pitcher_id"):
+            starters[int(g["home_pitcher_id"])] = g.get("home_team")
+        if g.get("away_pitcher_id"):
+            starters[int(g["away_pitcher_id"])] = g.get("away_team")
+    return starters
 
-def _get_pitcher_ids(game_date: str) -> list[int]:
+
+def _get_starters(game_date: str) -> dict[int, str | None]:
     games = query(
-        "SELECT home_pitcher_id, away_pitcher_id FROM mlb_games WHERE game_date = ?",
+        "SELECT home_team, away_team, home_pitcher_id, away_pitcher_id FROM mlb_games WHERE game_date = ?",
         (game_date,),
     )
-    ids: list[int] = []
+    return _starters_from_games(games)
+
+
+def _starters_by_date(start_date: str, end_date: str) -> dict[str, dict[int, str | None]]:
+    """_get_starters for every date in the range, from one games query."""
+    games = query(
+        "SELECT game_date, home_team, away_team, home_pitcher_id, away_pitcher_id "
+        "FROM mlb_games WHERE game_date BETWEEN ? AND ?",
+        (start_date, end_date),
+    )
+    by_date: dict[str, list[dict[str, Any]]] = {}
     for g in games:
-        if g.get("home_pitcher_id"):
-            ids.append(int(g["home_pitcher_id"]))
-        if g.get("away_pitcher_id"):
-            ids.append(int(g["away_pitcher_id"]))
-    return sorted(set(ids))
+        by_date.setdefault(str(g["game_date"])[:10], []).append(g)
+    return {game_date: _starters_from_games(rows) for game_date, rows in by_date.items()}
+
+
+class _BatchWriter:
+    """
+    Buffers Statcast stat rows across dates and upserts them in large
+    batches, so Phase 1 commits once per few thousand rows instead of once
+    per date and table. Flushing at the COPY threshold lets Postgres take
+    the COPY path in upsert_many.
+    """
+
+    def __init__(self, flush_rows: int = COPY_UPSERT_MIN_ROWS):
+        self.flush_rows = flush_rows
+        # (table, conflict cols) -> (rows, dates those rows cover)
+        self._pending: dict[tuple[str, tuple[str, ...]], tuple[list[dict[str, Any]], set[str]]] = {}
+        self._buffered = 0
+        # game_date -> error, for dates whose buffered rows failed to write
+        self.failed: dict[str, str] = {}
+        # Phase 1 workers share one writer
+        self._lock = threading.Lock()
+
+    def add(self, table: str, rows: list[dict[str, Any]], conflict_cols: list[str], game_date: str) -> int:
+        if not rows:
+            return 0
+        with self._lock:
+            batch_rows, batch_dates = self._pending.setdefault((table, tuple(conflict_cols)), ([], set()))
+            batch_rows.extend(rows)
+            batch_dates.add(game_date)
+            self._buffered += len(rows)
+            if self._buffered >= self.flush_rows:
+                self._flush_locked()
+        return len(rows)
+
+    def flush(self) -> int:
+        with self._lock:
+            return self._flush_locked()
+
+    def _flush_locked(self) -> int:
+        # Detach the buffer first so a failed write is not retried with
+        # every later flush. A failed batch marks every date it covered
+        # rather than failing whichever day happened to trigger the flush.
+        pending, self._pending, self._buffered = self._pending, {}, 0
+        written = 0
+        for (table, conflict_cols), (rows, dates) in pending.items():
+            try:
+                written += upsert_many(table, rows, list(conflict_cols))
+            except Exception as exc:
+                error = f"{table} write failed: {exc}"
+                print(f"❌ {error} ({len(dates)} dates)")
+                for game_date in dates:
+                    self.failed.setdefault(game_date, error)
+        return written
 
 
 # ---------------------------------------------------------------------------
 # Per-day processor (used both by bulk and legacy paths)
 # ---------------------------------------------------------------------------
 
-def _process_day(
-    game_date: str,
-    *,
-    bulk_df: pd.DataFrame | None,
-    include_lineups: bool,
-    build_features: bool,
-    score: bool,
-    grade: bool,
-    all_markets: bool,
-    market: str,
-    skip_fetch: bool,
-    force: bool,
-) -> dict[str, Any]:
-    day_summary: dict[str, Any] = {
+def _new_day_summary(game_date: str) -> dict[str, Any]:
+    return {
         "game_date": game_date,
         "games": 0,
         "umpires": 0,
@@ -150,47 +243,133 @@ def _process_day(
         "skipped_stages": [],
     }
 
-    # --- Raw data fetching ---
-    if not skip_fetch:
-        if force or not _has_games(game_date):
-            games = fetch_todays_games(game_date)
-            day_summary["games"] = len(games)
-            umpire_map = fetch_umpire_assignments(game_date)
-            day_summary["umpires"] = len(umpire_map)
-        else:
-            day_summary["skipped_stages"].append("games")
 
-        if include_lineups:
-            lineup_result = fetch_lineups_for_date(game_date)
-            day_summary["lineups"] = int(lineup_result.get("inserted", 0))
+def _fetch_day_sources(
+    game_date: str,
+    day_summary: dict[str, Any],
+    *,
+    include_lineups: bool,
+    force: bool,
+    populated: dict[str, set[str]] | None,
+) -> dict[int, str | None] | None:
+    """
+    Schedule, umpire and lineup pulls for one date (statsapi calls).
+    Returns the starters from just-fetched games, or None when the games
+    stage was skipped.
+    """
+    starters: dict[int, str | None] | None = None
+    if force or not _stage_done("games", game_date, populated):
+        games, umpire_map = fetch_schedule_and_umpires(game_date)
+        # Just-fetched games already carry the starters; no re-query needed.
+        starters = _starters_from_games(games)
+        day_summary["games"] = len(games)
+        day_summary["umpires"] = len(umpire_map)
+    else:
+        day_summary["skipped_stages"].append("games")
+
+    if include_lineups:
+        lineup_result = fetch_lineups_for_date(game_date)
+        day_summary["lineups"] = int(lineup_result.get("inserted", 0))
+    return starters
 
-        if force or not _has_batter_stats(game_date):
-            if bulk_df is not None:
-                # Fast path: slice in-memory bulk DataFrame
-                batter_rows = compute_batter_stats_for_date(bulk_df, game_date)
-                count = upsert_many("mlb_batter_stats", batter_rows, ["player_id", "stat_date", "window_days"])
-                day_summary["batter_rows"] = count
+
+def _compute_day_stats(
+    game_date: str,
+    day_summary: dict[str, Any],
+    *,
+    bulk_df: pd.DataFrame | None,
+    force: bool,
+    populated: dict[str, set[str]] | None,
+    writer: _BatchWriter | None,
+    starters: dict[int, str | None] | None,
+    bulk_order: str | None = None,
+) -> None:
+    """
+    Batter and pitcher stat rows for one date (from bulk_df when given).
+    bulk_order is game_date_order(bulk_df), computed once per run.
+    """
+    if force or not _stage_done("batter_stats", game_date, populated):
+        if bulk_df is not None:
+            # Fast path: slice in-memory bulk DataFrame
+            batter_rows = compute_batter_stats_for_date(bulk_df, game_date, date_order=bulk_order)
+            conflict_cols = ["player_id", "stat_date", "window_days"]
+            if writer is not None:
+                count = writer.add("mlb_batter_stats", batter_rows, conflict_cols, game_date)
             else:
-                batter_rows = fetch_daily_batter_stats(as_of_date=game_date) or []
-                day_summary["batter_rows"] = len(batter_rows)
+                count = upsert_many("mlb_batter_stats", batter_rows, conflict_cols)
+            day_summary["batter_rows"] = count
         else:
-            day_summary["skipped_stages"].append("batter_stats")
-
-        if force or not _has_pitcher_stats(game_date):
-            pitcher_ids = _get_pitcher_ids(game_date)
-            if pitcher_ids:
-                if bulk_df is not None:
-                    # Fast path: filter in-memory bulk DataFrame
-                    count = compute_pitcher_stats_from_df(bulk_df, pitcher_ids, game_date)
-                    day_summary["pitcher_rows"] = count
+            batter_rows = fetch_daily_batter_stats(as_of_date=game_date) or []
+            day_summary["batter_rows"] = len(batter_rows)
+    else:
+        day_summary["skipped_stages"].append("batter_stats")
+
+    if force or not _stage_done("pitcher_stats", game_date, populated):
+        if starters is None:
+            starters = _get_starters(game_date)
+        pitcher_ids = sorted(starters)
+        if pitcher_ids:
+            if bulk_df is not None:
+                # Fast path: filter in-memory bulk DataFrame
+                if writer is not None:
+                    pitcher_rows = pitcher_stat_rows_from_df(
+                        bulk_df, pitcher_ids, game_date, pitcher_team_map=starters, date_order=bulk_order
+                    )
+                    count = writer.add(
+                        "mlb_pitcher_stats",
+                        pitcher_rows,
+                        ["player_id", "stat_date", "window_days"],
+                        game_date,
+                    )
                 else:
-                    day_summary["pitcher_rows"] = int(fetch_daily_pitcher_stats(pitcher_ids, as_of_date=game_date))
-        else:
-            day_summary["skipped_stages"].append("pitcher_stats")
+                    count = compute_pitcher_stats_from_df(
+                        bulk_df, pitcher_ids, game_date, pitcher_team_map=starters, date_order=bulk_order
+                    )
+                day_summary["pitcher_rows"] = count
+            else:
+                day_summary["pitcher_rows"] = int(fetch_daily_pitcher_stats(pitcher_ids, as_of_date=game_date))
+    else:
+        day_summary["skipped_stages"].append("pitcher_stats")
+
+
+def _process_day(
+    game_date: str,
+    *,
+    bulk_df: pd.DataFrame | None,
+    include_lineups: bool,
+    build_features: bool,
+    score: bool,
+    grade: bool,
+    all_markets: bool,
+    market: str,
+    skip_fetch: bool,
+    force: bool,
+    populated: dict[str, set[str]] | None = None,
+    writer: _BatchWriter | None = None,
+    known_starters: dict[int, str | None] | None = None,
+    bulk_order: str | None = None,
+) -> dict[str, Any]:
+    day_summary = _new_day_summary(game_date)
+
+    # --- Raw data fetching ---
+    if not skip_fetch:
+        starters = _fetch_day_sources(
+            game_date, day_summary, include_lineups=include_lineups, force=force, populated=populated
+        )
+        _compute_day_stats(
+            game_date,
+            day_summary,
+            bulk_df=bulk_df,
+            force=force,
+            populated=populated,
+            writer=writer,
+            starters=starters if starters is not None else known_starters,
+            bulk_order=bulk_order,
+        )
 
     # --- Feature building ---
     if build_features:
-        if force or not _has_features(game_date):
+        if force or not _stage_done("features", game_date, populated):
             feature_summary = run_build_features(date=game_date, all_dates=False)
             day_summary["feature_runs"] = len(feature_summary)
         else:
@@ -198,7 +377,7 @@ def _process_day(
 
     # --- Scoring ---
     if score:
-        if force or not _has_scores(game_date):
+        if force or not _stage_done("scores", game_date, populated):
             score_summary = score_markets(
                 game_date=game_date,
                 market=market,
@@ -211,8 +390,9 @@ def _process_day(
 
     # --- Grading ---
     if grade:
-        if force or not _has_grades(game_date):
-            grade_summary = grade_results_for_date(game_date)
+        if force or not _stage_done("grades", game_date, populated):
+            # The perf-band rollup is refreshed once after all dates are graded.
+            grade_summary = grade_results_for_date(game_date, refresh_perf_bands=False)
             day_summary["grade_outcomes"] = int(grade_summary.get("outcomes_upserted", 0))
         else:
             day_summary["skipped_stages"].append("grades")
@@ -224,6 +404,9 @@ def _process_day(
 # Main backfill runner
 # ---------------------------------------------------------------------------
 
+# Worker threads each keep one DB connection for the whole run instead of
+# connecting per query/upsert.
+@shared_connections()
 def run_backfill(
     start_date: str,
     end_date: str,
@@ -251,6 +434,7 @@ def run_backfill(
     # Bulk Statcast pre-fetch
     # ------------------------------------------------------------------
     bulk_df: pd.DataFrame | None = None
+    bulk_order: str | None = None
     if bulk and not skip_fetch:
         # Pull 30 extra days before start so rolling windows are correct on day 1
         padded_start = (_parse_date(start_date) - timedelta(days=30)).strftime(DATE_FMT)
@@ -260,24 +444,34 @@ def run_backfill(
             print("  ⚠️  Bulk fetch returned no data — falling back to per-day fetch")
             bulk_df = None
         else:
+            # One scan for the date order, not one per date in the slicers
+            bulk_order = game_date_order(bulk_df)
             print(f"  ✅ In-memory cache ready: {len(bulk_df):,} pitches\n")
 
     # ------------------------------------------------------------------
     # Quick skip-check and date list
     # ------------------------------------------------------------------
+    # One range scan per requested stage instead of one query per date/stage
+    populated: dict[str, set[str]] | None = None
+    if not force:
+        stages = [
+            stage
+            for stage, wanted in (
+                ("games", not skip_fetch),
+                ("batter_stats", not skip_fetch),
+                ("pitcher_stats", not skip_fetch),
+                ("features", build_features),
+                ("scores", score),
+                ("grades", grade),
+            )
+            if wanted
+        ]
+        populated = {stage: _populated_dates(stage, start_date, end_date) for stage in stages}
+
     dates_to_process: list[str] = []
-    for game_date in _iter_dates(start_date, end_date):
-        if not force:
-            all_done = True
-            if not skip_fetch:
-                if not (_has_games(game_date) and _has_batter_stats(game_date) and _has_pitcher_stats(game_date)):
-                    all_done = False
-            if build_features and not _has_features(game_date):
-                all_done = False
-            if score and not _has_scores(game_date):
-                all_done = False
-            if grade and not _has_grades(game_date):
-                all_done = False
+    for game_date in _date_range(start_date, end_date):
+        if populated is not None:
+            all_done = all(game_date in dates for dates in populated.values())
             if all_done:
                 skipped_dates += 1
                 if skipped_dates <= 5 or skipped_dates % 50 == 0:
@@ -298,43 +492,115 @@ def run_backfill(
         }
 
     # ------------------------------------------------------------------
-    # Statcast stages (batter + pitcher) are computed from the bulk df
-    # and are fast enough to run sequentially. Features/score/grade are
+    # Statcast stages (batter + pitcher) are computed from the bulk df;
+    # with it in memory they are pandas work and share the thread pool.
+    # Schedule/umpire/lineup pulls and per-day Statcast pulls (--no-bulk)
+    # stay sequential to avoid rate-limiting. Features/score/grade are
     # parallelised since they hit the DB and CPU rather than external APIs.
     # ------------------------------------------------------------------
 
-    # Phase 1 — fetch stages (sequential, bulk df slice per day)
+    # Phase 1 — fetch stages (bulk df slice per day)
     fetch_results: dict[str, dict] = {}
-    for i, game_date in enumerate(dates_to_process, 1):
-        print(f"\n{'=' * 70}")
-        print(f"📚 BACKFILL {game_date}  [{i}/{len(dates_to_process)}]")
-        print("=" * 70)
-        try:
-            result = _process_day(
+    writer = _BatchWriter()
+    # Starters for dates whose games are already stored, in one query
+    starters_by_date: dict[str, dict[int, str | None]] = {}
+    if not skip_fetch and not force:
+        starters_by_date = _starters_by_date(dates_to_process[0], dates_to_process[-1])
+
+    def _phase1(game_date: str) -> dict[str, Any]:
+        return _process_day(
+            game_date,
+            bulk_df=bulk_df,
+            include_lineups=include_lineups,
+            build_features=False,   # deferred to Phase 2
+            score=False,
+            grade=False,
+            all_markets=all_markets,
+            market=market,
+            skip_fetch=skip_fetch,
+            force=force,
+            populated=populated,
+            writer=writer,
+            known_starters=starters_by_date.get(game_date),
+            bulk_order=bulk_order,
+        )
+
+    def _record_phase1(game_date: str, result: dict[str, Any]) -> None:
+        fetch_results[game_date] = result
+        skipped_str = (
+            f" (skipped: {', '.join(result['skipped_stages'])})"
+            if result["skipped_stages"] else ""
+        )
+        print(
+            f"✅ Fetched {game_date}{skipped_str}: "
+            f"batters={result['batter_rows']}, pitchers={result['pitcher_rows']}"
+        )
+
+    def _fail_phase1(game_date: str, exc: Exception) -> None:
+        failures.append({"game_date": game_date, "error": str(exc)})
+        fetch_results[game_date] = {}
+        print(f"❌ Fetch failed {game_date}: {exc}")
+
+    if bulk_df is not None and workers > 1:
+        # Schedule/umpire/lineup pulls hit statsapi and stay sequential to
+        # respect its rate limits; only the stat computation from the
+        # in-memory frame runs on the pool.
+        print(f"\n📅 Phase 1 — schedule/umpires/lineups for {len(dates_to_process)} dates (sequential)")
+        fetched: dict[str, tuple[dict[str, Any], dict[int, str | None] | None]] = {}
+        for game_date in dates_to_process:
+            day_summary = _new_day_summary(game_date)
+            try:
+                starters = _fetch_day_sources(
+                    game_date, day_summary, include_lineups=include_lineups, force=force, populated=populated
+                )
+            except Exception as exc:
+                _fail_phase1(game_date, exc)
+                continue
+            if starters is None:
+                starters = starters_by_date.get(game_date)
+            fetched[game_date] = (day_summary, starters)
+
+        def _stats(game_date: str) -> dict[str, Any]:
+            day_summary, starters = fetched[game_date]
+            _compute_day_stats(
                 game_date,
+                day_summary,
                 bulk_df=bulk_df,
-                include_lineups=include_lineups,
-                build_features=False,   # deferred to Phase 2
-                score=False,
-                grade=False,
-                all_markets=all_markets,
-                market=market,
-                skip_fetch=skip_fetch,
                 force=force,
+                populated=populated,
+                writer=writer,
+                starters=starters,
+                bulk_order=bulk_order,
             )
-            fetch_results[game_date] = result
-            skipped_str = (
-                f" (skipped: {', '.join(result['skipped_stages'])})"
-                if result["skipped_stages"] else ""
-            )
-            print(
-                f"✅ Fetched {game_date}{skipped_str}: "
-                f"batters={result['batter_rows']}, pitchers={result['pitcher_rows']}"
-            )
-        except Exception as exc:
-            failures.append({"game_date": game_date, "error": str(exc)})
-            fetch_results[game_date] = {}
-            print(f"❌ Fetch failed {game_date}: {exc}")
+            return day_summary
+
+        print(f"\n⚡ Phase 1 — stats for {len(fetched)} dates ({workers} workers)")
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            future_to_date = {pool.submit(_stats, d): d for d in fetched}
+            for future in as_completed(future_to_date):
+                game_date = future_to_date[future]
+                try:
+                    _record_phase1(game_date, future.result())
+                except Exception as exc:
+                    _fail_phase1(game_date, exc)
+    else:
+        for i, game_date in enumerate(dates_to_process, 1):
+            print(f"\n{'=' * 70}")
+            print(f"📚 BACKFILL {game_date}  [{i}/{len(dates_to_process)}]")
+            print("=" * 70)
+            try:
+                _record_phase1(game_date, _phase1(game_date))
+            except Exception as exc:
+                _fail_phase1(game_date, exc)
+
+    # Phase 2 reads batter/pitcher stats, so buffered rows must land first.
+    # Dates whose rows failed to write (here or in a mid-run flush) are
+    # failures, not inputs to Phase 2.
+    writer.flush()
+    for game_date, error in sorted(writer.failed.items()):
+        if fetch_results.pop(game_date, None):
+            failures.append({"game_date": game_date, "error": error})
+            print(f"❌ Stats write failed {game_date}: {error}")
 
     # Phase 2 — features / score / grade (parallelised)
     if build_features or score or grade:
@@ -353,6 +619,7 @@ def run_backfill(
                 market=market,
                 skip_fetch=True,        # raw data already done in Phase 1
                 force=force,
+                populated=populated,
             )
 
         with ThreadPoolExecutor(max_workers=workers) as pool:
@@ -375,6 +642,9 @@ def run_backfill(
                 except Exception as exc:
                     failures.append({"game_date": game_date, "error": str(exc)})
                     print(f"  ❌ Phase 2 failed {game_date}: {exc}")
+
+        if grade and any("grades" not in summary["skipped_stages"] for summary in summaries):
+            refresh_perf_daily_bands()
     else:
         # No Phase 2 — just collect fetch results
         for game_date in dates_to_process:
@@ -413,7 +683,7 @@ def main() -> int:
         "--workers",
         type=int,
         default=4,
-        help="Thread pool size for Phase 2 (features/score/grade). Default: 4",
+        help="Thread pool size for bulk Phase 1 stats and Phase 2 (features/score/grade). Default: 4",
     )
 
     args = parser.parse_args()
@@ -3,9 +3,13 @@ MLB HR Prop Pipeline - Configuration
 """
 import os
 from pathlib import Path
+from types import MappingProxyType
+from typing import Final
 from dotenv import load_dotenv
 
-load_dotenv()
+# Deployed environments set real env vars; .env is a local-dev convenience.
+if not os.getenv("PRODUCTION"):
+    load_dotenv()
 
 # ── Paths ──────────────────────────────────────────────────
 BASE_DIR = Path(__file__).parent
@@ -69,7 +73,8 @@ TEMP_HOT_MULTIPLIER = 1.08
 TEMP_COLD_MULTIPLIER = 0.92
 
 # ── Team Abbreviation Mapping ─────────────────────────────
-TEAM_ABBRS = {
+# Read-only: shared by every fetcher, never mutated at runtime.
+TEAM_ABBRS: Final = MappingProxyType({
     "Arizona Diamondbacks": "ARI", "Atlanta Braves": "ATL",
     "Baltimore Orioles": "BAL", "Boston Red Sox": "BOS",
     "Chicago Cubs": "CHC", "Chicago White Sox": "CHW",
@@ -85,10 +90,10 @@ TEAM_ABBRS = {
     "Seattle Mariners": "SEA", "St. Louis Cardinals": "STL",
     "Tampa Bay Rays": "TB", "Texas Rangers": "TEX",
     "Toronto Blue Jays": "TOR", "Washington Nationals": "WSH",
-}
+})
 
 # Reverse lookup
-ABBR_TO_FULL = {v: k for k, v in TEAM_ABBRS.items()}
+ABBR_TO_FULL: Final = MappingProxyType({v: k for k, v in TEAM_ABBRS.items()})
 
 
 # ── Multi-market configs (initial defaults) ───────────────────────────────
@@ -1,13 +1,17 @@
 """Database connection and helper functions (Postgres-first, sqlite fallback)."""
 from __future__ import annotations
 
+import functools
 import json
+import operator
 import os
 import sqlite3
+import threading
+from contextlib import contextmanager
 from urllib.parse import quote, urlsplit
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
 from config import DB_PATH
 
@@ -86,6 +90,28 @@ def _postgres_url_hint(postgres_url: str) -> str | None:
         )
     return None
 
+
+@functools.lru_cache(maxsize=1)
+def _resolve_postgres_url() -> str:
+    """
+    Resolve and validate the Postgres URL once per process.
+
+    get_connection() runs for every query/upsert, so env lookups and URL
+    validation are memoized rather than repeated per operation.
+    """
+    postgres_url = _get_postgres_url()
+    if postgres_url:
+        hint = _postgres_url_hint(postgres_url)
+        if hint:
+            raise RuntimeError(f"Invalid Postgres configuration. {hint}")
+    return postgres_url
+
+
+def is_postgres() -> bool:
+    """True when get_connection() hands out Postgres (not sqlite) connections."""
+    return bool(_resolve_postgres_url())
+
+
 def _split_statements(sql_text: str) -> list[str]:
     statements: list[str] = []
     buf: list[str] = []
@@ -112,7 +138,9 @@ def _split_statements(sql_text: str) -> list[str]:
     return statements
 
 
+@functools.lru_cache(maxsize=256)
 def _adapt_paramstyle(sql: str, backend: str) -> str:
+    """Rewrite ? placeholders to %s for Postgres (memoized per SQL text)."""
     if backend != "postgres" or "?" not in sql:
         return sql
 
@@ -171,11 +199,8 @@ def get_connection() -> DBConnection:
     - Postgres/Supabase when DATABASE_URL-style env is present
     - sqlite fallback otherwise
     """
-    postgres_url = _get_postgres_url()
+    postgres_url = _resolve_postgres_url()
     if postgres_url:
-        hint = _postgres_url_hint(postgres_url)
-        if hint:
-            raise RuntimeError(f"Invalid Postgres configuration. {hint}")
         if psycopg is None:
             raise RuntimeError(
                 "Postgres URL detected but psycopg is not installed. "
@@ -190,14 +215,109 @@ def get_connection() -> DBConnection:
             raise
         return DBConnection(raw=raw, backend="postgres")
 
+    return _connect_sqlite()
+
+
+def _connect_sqlite(check_same_thread: bool = True) -> DBConnection:
     DB_PATH.parent.mkdir(parents=True, exist_ok=True)
-    raw = sqlite3.connect(str(DB_PATH))
+    raw = sqlite3.connect(str(DB_PATH), check_same_thread=check_same_thread)
     raw.row_factory = sqlite3.Row
     raw.execute("PRAGMA journal_mode=WAL")
     raw.execute("PRAGMA foreign_keys=ON")
     return DBConnection(raw=raw, backend="sqlite")
 
 
+_thread_conns = threading.local()
+_shared_lock = threading.Lock()
+_shared_depth = 0
+_shared_generation = 0
+_shared_open: list[DBConnection] = []
+
+
+@contextmanager
+def shared_connections() -> Iterator[None]:
+    """
+    Reuse one connection per thread for the query/write helpers.
+
+    Outside this block every helper call opens and closes its own
+    connection. Inside it, each thread connects once on first use and keeps
+    that connection until the outermost block exits, when all are closed.
+    Also usable as a decorator.
+    """
+    global _shared_depth, _shared_generation
+    with _shared_lock:
+        _shared_depth += 1
+    try:
+        yield
+    finally:
+        to_close: list[DBConnection] = []
+        with _shared_lock:
+            _shared_depth -= 1
+            if not _shared_depth:
+                _shared_generation += 1
+                to_close = list(_shared_open)
+                _shared_open.clear()
+        for conn in to_close:
+            _close_quietly(conn)
+
+
+def _close_quietly(conn: DBConnection) -> None:
+    try:
+        conn.close()
+    except Exception:  # noqa: BLE001
+        pass
+
+
+def _thread_connection() -> DBConnection | None:
+    """This thread's shared connection, or None outside shared_connections()."""
+    if not _shared_depth:
+        return None
+    generation = _shared_generation
+    if getattr(_thread_conns, "generation", None) == generation:
+        return _thread_conns.conn
+
+    if is_postgres():
+        conn = get_connection()
+    else:
+        # Closed from whichever thread exits the block, and long-lived, so
+        # it also gets a larger page cache and relaxed syncing under WAL.
+        conn = _connect_sqlite(check_same_thread=False)
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA cache_size=-200000")
+    with _shared_lock:
+        _shared_open.append(conn)
+    _thread_conns.conn = conn
+    _thread_conns.generation = generation
+    return conn
+
+
+@contextmanager
+def _borrow_connection() -> Iterator[DBConnection]:
+    """Yield the thread's shared connection if there is one, else a fresh one."""
+    conn = _thread_connection()
+    if conn is None:
+        conn = get_connection()
+        try:
+            yield conn
+        finally:
+            conn.close()
+        return
+
+    try:
+        yield conn
+    except BaseException:
+        # The connection may be broken or mid-transaction; let the next
+        # call on this thread reconnect rather than inherit it.
+        _thread_conns.generation = None
+        with _shared_lock:
+            _shared_open[:] = [c for c in _shared_open if c is not conn]
+        _close_quietly(conn)
+        raise
+    # End the read transaction a query leaves open on Postgres so the
+    # connection does not sit idle in transaction between calls.
+    conn.rollback()
+
+
 def init_db() -> None:
     """Initialize database from the backend-appropriate schema file."""
     conn = get_connection()
@@ -216,6 +336,35 @@ def init_db() -> None:
     print(f"✅ Database initialized using {schema_name}")
 
 
+UPSERT_BATCH_SIZE = int(os.getenv("UPSERT_BATCH_SIZE", "500"))
+# Postgres upserts at least this large go through COPY + INSERT ... SELECT.
+COPY_UPSERT_MIN_ROWS = int(os.getenv("COPY_UPSERT_MIN_ROWS", "5000"))
+
+
+def _row_params(cols: list[str]):
+    """Row dict -> params tuple in cols order, via one itemgetter C call."""
+    getter = operator.itemgetter(*cols)
+    # A lone column comes back bare; wrap it to keep the params a tuple.
+    return getter if len(cols) > 1 else (lambda r: (getter(r),))
+
+
+def _execute_batches(conn: DBConnection, sql: str, cols: list[str], rows: list[dict]) -> int:
+    """
+    Run a write statement over rows in fixed-size executemany batches.
+
+    On Postgres, psycopg pipelines each executemany call, so a batch costs
+    roughly one round trip instead of one per row. Returns summed rowcount.
+    """
+    to_params = _row_params(cols)
+    affected = 0
+    for idx in range(0, len(rows), UPSERT_BATCH_SIZE):
+        batch = rows[idx : idx + UPSERT_BATCH_SIZE]
+        cursor = conn.executemany(sql, [to_params(r) for r in batch])
+        if isinstance(cursor.rowcount, int) and cursor.rowcount > 0:
+            affected += int(cursor.rowcount)
+    return affected
+
+
 def insert_many(table: str, rows: list[dict]) -> int:
     """Bulk insert rows into a table, ignoring conflicts."""
     if not rows:
@@ -225,24 +374,55 @@ def insert_many(table: str, rows: list[dict]) -> int:
     placeholders = ", ".join(["?"] * len(cols))
     col_str = ", ".join(cols)
 
-    conn = get_connection()
-    try:
+    with _borrow_connection() as conn:
         if conn.backend == "postgres":
             sql = f"INSERT INTO {table} ({col_str}) VALUES ({placeholders}) ON CONFLICT DO NOTHING"
-            inserted = 0
-            for row in rows:
-                cursor = conn.execute(sql, tuple(row[c] for c in cols))
-                if isinstance(cursor.rowcount, int) and cursor.rowcount > 0:
-                    inserted += int(cursor.rowcount)
-            conn.commit()
-            return inserted
         else:
             sql = f"INSERT OR IGNORE INTO {table} ({col_str}) VALUES ({placeholders})"
-        cursor = conn.executemany(sql, [tuple(r[c] for c in cols) for r in rows])
+        inserted = _execute_batches(conn, sql, cols, rows)
         conn.commit()
-        return int(cursor.rowcount or 0) if isinstance(cursor.rowcount, int) else 0
-    finally:
-        conn.close()
+        return inserted
+
+
+def _copy_upsert(
+    conn: DBConnection,
+    table: str,
+    cols: list[str],
+    rows: list[dict],
+    conflict_cols: list[str],
+    update_str: str,
+) -> int:
+    """
+    Postgres bulk upsert: COPY rows into a temp table, then one
+    INSERT ... SELECT ... ON CONFLICT into the target.
+
+    A single statement may not touch the same conflict key twice, so rows
+    are de-duplicated first with the last one winning, as sequential
+    executemany upserts would. Keys containing NULL never conflict and are
+    kept as-is.
+    """
+    key_of = _row_params(conflict_cols)
+    deduped: dict[Any, dict] = {}
+    for row in rows:
+        key = key_of(row)
+        deduped[key if None not in key else id(row)] = row
+
+    col_str = ", ".join(cols)
+    staging = f"_upsert_{table}"
+    to_params = _row_params(cols)
+    with conn.raw.cursor() as cur:
+        cur.execute(
+            f"CREATE TEMP TABLE {staging} ON COMMIT DROP AS "
+            f"SELECT {col_str} FROM {table} WITH NO DATA"
+        )
+        with cur.copy(f"COPY {staging} ({col_str}) FROM STDIN") as copy:
+            for row in deduped.values():
+                copy.write_row(to_params(row))
+        cur.execute(
+            f"INSERT INTO {table} ({col_str}) SELECT {col_str} FROM {staging} "
+            f"ON CONFLICT({', '.join(conflict_cols)}) DO UPDATE SET {update_str}"
+        )
+        return max(0, cur.rowcount)
 
 
 def upsert_many(table: str, rows: list[dict], conflict_cols: list[str]) -> int:
@@ -265,32 +445,28 @@ def upsert_many(table: str, rows: list[dict], conflict_cols: list[str]) -> int:
         f"ON CONFLICT({conflict_str}) DO UPDATE SET {update_str}"
     )
 
-    conn = get_connection()
-    try:
-        if conn.backend == "postgres":
-            updated = 0
-            for row in rows:
-                cursor = conn.execute(sql, tuple(row[c] for c in cols))
-                if isinstance(cursor.rowcount, int) and cursor.rowcount > 0:
-                    updated += int(cursor.rowcount)
-            conn.commit()
-            return updated
-
-        cursor = conn.executemany(sql, [tuple(r[c] for c in cols) for r in rows])
+    with _borrow_connection() as conn:
+        if conn.backend == "postgres" and len(rows) >= COPY_UPSERT_MIN_ROWS:
+            updated = _copy_upsert(conn, table, cols, rows, conflict_cols, update_str)
+        else:
+            updated = _execute_batches(conn, sql, cols, rows)
         conn.commit()
-        return int(cursor.rowcount or 0) if isinstance(cursor.rowcount, int) else 0
-    finally:
-        conn.close()
+        return updated
 
 
 def _rows_to_dicts(cursor_rows: list[Any], cursor: Any) -> list[dict]:
+    """
+    Normalize fetched rows to plain dicts.
+
+    psycopg's dict_row already yields fresh dicts, so those are returned
+    as-is; tuple-like rows (sqlite3.Row etc.) are zipped against column
+    names read once from cursor.description.
+    """
     if not cursor_rows:
         return []
     first = cursor_rows[0]
     if isinstance(first, dict):
-        return [dict(r) for r in cursor_rows]
-    if isinstance(first, sqlite3.Row):
-        return [dict(r) for r in cursor_rows]
+        return cursor_rows
     if hasattr(cursor, "description") and cursor.description:
         cols = [d[0] for d in cursor.description]
         return [dict(zip(cols, row)) for row in cursor_rows]
@@ -299,11 +475,35 @@ def _rows_to_dicts(cursor_rows: list[Any], cursor: Any) -> list[dict]:
 
 def query(sql: str, params: tuple = ()) -> list[dict]:
     """Run a query and return results as list of dicts."""
-    conn = get_connection()
-    try:
+    with _borrow_connection() as conn:
         cursor = conn.execute(sql, params)
         rows = cursor.fetchall()
         return _rows_to_dicts(rows, cursor)
+
+
+QUERY_ITER_BATCH_SIZE = 200
+
+
+def query_iter(sql: str, params: tuple = (), batch_size: int = QUERY_ITER_BATCH_SIZE) -> Iterator[dict]:
+    """
+    Run a query and yield rows as dicts without materializing the result.
+
+    Postgres uses a server-side (named) cursor that pulls batch_size rows
+    per round trip; sqlite iterates its cursor directly. The connection
+    stays open until the generator is exhausted or closed.
+    """
+    conn = get_connection()
+    try:
+        if conn.backend == "postgres":
+            cursor = conn.raw.cursor(name="query_iter")
+            cursor.itersize = batch_size
+            cursor.execute(_adapt_paramstyle(sql, conn.backend), tuple(params))
+            yield from cursor
+        else:
+            cursor = conn.execute(sql, params)
+            cols = [d[0] for d in cursor.description or ()]
+            for row in cursor:
+                yield dict(zip(cols, row))
     finally:
         conn.close()
 
@@ -322,8 +522,7 @@ def create_score_run(
     metadata: dict | None = None,
 ) -> int:
     """Create and return a score_runs audit row id."""
-    conn = get_connection()
-    try:
+    with _borrow_connection() as conn:
         if conn.backend == "postgres":
             cursor = conn.execute(
                 """
@@ -352,8 +551,6 @@ def create_score_run(
         )
         conn.commit()
         return int(cursor.lastrowid)
-    finally:
-        conn.close()
 
 
 def complete_score_run(
@@ -363,8 +560,7 @@ def complete_score_run(
     metadata: dict | None = None,
 ) -> None:
     """Mark a score_runs row complete and update summary fields."""
-    conn = get_connection()
-    try:
+    with _borrow_connection() as conn:
         if metadata is None:
             conn.execute(
                 """
@@ -391,8 +587,6 @@ def complete_score_run(
                 (status, rows_scored, _serialize_metadata(metadata), score_run_id),
             )
         conn.commit()
-    finally:
-        conn.close()
 
 
 def fail_score_run(
@@ -412,9 +606,30 @@ def fail_score_run(
     )
 
 
+def _existing_tables(conn: DBConnection, tables: list[str]) -> set[str]:
+    """The subset of tables that exist, from one catalog lookup."""
+    if conn.backend == "postgres":
+        cursor = conn.execute(
+            "SELECT t AS name FROM unnest(?::text[]) AS t WHERE to_regclass(t) IS NOT NULL",
+            (tables,),
+        )
+    else:
+        placeholders = ", ".join(["?"] * len(tables))
+        cursor = conn.execute(
+            f"SELECT name FROM sqlite_master WHERE type = 'table' AND name IN ({placeholders})",
+            tuple(tables),
+        )
+    return {str(row["name"] if isinstance(row, dict) else row[0]) for row in cursor.fetchall()}
+
+
 def get_status() -> dict:
-    """Get row counts for core tables."""
-    conn = get_connection()
+    """
+    Get row counts for core tables.
+
+    One connection, two statements: a catalog lookup for which tables
+    exist, then every count as a scalar subquery of a single SELECT (a
+    missing table would otherwise abort the whole statement).
+    """
     tables = [
         "mlb_stadiums",
         "mlb_park_factors",
@@ -438,18 +653,15 @@ def get_status() -> dict:
         "mlb_closing_lines",
         "mlb_score_runs",
     ]
-    status = {}
+    conn = get_connection()
     try:
-        for table in tables:
-            try:
-                cursor = conn.execute(f"SELECT COUNT(*) AS count_value FROM {table}")
-                row = cursor.fetchone()
-                if isinstance(row, dict):
-                    status[table] = int(row["count_value"])
-                else:
-                    status[table] = int(row[0])
-            except Exception:
-                status[table] = "TABLE MISSING"
-        return status
+        existing = _existing_tables(conn, tables)
+        counts: dict[str, int] = {}
+        present = [t for t in tables if t in existing]
+        if present:
+            sql = "SELECT " + ", ".join(f"(SELECT COUNT(*) FROM {t}) AS {t}" for t in present)
+            cursor = conn.execute(sql)
+            counts = _rows_to_dicts(cursor.fetchall(), cursor)[0]
+        return {t: int(counts[t]) if t in counts else "TABLE MISSING" for t in tables}
     finally:
         conn.close()
@@ -0,0 +1,32 @@
+-- Migration 008: Daily score-band rollup for /api/mlb/performance/summary
+-- One row per (game_date, market, band) over graded model scores, so the
+-- summary endpoint sums ~days x markets x 4 rows instead of scanning every
+-- graded score in the period. Refreshed by mlb-scoring-engine at end of day
+-- (main_scoring.job_refresh_perf_bands).
+--
+-- Run via: python db/migrate.py  (idempotent — safe to re-run)
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mlb_perf_daily_bands AS
+SELECT
+    game_date,
+    market,
+    CASE
+        WHEN model_score >= 80 THEN '80+'
+        WHEN model_score >= 70 THEN '70-79'
+        WHEN model_score >= 60 THEN '60-69'
+        ELSE '<60'
+    END AS band,
+    COUNT(*) AS total,
+    SUM(CASE WHEN result = 'win' THEN 1 ELSE 0 END) AS wins,
+    SUM(model_score) AS sum_score,
+    SUM(edge) AS sum_edge,
+    COUNT(edge) AS n_edge
+FROM mlb_model_scores
+WHERE result IS NOT NULL
+  AND result != 'pending'
+  AND result != 'void'
+GROUP BY game_date, market, band;
+
+-- Unique index lets the view be refreshed CONCURRENTLY (no read lock).
+CREATE UNIQUE INDEX IF NOT EXISTS idx_mlb_perf_daily_bands_key
+    ON mlb_perf_daily_bands(game_date, market, band);
@@ -0,0 +1,27 @@
+-- Migration 009: Date indexes for backfill stage existence checks
+-- backfill_historical decides which stages to skip with per-date
+-- "SELECT 1 ... LIMIT 1" probes and one ranged _populated_dates scan per
+-- stage. schema.sql already declares the date indexes, but databases
+-- built from migrations alone never received them, so each probe was a
+-- sequential scan. Names match schema.sql so this is a no-op there.
+-- The team lookup indexes serve team_features'
+--   WHERE team = ? AND window_days ... AND stat_date < ?
+--
+-- Run via: python db/migrate.py  (idempotent — safe to re-run)
+
+CREATE INDEX IF NOT EXISTS idx_mlb_games_date ON mlb_games(game_date);
+CREATE INDEX IF NOT EXISTS idx_mlb_batter_stats_date ON mlb_batter_stats(stat_date);
+CREATE INDEX IF NOT EXISTS idx_mlb_pitcher_stats_date ON mlb_pitcher_stats(stat_date);
+CREATE INDEX IF NOT EXISTS idx_mlb_batter_daily_features_game_date
+ON mlb_batter_daily_features(game_date);
+CREATE INDEX IF NOT EXISTS idx_mlb_market_outcomes_date_market
+ON mlb_market_outcomes(game_date, market);
+
+-- The scores check filters on COALESCE(is_active, 1) = 1 for the date.
+CREATE INDEX IF NOT EXISTS idx_mlb_model_scores_date_active
+ON mlb_model_scores(game_date, is_active);
+
+CREATE INDEX IF NOT EXISTS idx_mlb_batter_stats_team_window_date
+ON mlb_batter_stats(team, window_days, stat_date);
+CREATE INDEX IF NOT EXISTS idx_mlb_pitcher_stats_team_window_date
+ON mlb_pitcher_stats(team, window_days, stat_date);
@@ -0,0 +1,16 @@
+-- Shared-schema index: keyset pagination for /api/mlb/picks/my
+-- The endpoint pages a user's picks newest-first with
+--   WHERE user_id = ? AND sport = 'MLB' AND (saved_at, id) < (?, ?)
+-- Covering prediction_id lets Postgres walk the index without heap lookups
+-- before joining mlb_model_scores.
+--
+-- user_saved_picks is owned by the SportsBetting project (see
+-- migration_manifest.md §9e), so this is NOT an MLB migration: db/migrate.py
+-- would fail on any database without that table and block later migrations.
+-- Apply manually against the shared Supabase schema:
+--   psql "$SUPABASE_DB_URL" -f db/shared/user_saved_picks_keyset_index.sql
+-- (idempotent — safe to re-run)
+
+CREATE INDEX IF NOT EXISTS idx_user_saved_picks_user_sport_saved
+    ON user_saved_picks (user_id, sport, saved_at DESC, id DESC)
+    INCLUDE (prediction_id);
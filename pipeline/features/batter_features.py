@@ -15,9 +15,6 @@ from typing import Any
 from db.database import query, upsert_many
 
 
-MAX_BATCH_SIZE = 500
-
-
 def _to_date(game_date: date | str) -> date:
     if isinstance(game_date, date):
         return game_date
@@ -30,11 +27,6 @@ def _safe_div(numerator: float | int | None, denominator: float | int | None) ->
     return float(numerator) / float(denominator)
 
 
-def _chunked(rows: list[dict[str, Any]], size: int = MAX_BATCH_SIZE):
-    for idx in range(0, len(rows), size):
-        yield rows[idx : idx + size]
-
-
 def _as_of_bounds(game_dt: date, seasons_back: int) -> tuple[str, str]:
     upper = game_dt.strftime("%Y-%m-%d")
     lower = (game_dt - timedelta(days=seasons_back * 366)).strftime("%Y-%m-%d")
@@ -107,25 +99,38 @@ def _query_recent_team_batters(game_dt: date, seasons_back: int) -> dict[int, st
     return {int(r["player_id"]): r.get("team") for r in rows}
 
 
-def _query_recent_lineup_slot(player_id: int, game_dt: date) -> int | None:
-    """Get the player's most common batting order position from recent lineups."""
+def _query_recent_lineup_slots(player_ids: list[int], game_dt: date) -> dict[int, int]:
+    """
+    Each player's most common batting order position from prior lineups.
+
+    One grouped query for the whole pool; ties go to the later slot, as
+    the per-player ``ORDER BY cnt DESC LIMIT 1`` lookup returned them.
+    """
+    if not player_ids:
+        return {}
+
+    placeholders = ", ".join(["?"] * len(player_ids))
     rows = query(
-        """
-        SELECT batting_order, COUNT(*) as cnt
+        f"""
+        SELECT player_id, batting_order, COUNT(*) AS cnt
         FROM mlb_lineups
-        WHERE player_id = ?
+        WHERE player_id IN ({placeholders})
           AND game_date < ?
           AND batting_order IS NOT NULL
           AND COALESCE(active_version, 1) = 1
-        GROUP BY batting_order
-        ORDER BY cnt DESC
-        LIMIT 1
+        GROUP BY player_id, batting_order
         """,
-        (player_id, game_dt.strftime("%Y-%m-%d")),
+        (*player_ids, game_dt.strftime("%Y-%m-%d")),
     )
-    if rows and rows[0].get("batting_order") is not None:
-        return int(rows[0]["batting_order"])
-    return None
+    best: dict[int, tuple[int, int]] = {}
+    for row in rows:
+        player_id = int(row["player_id"])
+        slot = int(row["batting_order"])
+        cnt = int(row["cnt"])
+        current = best.get(player_id)
+        if current is None or cnt > current[1] or (cnt == current[1] and slot > current[0]):
+            best[player_id] = (slot, cnt)
+    return {player_id: slot for player_id, (slot, _) in best.items()}
 
 
 def _relevant_batter_pool(game_dt: date, seasons_back: int) -> tuple[dict[int, str | None], dict[str, int]]:
@@ -161,26 +166,29 @@ def _query_latest_windows(
 
     lower, upper = _as_of_bounds(game_dt, seasons_back)
     placeholders = ", ".join(["?"] * len(player_ids))
+    # Rank inside the database and return only each (player, window)'s most
+    # recent row, instead of shipping seasons of daily rows to keep one.
     sql = f"""
         SELECT *
-        FROM mlb_batter_stats
-        WHERE stat_date >= ?
-          AND stat_date < ?
-          AND window_days IN (7, 14, 30)
-          AND player_id IN ({placeholders})
-        ORDER BY player_id, window_days, stat_date DESC
+        FROM (
+            SELECT s.*,
+                   ROW_NUMBER() OVER (
+                       PARTITION BY player_id, window_days ORDER BY stat_date DESC
+                   ) AS recency
+            FROM mlb_batter_stats s
+            WHERE stat_date >= ?
+              AND stat_date < ?
+              AND window_days IN (7, 14, 30)
+              AND player_id IN ({placeholders})
+        ) ranked
+        WHERE recency = 1
     """
     params = [lower, upper, *player_ids]
     rows = query(sql, tuple(params))
 
     latest: dict[int, dict[int, dict[str, Any]]] = {}
     for row in rows:
-        pid = int(row["player_id"])
-        window = int(row["window_days"])
-        if pid not in latest:
-            latest[pid] = {}
-        if window not in latest[pid]:
-            latest[pid][window] = row
+        latest.setdefault(int(row["player_id"]), {})[int(row["window_days"])] = row
     return latest
 
 
@@ -207,10 +215,11 @@ def _to_float_or_none(value: Any) -> float | None:
 
 
 def _build_row(
-    game_dt: date,
+    game_date_str: str,
     player_id: int,
     team_hint: str | None,
     window_rows: dict[int, dict[str, Any]],
+    lineup_slot: int | None = None,
 ) -> dict[str, Any]:
     row7 = window_rows.get(7, {})
     row14 = window_rows.get(14, {})
@@ -257,7 +266,7 @@ def _build_row(
     k_vs_rhp = _to_float_or_none(row30.get("k_pct")) or _to_float_or_none(row14.get("k_pct"))
 
     return {
-        "game_date": game_dt.strftime("%Y-%m-%d"),
+        "game_date": game_date_str,
         "player_id": player_id,
         "team_id": row_team,
         "bats": row_bats,
@@ -339,7 +348,7 @@ def _build_row(
             if hit_rate_7 is not None and hit_rate_30 is not None
             else None
         ),
-        "recent_lineup_slot": _query_recent_lineup_slot(player_id, game_dt),
+        "recent_lineup_slot": lineup_slot,
     }
 
 
@@ -348,13 +357,14 @@ def build_batter_daily_features(game_date: date | str, seasons_back: int = 3) ->
     Build batter_daily_features snapshot for one game date.
     """
     game_dt = _to_date(game_date)
+    game_date_str = game_dt.strftime("%Y-%m-%d")
     print(f"\n🔧 Building batter_daily_features for {game_dt} (as_of < {game_dt})")
 
     player_pool, source_counts = _relevant_batter_pool(game_dt, seasons_back=seasons_back)
     if not player_pool:
         print("  ⚠️ No relevant batters found from lineups/odds/recent teams")
         return {
-            "game_date": game_dt.strftime("%Y-%m-%d"),
+            "game_date": game_date_str,
             "rows_upserted": 0,
             "pool_counts": source_counts,
             "warnings": ["No relevant batter pool for date"],
@@ -370,6 +380,7 @@ def build_batter_daily_features(game_date: date | str, seasons_back: int = 3) ->
     )
 
     latest_windows = _query_latest_windows(player_ids, game_dt=game_dt, seasons_back=seasons_back)
+    lineup_slots = _query_recent_lineup_slots(sorted(latest_windows), game_dt)
     rows: list[dict[str, Any]] = []
     missing_window_rows = 0
 
@@ -378,23 +389,23 @@ def build_batter_daily_features(game_date: date | str, seasons_back: int = 3) ->
         if not window_rows:
             missing_window_rows += 1
             continue
-        rows.append(_build_row(game_dt, player_id, player_pool.get(player_id), window_rows))
+        rows.append(
+            _build_row(game_date_str, player_id, player_pool.get(player_id), window_rows, lineup_slots.get(player_id))
+        )
 
     if not rows:
         return {
-            "game_date": game_dt.strftime("%Y-%m-%d"),
+            "game_date": game_date_str,
             "rows_upserted": 0,
             "pool_counts": source_counts,
             "warnings": ["No batter feature rows generated from available historical data"],
         }
 
-    upserted = 0
-    for batch in _chunked(rows, size=MAX_BATCH_SIZE):
-        upserted += upsert_many(
-            "mlb_batter_daily_features",
-            batch,
-            conflict_cols=["game_date", "player_id"],
-        )
+    upserted = upsert_many(
+        "mlb_batter_daily_features",
+        rows,
+        conflict_cols=["game_date", "player_id"],
+    )
 
     print(
         "  ✅ Batter features built: "
@@ -406,7 +417,7 @@ def build_batter_daily_features(game_date: date | str, seasons_back: int = 3) ->
         warnings.append(f"{missing_window_rows} player(s) had no prior batter_stats rows before date")
 
     return {
-        "game_date": game_dt.strftime("%Y-%m-%d"),
+        "game_date": game_date_str,
         "rows_generated": len(rows),
         "rows_upserted": upserted,
         "missing_source_players": missing_window_rows,
@@ -9,12 +9,13 @@ Phase 2D goals:
 from __future__ import annotations
 
 from datetime import date, datetime
+import re
 from typing import Any
 
 from db.database import query, upsert_many
 
 
-MAX_BATCH_SIZE = 500
+_CLOCK_RE = re.compile(r"(\d{1,2}):(\d{2})")
 
 
 def _to_date(game_date: date | str) -> date:
@@ -23,11 +24,6 @@ def _to_date(game_date: date | str) -> date:
     return datetime.strptime(game_date, "%Y-%m-%d").date()
 
 
-def _chunked(rows: list[dict[str, Any]], size: int = MAX_BATCH_SIZE):
-    for idx in range(0, len(rows), size):
-        yield rows[idx : idx + size]
-
-
 def _to_float(value: Any) -> float | None:
     if value is None:
         return None
@@ -77,8 +73,7 @@ def _classify_day_night(game_time: str | None) -> tuple[int | None, str | None]:
 
     # Fallback: try to extract hour from string like "19:10" or "1:05 PM"
     if hour is None:
-        import re
-        match = re.search(r"(\d{1,2}):(\d{2})", raw)
+        match = _CLOCK_RE.search(raw)
         if match:
             h = int(match.group(1))
             if "PM" in raw.upper() and h != 12:
@@ -94,85 +89,98 @@ def _classify_day_night(game_time: str | None) -> tuple[int | None, str | None]:
     return is_day, game_time_et
 
 
-def _latest_weather(game_id: int) -> dict[str, Any] | None:
+def _latest_weather_by_game(game_ids: list[int]) -> dict[int, dict[str, Any]]:
+    """Most recent weather fetch per game, for all games in one query."""
+    if not game_ids:
+        return {}
+    placeholders = ", ".join(["?"] * len(game_ids))
     rows = query(
-        """
+        f"""
         SELECT *
-        FROM mlb_weather
-        WHERE game_id = ?
-        ORDER BY fetch_time DESC
-        LIMIT 1
+        FROM (
+            SELECT w.*,
+                   ROW_NUMBER() OVER (PARTITION BY game_id ORDER BY fetch_time DESC) AS recency
+            FROM mlb_weather w
+            WHERE game_id IN ({placeholders})
+        ) ranked
+        WHERE recency = 1
         """,
-        (game_id,),
+        tuple(game_ids),
     )
-    return rows[0] if rows else None
-
+    latest: dict[int, dict[str, Any]] = {}
+    for row in rows:
+        row.pop("recency", None)
+        latest[int(row["game_id"])] = row
+    return latest
 
-def _park_factors(stadium_id: int | None, season: int) -> tuple[float | None, float | None, float | None]:
-    if not stadium_id:
-        return None, None, None
 
-    season_rows = query(
-        """
-        SELECT hr_factor
-        FROM mlb_park_factors
-        WHERE stadium_id = ? AND season = ?
-        LIMIT 1
-        """,
-        (stadium_id, season),
-    )
-    if season_rows and season_rows[0].get("hr_factor") is not None:
-        hr = float(season_rows[0]["hr_factor"])
-        return hr, None, None
-
-    fallback_rows = query(
-        """
-        SELECT hr_park_factor
+def _park_factors_by_stadium(stadium_ids: list[int], season: int) -> dict[int, float]:
+    """
+    HR park factor per stadium: the season's mlb_park_factors row, falling
+    back to the static mlb_stadiums factor.
+    """
+    if not stadium_ids:
+        return {}
+    placeholders = ", ".join(["?"] * len(stadium_ids))
+
+    factors: dict[int, float] = {}
+    for row in query(
+        f"""
+        SELECT stadium_id, hr_park_factor
         FROM mlb_stadiums
-        WHERE stadium_id = ?
-        LIMIT 1
+        WHERE stadium_id IN ({placeholders})
         """,
-        (stadium_id,),
-    )
-    if fallback_rows and fallback_rows[0].get("hr_park_factor") is not None:
-        hr = float(fallback_rows[0]["hr_park_factor"])
-        return hr, None, None
-
-    return None, None, None
+        tuple(stadium_ids),
+    ):
+        if row.get("hr_park_factor") is not None:
+            factors[int(row["stadium_id"])] = float(row["hr_park_factor"])
+
+    for row in query(
+        f"""
+        SELECT stadium_id, hr_factor
+        FROM mlb_park_factors
+        WHERE season = ? AND stadium_id IN ({placeholders})
+        """,
+        (season, *stadium_ids),
+    ):
+        if row.get("hr_factor") is not None:
+            factors[int(row["stadium_id"])] = float(row["hr_factor"])
+    return factors
 
 
-def _lineup_confirmed(game_dt: date, game_id: int, team_id: str) -> bool:
+def _confirmed_lineup_teams(game_dt: date) -> set[tuple[int, str]]:
+    """(game_id, team_id) pairs with a confirmed active lineup on the date."""
     rows = query(
         """
-        SELECT 1
+        SELECT DISTINCT game_id, team_id
         FROM mlb_lineups
         WHERE game_date = ?
-          AND game_id = ?
-          AND team_id = ?
           AND confirmed = 1
           AND COALESCE(active_version, 1) = 1
-        LIMIT 1
         """,
-        (game_dt.strftime("%Y-%m-%d"), game_id, team_id),
+        (game_dt.strftime("%Y-%m-%d"),),
     )
-    return bool(rows)
+    return {(int(r["game_id"]), str(r["team_id"])) for r in rows}
 
 
-def _umpire_context(umpire_name: str | None, season: int) -> tuple[float | None, float | None]:
-    if not umpire_name:
-        return None, None
+def _umpire_context_by_name(
+    umpire_names: list[str], season: int
+) -> dict[str, tuple[float | None, float | None]]:
+    if not umpire_names:
+        return {}
+    placeholders = ", ".join(["?"] * len(umpire_names))
     rows = query(
-        """
-        SELECT k_pct_above_avg, avg_runs_per_game
+        f"""
+        SELECT umpire_name, k_pct_above_avg, avg_runs_per_game
         FROM mlb_umpires
-        WHERE umpire_name = ? AND season = ?
-        LIMIT 1
+        WHERE season = ? AND umpire_name IN ({placeholders})
         """,
-        (umpire_name, season),
+        (season, *umpire_names),
     )
-    if not rows:
-        return None, None
-    return _to_float(rows[0].get("k_pct_above_avg")), _to_float(rows[0].get("avg_runs_per_game"))
+    return {
+        str(r["umpire_name"]): (_to_float(r.get("k_pct_above_avg")), _to_float(r.get("avg_runs_per_game")))
+        for r in rows
+    }
 
 
 def _weather_multipliers(weather_row: dict[str, Any] | None) -> tuple[float | None, float | None, str | None]:
@@ -207,6 +215,7 @@ def build_game_context_features(game_date: date | str) -> dict[str, Any]:
     Build game_context_features rows for all games on one date.
     """
     game_dt = _to_date(game_date)
+    game_date_str = game_dt.strftime("%Y-%m-%d")
     season = game_dt.year
     print(f"\n🔧 Building game_context_features for {game_dt}")
 
@@ -214,11 +223,21 @@ def build_game_context_features(game_date: date | str) -> dict[str, Any]:
     if not games:
         print("  ⚠️ No games found for date")
         return {
-            "game_date": game_dt.strftime("%Y-%m-%d"),
+            "game_date": game_date_str,
             "rows_upserted": 0,
             "warnings": ["No games found for date"],
         }
 
+    # Per-game context is fetched for the whole slate up front
+    weather_by_game = _latest_weather_by_game([int(g["game_id"]) for g in games])
+    park_hr_by_stadium = _park_factors_by_stadium(
+        sorted({int(g["stadium_id"]) for g in games if g.get("stadium_id")}), season=season
+    )
+    umpire_by_name = _umpire_context_by_name(
+        sorted({str(g["umpire_name"]) for g in games if g.get("umpire_name")}), season=season
+    )
+    confirmed_lineups = _confirmed_lineup_teams(game_dt)
+
     rows: list[dict[str, Any]] = []
     warnings: list[str] = []
     for game in games:
@@ -230,17 +249,21 @@ def build_game_context_features(game_date: date | str) -> dict[str, Any]:
         umpire_name = game.get("umpire_name")
         game_time = game.get("game_time")
 
-        park_hr, park_runs, park_hits = _park_factors(game.get("stadium_id"), season=season)
-        weather_row = _latest_weather(game_id)
+        stadium_id = game.get("stadium_id")
+        park_hr = park_hr_by_stadium.get(int(stadium_id)) if stadium_id else None
+        park_runs, park_hits = None, None
+        weather_row = weather_by_game.get(game_id)
         weather_hr_mult, weather_run_mult, wind_dir = _weather_multipliers(weather_row)
 
         temp_f = _to_float(weather_row.get("temperature_f")) if weather_row else None
         wind_speed_mph = _to_float(weather_row.get("wind_speed_mph")) if weather_row else None
 
-        umpire_k_boost, umpire_run_env = _umpire_context(umpire_name, season=season)
+        umpire_k_boost, umpire_run_env = (
+            umpire_by_name.get(str(umpire_name), (None, None)) if umpire_name else (None, None)
+        )
 
-        lineups_confirmed_home = _lineup_confirmed(game_dt, game_id, home_team_id)
-        lineups_confirmed_away = _lineup_confirmed(game_dt, game_id, away_team_id)
+        lineups_confirmed_home = (game_id, home_team_id) in confirmed_lineups
+        lineups_confirmed_away = (game_id, away_team_id) in confirmed_lineups
 
         # Day/night classification from game start time
         is_day_game, game_time_et = _classify_day_night(game_time)
@@ -263,7 +286,7 @@ def build_game_context_features(game_date: date | str) -> dict[str, Any]:
 
         rows.append(
             {
-                "game_date": game_dt.strftime("%Y-%m-%d"),
+                "game_date": game_date_str,
                 "game_id": game_id,
                 "home_team_id": home_team_id,
                 "away_team_id": away_team_id,
@@ -288,20 +311,18 @@ def build_game_context_features(game_date: date | str) -> dict[str, Any]:
             }
         )
 
-    upserted = 0
-    for batch in _chunked(rows, size=MAX_BATCH_SIZE):
-        upserted += upsert_many(
-            "mlb_game_context_features",
-            batch,
-            conflict_cols=["game_date", "game_id"],
-        )
+    upserted = upsert_many(
+        "mlb_game_context_features",
+        rows,
+        conflict_cols=["game_date", "game_id"],
+    )
 
     print(
         "  ✅ Game context features built: "
         f"generated={len(rows)}, upserted={upserted}, warnings={len(warnings)}"
     )
     return {
-        "game_date": game_dt.strftime("%Y-%m-%d"),
+        "game_date": game_date_str,
         "rows_generated": len(rows),
         "rows_upserted": upserted,
         "warnings": warnings,
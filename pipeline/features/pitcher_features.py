@@ -14,20 +14,12 @@ from typing import Any
 from db.database import query, upsert_many
 
 
-MAX_BATCH_SIZE = 500
-
-
 def _to_date(game_date: date | str) -> date:
     if isinstance(game_date, date):
         return game_date
     return datetime.strptime(game_date, "%Y-%m-%d").date()
 
 
-def _chunked(rows: list[dict[str, Any]], size: int = MAX_BATCH_SIZE):
-    for idx in range(0, len(rows), size):
-        yield rows[idx : idx + size]
-
-
 def _to_float(value: Any) -> float | None:
     if value is None:
         return None
@@ -68,25 +60,27 @@ def _latest_pitcher_windows(
         return {}
 
     placeholders = ", ".join(["?"] * len(pitcher_ids))
+    # Only each (pitcher, window)'s most recent row leaves the database.
     sql = f"""
         SELECT *
-        FROM mlb_pitcher_stats
-        WHERE stat_date < ?
-          AND window_days IN (14, 30)
-          AND player_id IN ({placeholders})
-        ORDER BY player_id, window_days, stat_date DESC
+        FROM (
+            SELECT s.*,
+                   ROW_NUMBER() OVER (
+                       PARTITION BY player_id, window_days ORDER BY stat_date DESC
+                   ) AS recency
+            FROM mlb_pitcher_stats s
+            WHERE stat_date < ?
+              AND window_days IN (14, 30)
+              AND player_id IN ({placeholders})
+        ) ranked
+        WHERE recency = 1
     """
     params = [game_dt.strftime("%Y-%m-%d"), *pitcher_ids]
     rows = query(sql, tuple(params))
 
     latest: dict[int, dict[int, dict[str, Any]]] = {}
     for row in rows:
-        pitcher_id = int(row["player_id"])
-        window = int(row["window_days"])
-        if pitcher_id not in latest:
-            latest[pitcher_id] = {}
-        if window not in latest[pitcher_id]:
-            latest[pitcher_id][window] = row
+        latest.setdefault(int(row["player_id"]), {})[int(row["window_days"])] = row
     return latest
 
 
@@ -176,7 +170,7 @@ def _starter_role_confidence(row14: dict[str, Any], row30: dict[str, Any]) -> fl
 
 
 def _build_pitcher_row(
-    game_dt: date,
+    game_date_str: str,
     pitcher_id: int,
     team_context: dict[str, Any],
     window_rows: dict[int, dict[str, Any]],
@@ -190,7 +184,7 @@ def _build_pitcher_row(
     tto_k_decay, tto_hr_inc, tto_endurance = _tto_metrics(row14 or None, row30 or None)
 
     return {
-        "game_date": game_dt.strftime("%Y-%m-%d"),
+        "game_date": game_date_str,
         "pitcher_id": pitcher_id,
         "team_id": team_id,
         "throws": throws,
@@ -243,13 +237,14 @@ def build_pitcher_daily_features(game_date: date | str) -> dict[str, Any]:
     Build pitcher_daily_features snapshot for probable starters on a date.
     """
     game_dt = _to_date(game_date)
+    game_date_str = game_dt.strftime("%Y-%m-%d")
     print(f"\n🔧 Building pitcher_daily_features for {game_dt} (as_of < {game_dt})")
 
     starters = _probable_starters(game_dt)
     if not starters:
         print("  ⚠️ No probable starters found in games table")
         return {
-            "game_date": game_dt.strftime("%Y-%m-%d"),
+            "game_date": game_date_str,
             "rows_upserted": 0,
             "warnings": ["No probable starters found for date"],
         }
@@ -267,22 +262,20 @@ def build_pitcher_daily_features(game_date: date | str) -> dict[str, Any]:
             continue
         if 14 not in window_rows or 30 not in window_rows:
             partial_rows += 1
-        rows.append(_build_pitcher_row(game_dt, pitcher_id, starters[pitcher_id], window_rows))
+        rows.append(_build_pitcher_row(game_date_str, pitcher_id, starters[pitcher_id], window_rows))
 
     if not rows:
         return {
-            "game_date": game_dt.strftime("%Y-%m-%d"),
+            "game_date": game_date_str,
             "rows_upserted": 0,
             "warnings": ["No pitcher rows built due to missing historical pitcher_stats"],
         }
 
-    upserted = 0
-    for batch in _chunked(rows, size=MAX_BATCH_SIZE):
-        upserted += upsert_many(
-            "mlb_pitcher_daily_features",
-            batch,
-            conflict_cols=["game_date", "pitcher_id"],
-        )
+    upserted = upsert_many(
+        "mlb_pitcher_daily_features",
+        rows,
+        conflict_cols=["game_date", "pitcher_id"],
+    )
 
     print(
         "  ✅ Pitcher features built: "
@@ -296,7 +289,7 @@ def build_pitcher_daily_features(game_date: date | str) -> dict[str, Any]:
         warnings.append(f"{partial_rows} row(s) missing 14d or 30d window and were stored as partial")
 
     return {
-        "game_date": game_dt.strftime("%Y-%m-%d"),
+        "game_date": game_date_str,
         "rows_generated": len(rows),
         "rows_upserted": upserted,
         "partial_rows": partial_rows,
@@ -8,13 +8,14 @@ Phase 2C goals:
 """
 from __future__ import annotations
 
+from bisect import bisect_left
 from datetime import date, datetime, timedelta
 from typing import Any
 
 from db.database import query, upsert_many
 
 
-MAX_BATCH_SIZE = 500
+RUNS_WINDOWS = (14, 30)
 
 
 def _to_date(game_date: date | str) -> date:
@@ -23,11 +24,6 @@ def _to_date(game_date: date | str) -> date:
     return datetime.strptime(game_date, "%Y-%m-%d").date()
 
 
-def _chunked(rows: list[dict[str, Any]], size: int = MAX_BATCH_SIZE):
-    for idx in range(0, len(rows), size):
-        yield rows[idx : idx + size]
-
-
 def _to_float(value: Any) -> float | None:
     if value is None:
         return None
@@ -57,51 +53,72 @@ def _teams_on_date(game_dt: date) -> dict[str, str | None]:
     return mapping
 
 
-def _latest_batter_rows(team_id: str, game_dt: date, window: int) -> list[dict[str, Any]]:
+def _latest_batter_rows(team_id: str, game_dt: date, windows: tuple[int, ...]) -> dict[int, list[dict[str, Any]]]:
+    """Latest batter_stats row per player for each window, in one scan."""
+    placeholders = ", ".join(["?"] * len(windows))
     rows = query(
-        """
+        f"""
         SELECT *
-        FROM mlb_batter_stats
-        WHERE team = ?
-          AND window_days = ?
-          AND stat_date < ?
-        ORDER BY player_id, stat_date DESC
+        FROM (
+            SELECT s.*,
+                   ROW_NUMBER() OVER (
+                       PARTITION BY player_id, window_days ORDER BY stat_date DESC
+                   ) AS recency
+            FROM mlb_batter_stats s
+            WHERE team = ?
+              AND window_days IN ({placeholders})
+              AND stat_date < ?
+        ) ranked
+        WHERE recency = 1
+        ORDER BY window_days, player_id
         """,
-        (team_id, window, game_dt.strftime("%Y-%m-%d")),
+        (team_id, *windows, game_dt.strftime("%Y-%m-%d")),
     )
-    latest_by_player: dict[int, dict[str, Any]] = {}
+    by_window: dict[int, list[dict[str, Any]]] = {window: [] for window in windows}
     for row in rows:
-        player_id = int(row["player_id"])
-        if player_id not in latest_by_player:
-            latest_by_player[player_id] = row
-    return list(latest_by_player.values())
+        by_window[int(row["window_days"])].append(row)
+    return by_window
 
 
-def _runs_per_game(team_id: str, game_dt: date, window_days: int) -> float | None:
-    start = (game_dt - timedelta(days=window_days)).strftime("%Y-%m-%d")
+def _team_run_logs(game_dt: date) -> dict[str, tuple[list[str], list[float]]]:
+    """
+    Final-game runs scored per team over the longest runs window before the
+    date, as parallel date-sorted (game_dates, runs) lists.
+    """
+    start = (game_dt - timedelta(days=max(RUNS_WINDOWS))).strftime("%Y-%m-%d")
     rows = query(
         """
-        SELECT home_team, away_team, home_score, away_score
+        SELECT game_date, home_team, away_team, home_score, away_score
         FROM mlb_games
         WHERE game_date >= ?
           AND game_date < ?
           AND status = 'final'
-          AND (home_team = ? OR away_team = ?)
+        ORDER BY game_date
         """,
-        (start, game_dt.strftime("%Y-%m-%d"), team_id, team_id),
+        (start, game_dt.strftime("%Y-%m-%d")),
     )
-    if not rows:
-        return None
-
-    runs: list[float] = []
+    logs: dict[str, tuple[list[str], list[float]]] = {}
     for row in rows:
-        if row.get("home_team") == team_id and row.get("home_score") is not None:
-            runs.append(float(row["home_score"]))
-        elif row.get("away_team") == team_id and row.get("away_score") is not None:
-            runs.append(float(row["away_score"]))
-    if not runs:
+        played = str(row["game_date"])[:10]
+        for team_key, score_key in (("home_team", "home_score"), ("away_team", "away_score")):
+            team_id = row.get(team_key)
+            if team_id is None or row.get(score_key) is None:
+                continue
+            dates, runs = logs.setdefault(str(team_id), ([], []))
+            dates.append(played)
+            runs.append(float(row[score_key]))
+    return logs
+
+
+def _runs_per_game(run_log: tuple[list[str], list[float]] | None, game_dt: date, window_days: int) -> float | None:
+    if not run_log:
+        return None
+    dates, runs = run_log
+    start = (game_dt - timedelta(days=window_days)).strftime("%Y-%m-%d")
+    window_runs = runs[bisect_left(dates, start):]
+    if not window_runs:
         return None
-    return sum(runs) / len(runs)
+    return sum(window_runs) / len(window_runs)
 
 
 def _aggregate_offense(rows: list[dict[str, Any]]) -> dict[str, float | None]:
@@ -187,23 +204,22 @@ def _aggregate_offense(rows: list[dict[str, Any]]) -> dict[str, float | None]:
 
 
 def _latest_pitcher_rows(team_id: str, game_dt: date, window: int = 14) -> list[dict[str, Any]]:
-    rows = query(
+    return query(
         """
         SELECT *
-        FROM mlb_pitcher_stats
-        WHERE team = ?
-          AND window_days = ?
-          AND stat_date < ?
-        ORDER BY player_id, stat_date DESC
+        FROM (
+            SELECT s.*,
+                   ROW_NUMBER() OVER (PARTITION BY player_id ORDER BY stat_date DESC) AS recency
+            FROM mlb_pitcher_stats s
+            WHERE team = ?
+              AND window_days = ?
+              AND stat_date < ?
+        ) ranked
+        WHERE recency = 1
+        ORDER BY player_id
         """,
         (team_id, window, game_dt.strftime("%Y-%m-%d")),
     )
-    latest_by_pitcher: dict[int, dict[str, Any]] = {}
-    for row in rows:
-        player_id = int(row["player_id"])
-        if player_id not in latest_by_pitcher:
-            latest_by_pitcher[player_id] = row
-    return list(latest_by_pitcher.values())
 
 
 def _aggregate_bullpen(rows: list[dict[str, Any]]) -> dict[str, float | None]:
@@ -273,18 +289,21 @@ def _aggregate_high_lev_bullpen(rows: list[dict[str, Any]]) -> dict[str, float |
     if not rows:
         return _null
 
+    # Parse each reliever's stats once; the median and both passes reuse them.
+    parsed = [
+        (_to_float(r.get("batters_faced")), _to_float(r.get("hr_per_9")), _to_float(r.get("k_pct")))
+        for r in rows
+    ]
+
     # Compute median BF across all rows for the top-half criterion.
-    bf_values = sorted(_to_float(r.get("batters_faced")) or 0.0 for r in rows)
+    bf_values = sorted(bf or 0.0 for bf, _, _ in parsed)
     median_bf = bf_values[len(bf_values) // 2] if bf_values else 0.0
 
-    high_lev_rows = []
-    for row in rows:
-        k_pct = _to_float(row.get("k_pct"))
-        if k_pct is None:
-            continue
-        bf = _to_float(row.get("batters_faced")) or 0.0
-        if k_pct > 25.0 or (k_pct > 20.0 and bf >= median_bf):
-            high_lev_rows.append(row)
+    high_lev_rows = [
+        (bf, hr9, k_pct)
+        for bf, hr9, k_pct in parsed
+        if k_pct is not None and (k_pct > 25.0 or (k_pct > 20.0 and (bf or 0.0) >= median_bf))
+    ]
 
     if not high_lev_rows:
         return _null
@@ -292,10 +311,8 @@ def _aggregate_high_lev_bullpen(rows: list[dict[str, Any]]) -> dict[str, float |
     weighted_hr9 = 0.0
     weighted_k = 0.0
     weight = 0.0
-    for row in high_lev_rows:
-        bf = _to_float(row.get("batters_faced")) or 1.0
-        hr9 = _to_float(row.get("hr_per_9"))
-        k_pct = _to_float(row.get("k_pct"))
+    for bf, hr9, k_pct in high_lev_rows:
+        bf = bf or 1.0
         weight += bf
         if hr9 is not None:
             weighted_hr9 += hr9 * bf
@@ -314,11 +331,17 @@ def _aggregate_high_lev_bullpen(rows: list[dict[str, Any]]) -> dict[str, float |
     }
 
 
-def _build_team_row(game_dt: date, team_id: str, opponent_team_id: str | None) -> tuple[dict[str, Any], list[str]]:
+def _build_team_row(
+    game_dt: date,
+    team_id: str,
+    opponent_team_id: str | None,
+    run_log: tuple[list[str], list[float]] | None = None,
+) -> tuple[dict[str, Any], list[str]]:
     warnings: list[str] = []
 
-    bat14 = _latest_batter_rows(team_id, game_dt=game_dt, window=14)
-    bat30 = _latest_batter_rows(team_id, game_dt=game_dt, window=30)
+    batter_rows = _latest_batter_rows(team_id, game_dt=game_dt, windows=(14, 30))
+    bat14 = batter_rows[14]
+    bat30 = batter_rows[30]
     if not bat14:
         warnings.append("no_14d_batter_stats")
     if not bat30:
@@ -352,8 +375,8 @@ def _build_team_row(game_dt: date, team_id: str, opponent_team_id: str | None) -
         "offense_hit_rate_30": off30["offense_hit_rate"],
         "offense_tb_per_pa_14": off14["offense_tb_per_pa"],
         "offense_tb_per_pa_30": off30["offense_tb_per_pa"],
-        "runs_per_game_14": _runs_per_game(team_id, game_dt=game_dt, window_days=14),
-        "runs_per_game_30": _runs_per_game(team_id, game_dt=game_dt, window_days=30),
+        "runs_per_game_14": _runs_per_game(run_log, game_dt=game_dt, window_days=14),
+        "runs_per_game_30": _runs_per_game(run_log, game_dt=game_dt, window_days=30),
         "hr_rate_14": off14["hr_rate"],
         "hr_rate_30": off30["hr_rate"],
         "bullpen_era_proxy_14": bp14["bullpen_era_proxy_14"],
@@ -372,39 +395,39 @@ def build_team_daily_features(game_date: date | str) -> dict[str, Any]:
     Build team_daily_features snapshot for all teams on a date.
     """
     game_dt = _to_date(game_date)
+    game_date_str = game_dt.strftime("%Y-%m-%d")
     print(f"\n🔧 Building team_daily_features for {game_dt} (as_of < {game_dt})")
 
     teams = _teams_on_date(game_dt)
     if not teams:
         print("  ⚠️ No scheduled teams found for date")
         return {
-            "game_date": game_dt.strftime("%Y-%m-%d"),
+            "game_date": game_date_str,
             "rows_upserted": 0,
             "warnings": ["No games/teams found for date"],
         }
 
+    run_logs = _team_run_logs(game_dt)
     rows: list[dict[str, Any]] = []
     missing_data_warnings: list[str] = []
     for team_id, opp_id in sorted(teams.items()):
-        row, warnings = _build_team_row(game_dt, team_id, opponent_team_id=opp_id)
+        row, warnings = _build_team_row(game_dt, team_id, opponent_team_id=opp_id, run_log=run_logs.get(team_id))
         rows.append(row)
         if warnings:
             missing_data_warnings.append(f"{team_id}: {','.join(warnings)}")
 
-    upserted = 0
-    for batch in _chunked(rows, size=MAX_BATCH_SIZE):
-        upserted += upsert_many(
-            "mlb_team_daily_features",
-            batch,
-            conflict_cols=["game_date", "team_id"],
-        )
+    upserted = upsert_many(
+        "mlb_team_daily_features",
+        rows,
+        conflict_cols=["game_date", "team_id"],
+    )
 
     print(f"  ✅ Team features built: generated={len(rows)}, upserted={upserted}")
     if missing_data_warnings:
         print(f"  ⚠️ Missing-data warnings: {len(missing_data_warnings)} team(s)")
 
     return {
-        "game_date": game_dt.strftime("%Y-%m-%d"),
+        "game_date": game_date_str,
         "rows_generated": len(rows),
         "rows_upserted": upserted,
         "missing_data_warnings": missing_data_warnings,
@@ -5,13 +5,17 @@ Stores lineup snapshots in `lineups` with active/inactive versioning.
 """
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import Any
 
-import requests
+import orjson
 
 from config import MLB_STATS_BASE, TEAM_ABBRS
 from db.database import get_connection, query
+from fetchers.schedule import _SESSION
+
+BOXSCORE_WORKERS = 8
 
 
 def _today_str() -> str:
@@ -25,7 +29,7 @@ def _team_abbr(team_name: str | None) -> str | None:
 
 
 def _fetch_schedule(date_str: str) -> list[dict[str, Any]]:
-    resp = requests.get(
+    resp = _SESSION.get(
         f"{MLB_STATS_BASE}/schedule",
         params={"date": date_str, "sportId": 1},
         timeout=20,
@@ -46,6 +50,35 @@ def _fetch_schedule(date_str: str) -> list[dict[str, Any]]:
     return games
 
 
+def _fetch_boxscore(game_id: int) -> dict[str, Any]:
+    # Shares schedule's keep-alive session, so the pool's concurrent
+    # boxscore requests reuse open statsapi connections.
+    resp = _SESSION.get(f"{MLB_STATS_BASE}/game/{game_id}/boxscore", timeout=20)
+    resp.raise_for_status()
+    return orjson.loads(resp.content)
+
+
+def _fetch_boxscores(game_ids: list[int]) -> dict[int, dict[str, Any] | Exception]:
+    """
+    Fetch boxscores for all games concurrently.
+
+    Each request is pure network wait, so overlapping them turns N round trips
+    into roughly one. Failures are returned in place of the payload so the
+    caller can report them per game.
+    """
+    if not game_ids:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(BOXSCORE_WORKERS, len(game_ids))) as pool:
+        futures = {game_id: pool.submit(_fetch_boxscore, game_id) for game_id in game_ids}
+    results: dict[int, dict[str, Any] | Exception] = {}
+    for game_id, future in futures.items():
+        try:
+            results[game_id] = future.result()
+        except Exception as exc:
+            results[game_id] = exc
+    return results
+
+
 def _safe_player_id(raw_value: Any) -> int | None:
     if raw_value is None:
         return None
@@ -213,17 +246,16 @@ def fetch_lineups_for_date(date_str: str | None = None) -> dict[str, Any]:
     rows_inserted = 0
     snapshots_checked = 0
 
+    boxscores = _fetch_boxscores([int(game["game_id"]) for game in games])
+
     conn = get_connection()
     try:
         for game in games:
             game_id = int(game["game_id"])
             status = game.get("status", "")
-            try:
-                resp = requests.get(f"{MLB_STATS_BASE}/game/{game_id}/boxscore", timeout=20)
-                resp.raise_for_status()
-                boxscore = resp.json()
-            except Exception as exc:
-                print(f"  ⚠️  Game {game_id}: failed to fetch boxscore ({exc})")
+            boxscore = boxscores[game_id]
+            if isinstance(boxscore, Exception):
+                print(f"  ⚠️  Game {game_id}: failed to fetch boxscore ({boxscore})")
                 continue
 
             for side, team_fallback in (("home", game.get("home_team")), ("away", game.get("away_team"))):
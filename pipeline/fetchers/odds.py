@@ -325,14 +325,19 @@ def fetch_hr_props(sport: str = "baseball_mlb") -> list[dict]:
 
 
 def consolidate_odds(raw_odds: list[dict]) -> list[dict]:
-    """Merge over/under lines for the same player + book into single rows."""
+    """
+    Merge over/under lines for the same player + book into single rows.
+
+    The first row seen for each key is reused and updated in place, so the
+    input rows should not be reused by the caller.
+    """
     merged = {}
     
     for odds in raw_odds:
         key = (odds["player_name"], odds["sportsbook"], odds["game_date"])
         
         if key not in merged:
-            merged[key] = odds.copy()
+            merged[key] = odds
         else:
             # Merge over/under prices
             if odds["over_price"] is not None:
@@ -19,10 +19,18 @@ from pybaseball import cache as pb_cache
 
 from config import PITCHER_WINDOWS
 from db.database import query, upsert_many
+from fetchers.statcast import _since, _until, game_date_order
 
 
 pb_cache.enable()
 
+K_EVENTS = ("strikeout", "strikeout_double_play", "strikeout_other")
+WHIFF_DESCRIPTIONS = ("swinging_strike", "swinging_strike_blocked")
+SWING_DESCRIPTIONS = (
+    *WHIFF_DESCRIPTIONS, "foul", "foul_tip", "hit_into_play", "hit_into_play_no_out", "hit_into_play_score",
+)
+STRIKE_ZONES = (1, 2, 3, 4, 5, 6, 7, 8, 9)
+
 
 def _date_str(dt: datetime) -> str:
     return dt.strftime("%Y-%m-%d")
@@ -41,28 +49,30 @@ def _compute_pitcher_metrics(df: pd.DataFrame) -> dict:
     if df is None or df.empty:
         return {}
 
+    # Column presence checked against one set rather than the Index each time
+    cols = set(df.columns)
+
     # Basic identifiers (pybaseball often includes these)
-    player_id = int(df["pitcher"].iloc[0]) if "pitcher" in df.columns else None
+    player_id = int(df["pitcher"].iloc[0]) if "pitcher" in cols else None
     player_name = None
-    if "player_name" in df.columns:
+    if "player_name" in cols:
         player_name = str(df["player_name"].iloc[0])
-    elif "pitcher_name" in df.columns:
+    elif "pitcher_name" in cols:
         player_name = str(df["pitcher_name"].iloc[0])
 
     # Batters faced: unique plate appearances
     # Prefer "at_bat_number" + "game_pk" combo
-    if {"game_pk", "at_bat_number"}.issubset(df.columns):
+    if {"game_pk", "at_bat_number"} <= cols:
         batters_faced = int(df[["game_pk", "at_bat_number"]].drop_duplicates().shape[0])
     else:
         batters_faced = None
 
     # Strikeouts: events == 'strikeout' or 'strikeout_double_play'
-    k_events = {"strikeout", "strikeout_double_play", "strikeout_other"}
-    strikeouts = int(df["events"].isin(k_events).sum()) if "events" in df.columns else 0
+    strikeouts = int(df["events"].isin(K_EVENTS).sum()) if "events" in cols else 0
 
     # Innings pitched approximation: outs_on_play plus strikeout outs, etc.
     outs = None
-    if "outs_on_play" in df.columns:
+    if "outs_on_play" in cols:
         outs = int(df["outs_on_play"].fillna(0).sum())
     innings = (outs / 3.0) if outs is not None else None
 
@@ -70,51 +80,47 @@ def _compute_pitcher_metrics(df: pd.DataFrame) -> dict:
     so_per_9 = (strikeouts / innings * 9.0) if innings and innings > 0 else None
 
     # HR allowed
-    hr_allowed = int((df["events"] == "home_run").sum()) if "events" in df.columns else 0
+    hr_allowed = int((df["events"] == "home_run").sum()) if "events" in cols else 0
     hr_per_9 = (hr_allowed / innings * 9.0) if innings and innings > 0 else None
 
     # Batted ball metrics
-    bbe = df[df.get("launch_speed").notna()] if "launch_speed" in df.columns else pd.DataFrame()
+    bbe = df[df["launch_speed"].notna()] if "launch_speed" in cols else pd.DataFrame()
     avg_ev = float(bbe["launch_speed"].mean()) if not bbe.empty else None
     hard_hit_pct = float((bbe["launch_speed"] >= 95).mean()) if not bbe.empty else None
 
     # Barrel approximation: Statcast barrel flag exists in some pulls as 'barrel'
-    if "barrel" in bbe.columns:
+    if "barrel" in cols and "launch_speed" in cols:
         barrel_pct = float(bbe["barrel"].fillna(0).astype(int).mean())
     else:
         barrel_pct = None
 
     # Fly ball % approximation from launch_angle (>= 25 degrees)
-    fly_ball_pct = float((bbe["launch_angle"] >= 25).mean()) if (not bbe.empty and "launch_angle" in bbe.columns) else None
+    fly_ball_pct = float((bbe["launch_angle"] >= 25).mean()) if (not bbe.empty and "launch_angle" in cols) else None
 
     # HR/FB approximation
     hr_per_fb = (hr_allowed / (fly_ball_pct * len(bbe))) if (fly_ball_pct is not None and not bbe.empty and fly_ball_pct > 0) else None
 
     # Pitch quality: avg fastball velocity (4-seam 'FF')
-    if {"pitch_type", "release_speed"}.issubset(df.columns):
+    if {"pitch_type", "release_speed"} <= cols:
         ff = df[df["pitch_type"] == "FF"]
         avg_fastball_velo = float(ff["release_speed"].mean()) if not ff.empty else None
     else:
         avg_fastball_velo = None
 
     # Whiff%: swinging strikes / swings
-    if {"description"}.issubset(df.columns):
-        swinging = df["description"].isin(["swinging_strike", "swinging_strike_blocked"])
-        swings = df["description"].isin(
-            ["swinging_strike", "swinging_strike_blocked", "foul", "foul_tip", "hit_into_play", "hit_into_play_no_out", "hit_into_play_score"]
-        )
+    swings = None
+    if "description" in cols:
+        swinging = df["description"].isin(WHIFF_DESCRIPTIONS)
+        swings = df["description"].isin(SWING_DESCRIPTIONS)
         whiff_pct = _safe_pct(swinging.sum(), swings.sum())
     else:
         whiff_pct = None
 
     # Chase% requires zone data; approximate using 'zone' if present (out of zone > 9)
     chase_pct = None
-    if {"zone", "description"}.issubset(df.columns):
+    if swings is not None and "zone" in cols:
         # swings at pitches out of the typical strike zone 1-9
-        out_zone = ~df["zone"].isin([1,2,3,4,5,6,7,8,9])
-        swings = df["description"].isin(
-            ["swinging_strike", "swinging_strike_blocked", "foul", "foul_tip", "hit_into_play", "hit_into_play_no_out", "hit_into_play_score"]
-        )
+        out_zone = ~df["zone"].isin(STRIKE_ZONES)
         chase_pct = _safe_pct((out_zone & swings).sum(), out_zone.sum())
     # Trend placeholders (computed later if you store historical velo)
     fastball_velo_trend = None
@@ -122,7 +128,7 @@ def _compute_pitcher_metrics(df: pd.DataFrame) -> dict:
     return {
         "player_id": player_id,
         "player_name": player_name or f"Pitcher {player_id}",
-        "pitch_hand": df["p_throws"].iloc[0] if "p_throws" in df.columns else None,
+        "pitch_hand": df["p_throws"].iloc[0] if "p_throws" in cols else None,
         "batters_faced": batters_faced,
         "k_pct": k_pct,
         "so_per_9": so_per_9,
@@ -166,44 +172,52 @@ def _build_pitcher_team_map(as_of_date: str) -> dict[int, str]:
     return {int(r["pid"]): str(r["team"]) for r in rows if r.get("pid") is not None}
 
 
-def compute_pitcher_stats_from_df(
+def pitcher_stat_rows_from_df(
     bulk_df: pd.DataFrame,
     pitcher_ids: list[int],
     as_of_date: str,
-) -> int:
+    pitcher_team_map: dict[int, str] | None = None,
+    date_order: str | None = "detect",
+) -> list[dict]:
     """
-    Compute pitcher rolling stats by filtering a pre-fetched bulk Statcast
-    DataFrame. No API calls made — eliminates thousands of statcast_pitcher()
-    calls during backfill.
+    Build pitcher_stats rows (14 and 30 day windows) for as_of_date from a
+    pre-fetched bulk Statcast DataFrame without writing them.
 
     Args:
         bulk_df:     Full Statcast DataFrame covering at least (as_of_date - 30 days)
                      through as_of_date. Must have a 'pitcher' column.
         pitcher_ids: List of MLB pitcher IDs to compute stats for.
         as_of_date:  The game date (YYYY-MM-DD).
-
-    Returns:
-        Number of rows upserted to pitcher_stats.
+        pitcher_team_map: Optional pitcher_id -> team for the date; looked
+                     up from mlb_games when omitted.
+        date_order:  game_date_order(bulk_df), computed once by the caller;
+                     "detect" scans the frame on every call.
     """
     if bulk_df.empty or "pitcher" not in bulk_df.columns:
-        return 0
+        return []
 
-    end_dt = datetime.strptime(as_of_date, "%Y-%m-%d")
-    start_30 = (end_dt - timedelta(days=30)).strftime("%Y-%m-%d")
-    start_14 = (end_dt - timedelta(days=14)).strftime("%Y-%m-%d")
-    as_of_str = end_dt.strftime("%Y-%m-%d")
+    end_ts = pd.Timestamp(as_of_date)
+    start_30 = end_ts - pd.Timedelta(days=30)
+    start_14 = end_ts - pd.Timedelta(days=14)
 
-    # Narrow bulk_df to the 30-day window for this date
-    mask = (bulk_df["game_date"] >= start_30) & (bulk_df["game_date"] <= as_of_str)
-    df30_all = bulk_df[mask]
+    # Narrow bulk_df to the 30-day window for this date (binary search on
+    # the date-sorted bulk frame; each pitcher's group keeps that order)
+    order = game_date_order(bulk_df) if date_order == "detect" else date_order
+    df30_all = _since(_until(bulk_df, end_ts, order), start_30, order)
 
-    pitcher_team_map = _build_pitcher_team_map(as_of_date)
+    if pitcher_team_map is None:
+        pitcher_team_map = _build_pitcher_team_map(as_of_date)
     rows_to_upsert: list[dict] = []
 
-    for pid in sorted(set(int(x) for x in pitcher_ids if x)):
+    # Split the window by pitcher in one hash pass instead of one full-frame
+    # comparison per pitcher.
+    wanted = sorted(set(int(x) for x in pitcher_ids if x))
+    by_pitcher = dict(iter(df30_all[df30_all["pitcher"].isin(wanted)].groupby("pitcher", sort=False)))
+
+    for pid in wanted:
         try:
-            df30 = df30_all[df30_all["pitcher"] == pid]
-            if df30.empty:
+            df30 = by_pitcher.get(pid)
+            if df30 is None:
                 continue
 
             team = pitcher_team_map.get(pid)
@@ -212,7 +226,7 @@ def compute_pitcher_stats_from_df(
             m30.update({"stat_date": as_of_date, "window_days": 30, "team": team})
             rows_to_upsert.append(m30)
 
-            df14 = df30[df30["game_date"] >= start_14]
+            df14 = _since(df30, start_14, order)
             m14 = _compute_pitcher_metrics(df14)
             m14.update({"stat_date": as_of_date, "window_days": 14, "team": team})
             rows_to_upsert.append(m14)
@@ -220,6 +234,27 @@ def compute_pitcher_stats_from_df(
         except Exception as exc:
             print(f"  ❌ Pitcher compute failed for {pid}: {exc}")
 
+    return rows_to_upsert
+
+
+def compute_pitcher_stats_from_df(
+    bulk_df: pd.DataFrame,
+    pitcher_ids: list[int],
+    as_of_date: str,
+    pitcher_team_map: dict[int, str] | None = None,
+    date_order: str | None = "detect",
+) -> int:
+    """
+    Compute pitcher rolling stats by filtering a pre-fetched bulk Statcast
+    DataFrame. No API calls made — eliminates thousands of statcast_pitcher()
+    calls during backfill.
+
+    Takes the same arguments as pitcher_stat_rows_from_df.
+
+    Returns:
+        Number of rows upserted to pitcher_stats.
+    """
+    rows_to_upsert = pitcher_stat_rows_from_df(bulk_df, pitcher_ids, as_of_date, pitcher_team_map, date_order)
     if not rows_to_upsert:
         return 0
 
@@ -6,7 +6,10 @@ Pulls today's games, probable pitchers, and lineup data.
 """
 import json
 import logging
+import orjson
 import requests
+from functools import lru_cache
+from types import MappingProxyType
 from datetime import datetime, timezone
 
 from config import MLB_STATS_BASE, TEAM_ABBRS
@@ -14,6 +17,31 @@ from db.database import upsert_many, query
 
 log = logging.getLogger(__name__)
 
+# One keep-alive session for every statsapi call (fetchers.lineups shares it;
+# its default pool of 10 connections per host covers BOXSCORE_WORKERS).
+_SESSION = requests.Session()
+
+# Shared read-only fallback for missing nested API objects.
+_EMPTY = MappingProxyType({})
+
+# detailedState substring → normalized status, checked in priority order.
+STATUS_PATTERNS = (
+    ("scheduled", "scheduled"),
+    ("pre", "scheduled"),
+    ("in progress", "live"),
+    ("final", "final"),
+)
+
+
+@lru_cache(maxsize=64)
+def _normalize_status(detailed_state: str) -> str:
+    """Map an MLB detailedState to scheduled/live/final (memoized; only a few distinct values exist)."""
+    status = detailed_state.lower()
+    for needle, mapped in STATUS_PATTERNS:
+        if needle in status:
+            return mapped
+    return status
+
 
 def _cache_response(source: str, endpoint: str, params_dict: dict, body_dict: dict) -> None:
     """Best-effort INSERT of a raw API response into raw_api_responses. Never raises."""
@@ -57,7 +85,7 @@ def _resolve_pitcher_hands(pitcher_ids: list[int]) -> dict[int, str | None]:
     if not ids_str:
         return {}
     try:
-        resp = requests.get(
+        resp = _SESSION.get(
             f"{MLB_STATS_BASE}/people",
             params={"personIds": ids_str, "hydrate": "currentTeam"},
             timeout=15,
@@ -85,6 +113,25 @@ def fetch_todays_games(date: str = None) -> list[dict]:
     Returns:
         List of game dicts ready for DB insertion
     """
+    games, _ = _fetch_schedule(date)
+    return games
+
+
+def fetch_schedule_and_umpires(date: str = None) -> tuple[list[dict], dict]:
+    """
+    Fetch the schedule and home plate umpires from one schedule request.
+
+    Returns (games, umpires): games as fetch_todays_games() returns them,
+    umpires as fetch_umpire_assignments() does. Use this instead of calling
+    both when a caller needs both.
+    """
+    games, assignments = _fetch_schedule(date)
+    print(f"  ✅ Found {len(assignments)} umpire assignments")
+    return games, assignments
+
+
+def _fetch_schedule(date: str | None) -> tuple[list[dict], dict]:
+    """Schedule request hydrated with officials: upserted games + umpire map."""
     if date is None:
         date = datetime.now().strftime("%Y-%m-%d")
 
@@ -94,10 +141,10 @@ def fetch_todays_games(date: str = None) -> list[dict]:
     params = {
         "date": date,
         "sportId": 1,  # MLB
-        "hydrate": "probablePitcher,linescore,team",
+        "hydrate": "probablePitcher,linescore,team,officials",
     }
 
-    resp = requests.get(url, params=params, timeout=15)
+    resp = _SESSION.get(url, params=params, timeout=15)
     resp.raise_for_status()
     data = resp.json()
 
@@ -113,7 +160,6 @@ def fetch_todays_games(date: str = None) -> list[dict]:
     for date_entry in data.get("dates", []):
         for game in date_entry.get("games", []):
             game_id = game["gamePk"]
-            status = game["status"]["detailedState"].lower()
 
             home = game["teams"]["home"]
             away = game["teams"]["away"]
@@ -122,8 +168,8 @@ def fetch_todays_games(date: str = None) -> list[dict]:
             away_team = away["team"]["name"]
 
             # Probable pitchers
-            home_pitcher = home.get("probablePitcher", {})
-            away_pitcher = away.get("probablePitcher", {})
+            home_pitcher = home.get("probablePitcher") or _EMPTY
+            away_pitcher = away.get("probablePitcher") or _EMPTY
 
             hp_id = home_pitcher.get("id")
             ap_id = away_pitcher.get("id")
@@ -149,10 +195,7 @@ def fetch_todays_games(date: str = None) -> list[dict]:
                 "away_pitcher_hand": None,
                 "stadium_id": stadium_map.get(home_abbr),
                 "umpire_name": None,  # filled separately
-                "status": "scheduled" if "scheduled" in status or "pre" in status
-                          else "live" if "in progress" in status
-                          else "final" if "final" in status
-                          else status,
+                "status": _normalize_status(game["status"]["detailedState"]),
                 "home_score": home.get("score"),
                 "away_score": away.get("score"),
             })
@@ -167,7 +210,7 @@ def fetch_todays_games(date: str = None) -> list[dict]:
 
     count = upsert_many("mlb_games", games, ["game_id"])
     print(f"  ✅ {len(games)} games found, {count} inserted/updated")
-    return games
+    return games, _extract_umpire_assignments(data)
 
 
 def fetch_game_lineups(game_id: int) -> dict:
@@ -180,9 +223,9 @@ def fetch_game_lineups(game_id: int) -> dict:
     url = f"{MLB_STATS_BASE}/game/{game_id}/boxscore"
     
     try:
-        resp = requests.get(url, timeout=10)
+        resp = _SESSION.get(url, timeout=10)
         resp.raise_for_status()
-        data = resp.json()
+        data = orjson.loads(resp.content)
     except Exception as e:
         print(f"  ⚠️  Could not fetch lineup for game {game_id}: {e}")
         return {"home": [], "away": []}
@@ -207,10 +250,28 @@ def fetch_game_lineups(game_id: int) -> dict:
     return lineups
 
 
+def _extract_umpire_assignments(data: dict) -> dict:
+    """Pull game_id → home plate umpire name out of an officials-hydrated schedule payload."""
+    assignments = {}
+    for date_entry in data.get("dates", []):
+        for game in date_entry.get("games", []):
+            game_id = game["gamePk"]
+            officials = game.get("officials", [])
+
+            for official in officials:
+                if official.get("officialType") == "Home Plate":
+                    assignments[game_id] = official.get("official", {}).get("fullName", "Unknown")
+                    break
+    return assignments
+
+
 def fetch_umpire_assignments(date: str = None) -> dict:
     """
     Fetch home plate umpire assignments for today's games.
     Returns dict mapping game_id → umpire_name.
+
+    Callers that also need the games should use fetch_schedule_and_umpires(),
+    which reads both from a single schedule request.
     """
     if date is None:
         date = datetime.now().strftime("%Y-%m-%d")
@@ -224,20 +285,9 @@ def fetch_umpire_assignments(date: str = None) -> dict:
         "hydrate": "officials",
     }
 
-    resp = requests.get(url, params=params, timeout=15)
+    resp = _SESSION.get(url, params=params, timeout=15)
     resp.raise_for_status()
-    data = resp.json()
-
-    assignments = {}
-    for date_entry in data.get("dates", []):
-        for game in date_entry.get("games", []):
-            game_id = game["gamePk"]
-            officials = game.get("officials", [])
-            
-            for official in officials:
-                if official.get("officialType") == "Home Plate":
-                    assignments[game_id] = official.get("official", {}).get("fullName", "Unknown")
-                    break
+    assignments = _extract_umpire_assignments(resp.json())
 
     print(f"  ✅ Found {len(assignments)} umpire assignments")
     return assignments
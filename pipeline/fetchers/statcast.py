@@ -8,17 +8,53 @@ For backfill use, prefer fetch_statcast_bulk() + compute_batter_stats_for_date()
 which fetches the full range once and slices in memory, avoiding thousands of
 repeated API calls.
 """
+import time
+
 import pandas as pd
 from datetime import datetime, timedelta
 from pybaseball import statcast, playerid_lookup, statcast_batter
 from pybaseball import cache as pb_cache
 
-from config import BATTER_WINDOWS
+from config import BATTER_WINDOWS, DATA_DIR
 from db.database import upsert_many
 
 # Enable pybaseball caching to avoid re-fetching
 pb_cache.enable()
 
+MIN_BATTED_BALLS = 10   # per-batter sample floor for a window row
+MIN_SPLIT_PA = 5        # per-handedness sample floor for ISO splits
+
+HIT_BASES = {"single": 1, "double": 2, "triple": 3, "home_run": 4}
+NON_AB_EVENTS = ["walk", "hit_by_pitch", "sac_fly", "sac_bunt", "catcher_interf"]
+SPLIT_NON_AB_EVENTS = ["walk", "hit_by_pitch", "sac_fly", "sac_bunt"]
+WALK_EVENTS = ["walk", "hit_by_pitch"]
+
+# Columns compute_batter_hr_stats() reads; everything else in the ~90-column
+# Statcast frame is dropped right after the pull.
+BATTER_USECOLS = (
+    "game_date", "batter", "player_name", "home_team", "stand", "p_throws",
+    "events", "launch_speed", "launch_angle", "launch_speed_angle", "hc_x",
+    "estimated_woba_using_speedangle",
+)
+CATEGORY_COLS = ("events", "stand", "p_throws", "home_team")
+
+# Extra columns the bulk backfill keeps for compute_pitcher_stats_from_df();
+# game_pk/at_bat_number/pitch_number also keep distinct pitches distinct
+# when the projected bulk frame is de-duplicated.
+PITCHER_USECOLS = (
+    "pitcher", "game_pk", "at_bat_number", "pitch_number", "outs_on_play",
+    "pitch_type", "release_speed", "description", "zone", "barrel",
+)
+BULK_CATEGORY_COLS = (*CATEGORY_COLS, "pitch_type", "description")
+# MLBAM ids and pitch counters all fit in int32; narrowed when fully populated.
+BULK_INT32_COLS = ("batter", "pitcher", "game_pk", "at_bat_number", "pitch_number")
+
+# Projected window pulls are cached as Parquet so intraday reruns skip pybaseball.
+STATCAST_CACHE_TTL_HOURS = 6
+# Bulk chunks ending this many days before today are treated as final and
+# their Parquet cache never expires; newer chunks use the TTL above.
+BULK_CACHE_SETTLED_DAYS = 3
+
 
 def _round_or_none(value, digits: int):
     if value is None or pd.isna(value):
@@ -26,21 +62,144 @@ def _round_or_none(value, digits: int):
     return round(float(value), digits)
 
 
+def _project_batter_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Keep only batter-metric columns, parse game_date to datetime64 and narrow
+    low-cardinality strings to categoricals. Float columns stay float64 so
+    rounded outputs are unchanged.
+    """
+    # Assemble the projected frame once from existing/converted columns
+    # rather than deep-copying the subset and then overwriting half of it.
+    cols = {c: df[c] for c in BATTER_USECOLS if c in df.columns}
+    if "game_date" in cols:
+        cols["game_date"] = pd.to_datetime(cols["game_date"])
+    if "batter" in cols:
+        cols["batter"] = cols["batter"].astype("int32")
+    for col in CATEGORY_COLS:
+        if col in cols:
+            cols[col] = cols[col].astype("category")
+    return pd.DataFrame(cols, index=df.index, copy=False)
+
+
+def _project_bulk_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Keep only the batter + pitcher metric columns of a bulk Statcast chunk."""
+    keep = [c for c in (*BATTER_USECOLS, *PITCHER_USECOLS) if c in df.columns]
+    return df[keep]
+
+
+def _window_cache_path(start_date: str, end_date: str):
+    return DATA_DIR / f"statcast_{start_date}_{end_date}.parquet"
+
+
+def _bulk_cache_path(start_date: str, end_date: str):
+    return DATA_DIR / f"statcast_bulk_{start_date}_{end_date}.parquet"
+
+
+def _read_cache(cache_path, ttl_hours: float | None) -> pd.DataFrame | None:
+    """Cached frame at cache_path, or None if missing, stale or unreadable (ttl_hours=None never expires)."""
+    if not cache_path.exists():
+        return None
+    if ttl_hours is not None and time.time() - cache_path.stat().st_mtime >= ttl_hours * 3600:
+        return None
+    try:
+        return pd.read_parquet(cache_path)
+    except Exception as exc:
+        print(f"  ⚠️  Ignoring unreadable Statcast cache {cache_path.name}: {exc}")
+        return None
+
+
+def _write_cache(df: pd.DataFrame, cache_path) -> None:
+    try:
+        df.to_parquet(cache_path, compression="zstd", index=False)
+    except Exception as exc:
+        print(f"  ⚠️  Could not write Statcast cache: {exc}")
+
+
 def fetch_statcast_window(start_date: str, end_date: str) -> pd.DataFrame:
     """
     Pull Statcast data for a date range.
     For daily pipeline: pulls last 30 days max.
-    Returns DataFrame with pitch-level data.
+    Returns pitch-level DataFrame projected to BATTER_USECOLS.
+
+    Results are cached on disk as Parquet for STATCAST_CACHE_TTL_HOURS.
     """
+    cache_path = _window_cache_path(start_date, end_date)
+    df = _read_cache(cache_path, STATCAST_CACHE_TTL_HOURS)
+    if df is not None:
+        print(f"  📂 Statcast cache hit: {start_date} → {end_date} ({len(df):,} pitches)")
+        return df
+
     print(f"  📊 Fetching Statcast: {start_date} → {end_date}")
     df = statcast(start_dt=start_date, end_dt=end_date)
     if df is None or df.empty:
         print("  ⚠️  No Statcast data returned")
         return pd.DataFrame()
     print(f"  ✅ Got {len(df):,} pitches")
+    df = _project_batter_columns(df)
+    _write_cache(df, cache_path)
     return df
 
 
+def _since(df: pd.DataFrame, start: pd.Timestamp, order: str | None) -> pd.DataFrame:
+    """
+    Rows with game_date >= start. When the frame is already sorted by date
+    (pybaseball returns newest-first), slice positionally via searchsorted
+    instead of materialising a boolean mask; row order is left untouched.
+    """
+    dates = df["game_date"]
+    if order == "asc":
+        return df.iloc[dates.searchsorted(start, side="left"):]
+    if order == "desc":
+        return df.iloc[: len(df) - dates.iloc[::-1].searchsorted(start, side="left")]
+    return df[dates >= start]
+
+
+def _until(df: pd.DataFrame, end: pd.Timestamp, order: str | None) -> pd.DataFrame:
+    """Rows with game_date <= end; the upper-bound counterpart of _since()."""
+    dates = df["game_date"]
+    if order == "asc":
+        return df.iloc[: dates.searchsorted(end, side="right")]
+    if order == "desc":
+        return df.iloc[len(df) - dates.iloc[::-1].searchsorted(end, side="right"):]
+    return df[dates <= end]
+
+
+def game_date_order(df: pd.DataFrame) -> str | None:
+    """
+    "desc"/"asc" when game_date is sorted, else None. This is an O(n) scan,
+    so per-date callers over one bulk frame should compute it once and pass
+    it in as date_order.
+    """
+    if df["game_date"].is_monotonic_decreasing:
+        return "desc"
+    if df["game_date"].is_monotonic_increasing:
+        return "asc"
+    return None
+
+
+def _outcome_flags(events: pd.Series) -> pd.DataFrame:
+    """
+    Per-PA outcome flags for an events column. For a categorical column the
+    flags are evaluated once per category and gathered by code, instead of
+    one isin/eq pass over every row per flag.
+    """
+    if isinstance(events.dtype, pd.CategoricalDtype):
+        codes = events.cat.codes.to_numpy()
+        if len(codes) and codes.min() >= 0:
+            flags = _outcome_flags(pd.Series(events.cat.categories)).take(codes)
+            flags.index = events.index
+            return flags
+    return pd.DataFrame({
+        "is_ab": ~events.isin(NON_AB_EVENTS),
+        "is_split_ab": ~events.isin(SPLIT_NON_AB_EVENTS),
+        "is_hit": events.isin(HIT_BASES.keys()),
+        "bases": events.map(HIT_BASES).astype("float64").fillna(0),
+        "is_hr": events.eq("home_run"),
+        "is_k": events.eq("strikeout"),
+        "is_bb": events.isin(WALK_EVENTS),
+    }, index=events.index)
+
+
 def compute_batter_hr_stats(df: pd.DataFrame, window_days: int, stat_date: str | None = None) -> list[dict]:
     """
     From raw Statcast pitch data, compute per-batter HR-relevant aggregates.
@@ -53,157 +212,221 @@ def compute_batter_hr_stats(df: pd.DataFrame, window_days: int, stat_date: str |
     - hr_per_fb: HR rate on fly balls
     - pull_pct: pull rate on fly balls (HRs go to pull side)
     - iso_power: SLG - AVG
+
+    Metrics come from one groupby over precomputed flag columns instead of
+    re-filtering the frame once per batter.
     """
     if df.empty:
         return []
 
     # Filter to batted ball events only for Statcast metrics
-    batted = df[df["launch_speed"].notna()].copy()
-    
-    # All plate appearances for counting stats
-    pa_events = df[df["events"].notna()].copy()
+    batted = df[df["launch_speed"].notna()]
+    if batted.empty:
+        return []
 
     stat_date = stat_date or datetime.now().strftime("%Y-%m-%d")
-    rows = []
-
-    for batter_id in batted["batter"].unique():
-        batter_batted = batted[batted["batter"] == batter_id]
-        batter_pa = pa_events[pa_events["batter"] == batter_id]
-        
-        if len(batter_batted) < 10:  # need minimum sample
-            continue
 
-        # Get player info from first row
-        first_row = batter_batted.iloc[0]
-        player_name = f"{first_row.get('player_name', 'Unknown')}"
-        
-        # Determine bat hand from stand column
-        bat_hand = batter_batted["stand"].mode()
-        bat_hand = bat_hand.iloc[0] if not bat_hand.empty else "R"
-
-        # Core Statcast metrics
-        n_batted = len(batter_batted)
-        barrel_pct = (batter_batted["launch_speed_angle"].eq(6).sum() / n_batted * 100
-                      if "launch_speed_angle" in batter_batted.columns else None)
-        
-        hard_hit = (batter_batted["launch_speed"] >= 95).sum() / n_batted * 100
-        avg_ev = batter_batted["launch_speed"].mean()
-        max_ev = batter_batted["launch_speed"].max()
-        avg_la = batter_batted["launch_angle"].mean()
-        
+    # ── Batted-ball flags, aggregated once per batter ──
+    launch_speed = batted["launch_speed"]
+    launch_angle = batted["launch_angle"]
+    is_fb = launch_angle.gt(25)
+    flags = pd.DataFrame({
+        "batter": batted["batter"],
+        "launch_speed": launch_speed,
+        "launch_angle": launch_angle,
+        "is_hard": launch_speed.ge(95),
         # Sweet spot: launch angle 8-32 degrees (optimal HR range)
-        sweet_spot = ((batter_batted["launch_angle"] >= 8) & 
-                      (batter_batted["launch_angle"] <= 32)).sum() / n_batted * 100
-
+        "is_sweet": launch_angle.ge(8) & launch_angle.le(32),
         # Fly ball rate (LA > 25 degrees)
-        fly_balls = batter_batted[batter_batted["launch_angle"] > 25]
-        fb_pct = len(fly_balls) / n_batted * 100 if n_batted > 0 else 0
-
-        # HR counting
-        hr_events = batter_pa[batter_pa["events"] == "home_run"]
-        hrs = len(hr_events)
-        hr_per_fb = hrs / len(fly_balls) * 100 if len(fly_balls) > 0 else 0
-
-        # Pull rate on fly balls
-        if len(fly_balls) > 0 and "hc_x" in fly_balls.columns:
-            # hc_x < 126 = pull side for RHB, > 126 = pull side for LHB
-            if bat_hand == "R":
-                pull_fbs = (fly_balls["hc_x"] < 126).sum()
-            else:
-                pull_fbs = (fly_balls["hc_x"] > 126).sum()
-            pull_pct = pull_fbs / len(fly_balls) * 100
-        else:
-            pull_pct = None
-
-        # Counting stats
-        n_pa = len(batter_pa)
-        n_ab = len(batter_pa[~batter_pa["events"].isin(
-            ["walk", "hit_by_pitch", "sac_fly", "sac_bunt", "catcher_interf"]
-        )])
-        
-        # Hits for AVG/SLG/ISO
-        hits = batter_pa[batter_pa["events"].isin(
-            ["single", "double", "triple", "home_run"]
-        )]
-        singles = (hits["events"] == "single").sum()
-        doubles = (hits["events"] == "double").sum()
-        triples = (hits["events"] == "triple").sum()
-        
-        avg = len(hits) / n_ab if n_ab > 0 else 0
-        slg = (singles + 2*doubles + 3*triples + 4*hrs) / n_ab if n_ab > 0 else 0
-        iso = slg - avg
-
-        # K% and BB%
-        ks = (batter_pa["events"] == "strikeout").sum()
-        bbs = (batter_pa["events"].isin(["walk", "hit_by_pitch"])).sum()
-        k_pct = ks / n_pa * 100 if n_pa > 0 else 0
-        bb_pct = bbs / n_pa * 100 if n_pa > 0 else 0
-
-        # xwOBA and xSLG from Statcast (if available)
-        xwoba = batter_batted["estimated_woba_using_speedangle"].mean() if \
-            "estimated_woba_using_speedangle" in batter_batted.columns else None
-        
-        # Handedness splits
-        vs_lhp = batter_batted[batter_batted["p_throws"] == "L"]
-        vs_rhp = batter_batted[batter_batted["p_throws"] == "R"]
-        
-        def calc_iso_split(split_batted, split_pa):
-            if len(split_pa) < 5:
-                return None
-            s_ab = len(split_pa[~split_pa["events"].isin(
-                ["walk", "hit_by_pitch", "sac_fly", "sac_bunt"])])
-            if s_ab == 0:
-                return None
-            s_hits = split_pa[split_pa["events"].isin(
-                ["single", "double", "triple", "home_run"])]
-            s_1b = (s_hits["events"] == "single").sum()
-            s_2b = (s_hits["events"] == "double").sum()
-            s_3b = (s_hits["events"] == "triple").sum()
-            s_hr = (s_hits["events"] == "home_run").sum()
-            s_avg = len(s_hits) / s_ab
-            s_slg = (s_1b + 2*s_2b + 3*s_3b + 4*s_hr) / s_ab
-            return round(s_slg - s_avg, 3)
-
-        vs_lhp_pa = pa_events[(pa_events["batter"] == batter_id) & (pa_events["p_throws"] == "L")]
-        vs_rhp_pa = pa_events[(pa_events["batter"] == batter_id) & (pa_events["p_throws"] == "R")]
+        "is_fb": is_fb,
+    })
+    aggs = {
+        "n_batted": ("launch_speed", "size"),
+        "avg_ev": ("launch_speed", "mean"),
+        "max_ev": ("launch_speed", "max"),
+        "avg_la": ("launch_angle", "mean"),
+        "hard": ("is_hard", "sum"),
+        "sweet": ("is_sweet", "sum"),
+        "fly_balls": ("is_fb", "sum"),
+    }
+    has_barrel = "launch_speed_angle" in batted.columns
+    if has_barrel:
+        flags["is_barrel"] = batted["launch_speed_angle"].eq(6)
+        aggs["barrels"] = ("is_barrel", "sum")
+    has_pull = "hc_x" in batted.columns
+    if has_pull:
+        # hc_x < 126 = pull side for RHB, > 126 = pull side for LHB
+        flags["pull_r"] = is_fb & batted["hc_x"].lt(126)
+        flags["pull_l"] = is_fb & batted["hc_x"].gt(126)
+        aggs["pull_r"] = ("pull_r", "sum")
+        aggs["pull_l"] = ("pull_l", "sum")
+    has_xwoba = "estimated_woba_using_speedangle" in batted.columns
+    if has_xwoba:
+        flags["xwoba"] = batted["estimated_woba_using_speedangle"]
+        aggs["xwoba"] = ("xwoba", "mean")
+
+    contact = flags.groupby("batter", sort=False).agg(**aggs)
+    contact = contact[contact["n_batted"] >= MIN_BATTED_BALLS]  # need minimum sample
+    if contact.empty:
+        return []
+    batter_ids = contact.index
+    # Batters under the batted-ball floor get no row, so drop them before
+    # the per-PA outcome work rather than aggregating and discarding them.
+    # (by value: raw pulls are concatenated chunks with duplicate index labels)
+    batted = batted[batted["batter"].isin(batter_ids)]
+
+    # All plate appearances for counting stats
+    pa_events = df[df["events"].notna() & df["batter"].isin(batter_ids)]
+
+    # Player info from each batter's first batted ball; bat hand from stand mode
+    first_rows = batted.drop_duplicates("batter").set_index("batter").reindex(batter_ids)
+    # (mode ties resolve to the lowest value, as Series.mode() would)
+    stand_counts = (
+        batted.groupby(["batter", "stand"], sort=False, observed=True)
+        .size()
+        .reset_index(name="n")
+        .sort_values(["n", "stand"], ascending=[False, True], kind="stable")
+    )
+    bat_hands = (
+        stand_counts.drop_duplicates("batter")
+        .set_index("batter")["stand"]
+        .astype(object)
+        .reindex(batter_ids)
+        .fillna("R")
+    )
+
+    # ── Plate-appearance outcomes, aggregated once per batter and per split ──
+    outcomes = _outcome_flags(pa_events["events"])
+    outcomes["batter"] = pa_events["batter"]
+    outcomes["p_throws"] = pa_events["p_throws"]
+    # One pass over the PA frame at (batter, hand); per-batter totals are
+    # re-summed from that small result. dropna=False keeps PAs with an
+    # unknown pitcher hand in the totals; the splits leave them out.
+    by_split = outcomes.groupby(["batter", "p_throws"], sort=False, observed=True, dropna=False).agg(
+        pa=("is_ab", "size"),
+        ab=("is_ab", "sum"),
+        split_ab=("is_split_ab", "sum"),
+        hits=("is_hit", "sum"),
+        bases=("bases", "sum"),
+        hrs=("is_hr", "sum"),
+        ks=("is_k", "sum"),
+        bbs=("is_bb", "sum"),
+    )
+    totals = by_split.groupby(level="batter", sort=False).sum().reindex(batter_ids, fill_value=0)
+    splits = by_split[by_split.index.get_level_values("p_throws").notna()]
+    splits = splits[["pa", "split_ab", "hits", "bases", "hrs"]].rename(columns={"split_ab": "ab"})
+    split_ok = (splits["pa"] >= MIN_SPLIT_PA) & (splits["ab"] > 0)
+    split_ab = splits["ab"].where(split_ok)
+    split_iso = (splits["bases"] / split_ab - splits["hits"] / split_ab).round(3)
+    # One row per batter with iso_L/iso_R/hrs_L/hrs_R, aligned to batter_ids
+    by_hand = pd.DataFrame({"iso": split_iso, "hrs": splits["hrs"]}).unstack("p_throws")
+    by_hand.columns = [f"{stat}_{hand}" for stat, hand in by_hand.columns]
+    by_hand = by_hand.reindex(index=batter_ids, columns=["iso_L", "iso_R", "hrs_L", "hrs_R"])
+
+    # ── Per-batter ratios, computed column-wise ──
+    n_batted = contact["n_batted"]
+    n_fb = contact["fly_balls"]
+    n_pa = totals["pa"]
+    n_ab = totals["ab"]
+    ab_or_nan = n_ab.where(n_ab > 0)
+    pa_or_nan = n_pa.where(n_pa > 0)
+    fb_or_nan = n_fb.where(n_fb > 0)
+
+    avg = (totals["hits"] / ab_or_nan).fillna(0)
+    slg = (totals["bases"] / ab_or_nan).fillna(0)
+    if has_pull:
+        pull_fbs = contact["pull_r"].where(bat_hands.eq("R"), contact["pull_l"])
+        pull_pct = pull_fbs / fb_or_nan * 100
+    else:
+        pull_pct = pd.Series(float("nan"), index=batter_ids)
+
+    metrics = pd.DataFrame({
+        "barrel_pct": contact["barrels"] / n_batted * 100 if has_barrel else float("nan"),
+        "hard_hit_pct": (contact["hard"] / n_batted * 100).round(1),
+        "avg_exit_velo": contact["avg_ev"].round(1),
+        "max_exit_velo": contact["max_ev"].round(1),
+        "fly_ball_pct": n_fb / n_batted * 100,
+        "hr_per_fb": (totals["hrs"] / fb_or_nan * 100).fillna(0),
+        "pull_pct": pull_pct,
+        "avg_launch_angle": contact["avg_la"].round(1),
+        "sweet_spot_pct": (contact["sweet"] / n_batted * 100).round(1),
+        "iso_power": (slg - avg).round(3),
+        "slg": slg.round(3),
+        "k_pct": (totals["ks"] / pa_or_nan * 100).fillna(0).round(1),
+        "bb_pct": (totals["bbs"] / pa_or_nan * 100).fillna(0).round(1),
+    }, index=batter_ids)
+    cols = {name: metrics[name].to_numpy() for name in metrics.columns}
+    xwoba = contact["xwoba"].to_numpy() if has_xwoba else None
+    names = first_rows["player_name"].to_numpy() if "player_name" in first_rows.columns else None
+    teams = first_rows["home_team"].to_numpy() if "home_team" in first_rows.columns else None
+    hands = bat_hands.to_numpy()
+    pa_arr, ab_arr, hrs_arr = n_pa.to_numpy(), n_ab.to_numpy(), totals["hrs"].to_numpy()
+    iso_l, iso_r = by_hand["iso_L"].to_numpy(), by_hand["iso_R"].to_numpy()
+    hr_l, hr_r = by_hand["hrs_L"].fillna(0).to_numpy(), by_hand["hrs_R"].fillna(0).to_numpy()
 
+    rows = []
+    for i, batter_id in enumerate(batter_ids):
         rows.append({
             "player_id": int(batter_id),
-            "player_name": player_name,
-            "team": first_row.get("home_team", ""),
-            "bat_hand": bat_hand,
+            "player_name": f"{names[i] if names is not None else 'Unknown'}",
+            "team": teams[i] if teams is not None else "",
+            "bat_hand": hands[i],
             "stat_date": stat_date,
             "window_days": window_days,
-            "barrel_pct": _round_or_none(barrel_pct, 1),
-            "hard_hit_pct": round(hard_hit, 1),
-            "avg_exit_velo": round(avg_ev, 1),
-            "max_exit_velo": round(max_ev, 1),
-            "fly_ball_pct": round(fb_pct, 1),
-            "hr_per_fb": round(hr_per_fb, 1),
-            "pull_pct": _round_or_none(pull_pct, 1),
-            "avg_launch_angle": round(avg_la, 1),
-            "sweet_spot_pct": round(sweet_spot, 1),
-            "iso_power": round(iso, 3),
-            "slg": round(slg, 3),
+            "barrel_pct": _round_or_none(cols["barrel_pct"][i], 1),
+            "hard_hit_pct": cols["hard_hit_pct"][i],
+            "avg_exit_velo": cols["avg_exit_velo"][i],
+            "max_exit_velo": cols["max_exit_velo"][i],
+            "fly_ball_pct": round(float(cols["fly_ball_pct"][i]), 1),
+            "hr_per_fb": round(float(cols["hr_per_fb"][i]), 1),
+            "pull_pct": _round_or_none(cols["pull_pct"][i], 1),
+            "avg_launch_angle": cols["avg_launch_angle"][i],
+            "sweet_spot_pct": cols["sweet_spot_pct"][i],
+            "iso_power": cols["iso_power"][i],
+            "slg": cols["slg"][i],
             "woba": None,  # needs linear weights calc
-            "xwoba": _round_or_none(xwoba, 3),
+            "xwoba": _round_or_none(xwoba[i], 3) if xwoba is not None else None,
             "xslg": None,  # from Statcast leaderboard
-            "pa": n_pa,
-            "ab": n_ab,
-            "hrs": hrs,
-            "k_pct": round(k_pct, 1),
-            "bb_pct": round(bb_pct, 1),
-            "iso_vs_lhp": calc_iso_split(vs_lhp, vs_lhp_pa),
-            "iso_vs_rhp": calc_iso_split(vs_rhp, vs_rhp_pa),
+            "pa": int(pa_arr[i]),
+            "ab": int(ab_arr[i]),
+            "hrs": int(hrs_arr[i]),
+            "k_pct": cols["k_pct"][i],
+            "bb_pct": cols["bb_pct"][i],
+            "iso_vs_lhp": _round_or_none(iso_l[i], 3),
+            "iso_vs_rhp": _round_or_none(iso_r[i], 3),
             "barrel_pct_vs_lhp": None,  # TODO: split barrel calc
             "barrel_pct_vs_rhp": None,
-            "hr_count_vs_lhp": len(vs_lhp_pa[vs_lhp_pa["events"] == "home_run"]) if len(vs_lhp_pa) > 0 else 0,
-            "hr_count_vs_rhp": len(vs_rhp_pa[vs_rhp_pa["events"] == "home_run"]) if len(vs_rhp_pa) > 0 else 0,
+            "hr_count_vs_lhp": int(hr_l[i]),
+            "hr_count_vs_rhp": int(hr_r[i]),
         })
 
     return rows
 
 
+def _fetch_bulk_chunk(chunk_num: int, s: str, e: str, ttl_hours: float | None) -> pd.DataFrame | None:
+    """One projected bulk chunk, from the Parquet cache or pybaseball; None if empty or failed."""
+    print(f"  📦 Bulk Statcast chunk {chunk_num}: {s} → {e}")
+    cache_path = _bulk_cache_path(s, e)
+    cached = _read_cache(cache_path, ttl_hours)
+    if cached is not None:
+        print(f"     📂 Chunk {chunk_num} cache hit ({len(cached):,} pitches)")
+        return cached
+    try:
+        df = statcast(start_dt=s, end_dt=e)
+        if df is None or df.empty:
+            print(f"     ⚠️  Chunk {chunk_num}: no data returned")
+            return None
+        # Project each chunk before concat so the ~90-column raw
+        # frames never coexist in memory for the whole range.
+        projected = _project_bulk_columns(df)
+        _write_cache(projected, cache_path)
+        print(f"     ✅ Chunk {chunk_num}: {len(df):,} pitches")
+        return projected
+    except Exception as exc:
+        print(f"     ❌ Chunk {chunk_num} failed: {exc}")
+        return None
+
+
 def fetch_statcast_bulk(start_date: str, end_date: str, chunk_days: int = 60) -> pd.DataFrame:
     """
     Fetch Statcast pitch data for an entire date range in fixed-day chunks.
@@ -219,46 +442,62 @@ def fetch_statcast_bulk(start_date: str, end_date: str, chunk_days: int = 60) ->
         chunk_days: Days per API call (default 60 ≈ 2 months).
 
     Returns:
-        Single concatenated DataFrame with normalised game_date strings.
+        Single newest-first DataFrame, projected to BATTER_USECOLS +
+        PITCHER_USECOLS, with game_date as midnight datetime64.
+
+    Each projected chunk is cached as Parquet, so re-running a backfill
+    over the same range reads from disk instead of pybaseball.
     """
     start = datetime.strptime(start_date, "%Y-%m-%d")
     end = datetime.strptime(end_date, "%Y-%m-%d")
+    settled_before = datetime.now() - timedelta(days=BULK_CACHE_SETTLED_DAYS)
 
-    chunks: list[pd.DataFrame] = []
+    ranges: list[tuple[int, str, str, float | None]] = []
     chunk_start = start
-    chunk_num = 0
-
     while chunk_start <= end:
         chunk_end = min(chunk_start + timedelta(days=chunk_days - 1), end)
-        s = chunk_start.strftime("%Y-%m-%d")
-        e = chunk_end.strftime("%Y-%m-%d")
-        chunk_num += 1
-        print(f"  📦 Bulk Statcast chunk {chunk_num}: {s} → {e}")
-        try:
-            df = statcast(start_dt=s, end_dt=e)
-            if df is not None and not df.empty:
-                chunks.append(df)
-                print(f"     ✅ {len(df):,} pitches")
-            else:
-                print(f"     ⚠️  No data returned")
-        except Exception as exc:
-            print(f"     ❌ Chunk failed: {exc}")
+        ttl_hours = None if chunk_end < settled_before else STATCAST_CACHE_TTL_HOURS
+        ranges.append((len(ranges) + 1, chunk_start.strftime("%Y-%m-%d"), chunk_end.strftime("%Y-%m-%d"), ttl_hours))
         chunk_start = chunk_end + timedelta(days=1)
+    chunk_num = len(ranges)
+
+    # Chunks are pulled one at a time: pybaseball's statcast() already
+    # spreads each chunk's per-day requests over its own thread pool, and
+    # more concurrent Savant requests only invite throttling.
+    chunks = [df for df in (_fetch_bulk_chunk(*r) for r in ranges) if df is not None]
 
     if not chunks:
         print("  ❌ No Statcast data fetched for bulk range")
         return pd.DataFrame()
 
-    full_df = pd.concat(chunks, ignore_index=True)
-    # Normalise game_date to string for consistent slicing downstream
+    # Chunks cover ascending, disjoint date ranges and pybaseball returns
+    # each newest-first, so concatenating them in reverse yields one
+    # newest-first frame (like a single window pull) that the per-date
+    # slicers can binary-search instead of masking.
+    full_df = pd.concat(chunks[::-1], ignore_index=True)
+    # Normalise game_date to midnight datetime64 so per-date slicing can
+    # binary-search it (searchsorted on string columns is far slower).
     if "game_date" in full_df.columns:
-        full_df["game_date"] = full_df["game_date"].astype(str).str[:10]
+        full_df["game_date"] = pd.to_datetime(full_df["game_date"]).dt.normalize()
+    # Categorise after concat (per-chunk categories would not line up): the
+    # multi-month frame keeps int codes instead of millions of str objects.
+    for col in BULK_CATEGORY_COLS:
+        if col in full_df.columns:
+            full_df[col] = full_df[col].astype("category")
+    # Float metrics stay float64 so rounded outputs are unchanged.
+    for col in BULK_INT32_COLS:
+        if col in full_df.columns and full_df[col].notna().all():
+            full_df[col] = full_df[col].astype("int32")
     full_df = full_df.drop_duplicates()
     print(f"  ✅ Bulk fetch complete: {len(full_df):,} total pitches across {chunk_num} chunk(s)")
     return full_df
 
 
-def compute_batter_stats_for_date(bulk_df: pd.DataFrame, as_of_date: str) -> list[dict]:
+def compute_batter_stats_for_date(
+    bulk_df: pd.DataFrame,
+    as_of_date: str,
+    date_order: str | None = "detect",
+) -> list[dict]:
     """
     Compute rolling-window batter stats for a single game date from a
     pre-fetched bulk DataFrame. No API calls made.
@@ -267,26 +506,28 @@ def compute_batter_stats_for_date(bulk_df: pd.DataFrame, as_of_date: str) -> lis
         bulk_df:    Full Statcast DataFrame covering at least (as_of_date - 30 days)
                     through as_of_date.
         as_of_date: The game date to compute stats for (YYYY-MM-DD).
+        date_order: game_date_order(bulk_df), computed once by the caller;
+                    "detect" scans the frame on every call.
 
     Returns:
         List of batter stat dicts ready for DB upsert (same schema as
         fetch_daily_batter_stats).
     """
-    today = datetime.strptime(as_of_date, "%Y-%m-%d")
+    today = pd.Timestamp(as_of_date)
     max_window = max(BATTER_WINDOWS)
-    earliest_needed = (today - timedelta(days=max_window)).strftime("%Y-%m-%d")
+    earliest_needed = today - pd.Timedelta(days=max_window)
 
-    # Slice the pre-fetched data to the window we need
-    mask = (bulk_df["game_date"] >= earliest_needed) & (bulk_df["game_date"] <= as_of_date)
-    window_df = bulk_df[mask]
+    # Slice the pre-fetched data to the window we need; the bulk frame is
+    # date-sorted, so these are binary searches rather than full-frame masks.
+    order = game_date_order(bulk_df) if date_order == "detect" else date_order
+    window_df = _since(_until(bulk_df, today, order), earliest_needed, order)
 
     if window_df.empty:
         return []
 
     all_rows: list[dict] = []
     for window in BATTER_WINDOWS:
-        window_start = (today - timedelta(days=window)).strftime("%Y-%m-%d")
-        w_df = window_df[window_df["game_date"] >= window_start]
+        w_df = _since(window_df, today - pd.Timedelta(days=window), order)
         rows = compute_batter_hr_stats(w_df, window, stat_date=as_of_date)
         all_rows.extend(rows)
 
@@ -314,10 +555,12 @@ def fetch_daily_batter_stats(as_of_date: str | None = None):
         print("  ❌ No data — skipping batter stats")
         return
 
+    today_ts = pd.Timestamp(today.date())
+    order = game_date_order(full_df)
     all_rows = []
     for window in BATTER_WINDOWS:
-        window_start = (today - timedelta(days=window)).strftime("%Y-%m-%d")
-        window_df = full_df[full_df["game_date"] >= window_start]
+        window_start = today_ts - pd.Timedelta(days=window)
+        window_df = _since(full_df, window_start, order)
         
         print(f"  📐 Computing {window}-day stats ({len(window_df):,} pitches)...")
         rows = compute_batter_hr_stats(window_df, window, stat_date=today.strftime("%Y-%m-%d"))
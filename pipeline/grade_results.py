@@ -8,7 +8,7 @@ from datetime import datetime, timezone
 from typing import Any
 
 from clv import capture_closing_lines_for_date, update_bet_clv_for_date
-from db.database import get_connection, query, upsert_many
+from db.database import get_connection, is_postgres, query, upsert_many
 from grading.base_grader import (
     SUPPORTED_MARKETS,
     payout_for_settlement,
@@ -300,13 +300,37 @@ def _settle_bets(game_date: str, outcomes: list[dict[str, Any]]) -> dict[str, in
     return {"pending_bets": len(pending_bets), "settled": settled, "still_pending": still_pending}
 
 
-def grade_results_for_date(game_date: str) -> dict[str, Any]:
+def refresh_perf_daily_bands() -> bool:
+    """
+    Refresh the mlb_perf_daily_bands rollup read by the performance API.
+
+    Postgres-only (sqlite has no materialized views); a missing view or
+    failed refresh is logged and never fails grading. The refresh rebuilds
+    the whole rollup, so multi-date runs should call it once at the end.
+    """
+    if not is_postgres():
+        return False
+    conn = get_connection()
+    try:
+        conn.execute("REFRESH MATERIALIZED VIEW CONCURRENTLY mlb_perf_daily_bands")
+        conn.commit()
+        return True
+    except Exception as exc:  # noqa: BLE001
+        conn.rollback()
+        print(f"  ⚠️  mlb_perf_daily_bands refresh skipped: {exc}")
+        return False
+    finally:
+        conn.close()
+
+
+def grade_results_for_date(game_date: str, refresh_perf_bands: bool = True) -> dict[str, Any]:
     selections = _selection_candidates(game_date)
     player_outcomes = grade_player_prop_outcomes(selections)
     game_outcomes = grade_game_market_outcomes(selections)
     all_outcomes = player_outcomes + game_outcomes
     upserted = _upsert_outcomes(all_outcomes)
     model_scores_updated = _update_model_score_results(game_date, selections, all_outcomes)
+    perf_bands_refreshed = refresh_perf_daily_bands() if refresh_perf_bands else False
     closing_capture = capture_closing_lines_for_date(game_date)
     clv_update = update_bet_clv_for_date(game_date)
     settle_summary = _settle_bets(game_date, all_outcomes)
@@ -317,6 +341,7 @@ def grade_results_for_date(game_date: str) -> dict[str, Any]:
         "game_outcomes": len(game_outcomes),
         "outcomes_upserted": upserted,
         "model_scores_updated": model_scores_updated,
+        "perf_bands_refreshed": perf_bands_refreshed,
         "closing_groups": closing_capture.get("groups", 0),
         "closing_upserted": closing_capture.get("upserted", 0),
         "bets_clv_updated": clv_update.get("updated", 0),
@@ -25,17 +25,19 @@ def _safe_int(value: Any) -> int | None:
             return None
 
 
-def _game_row(game_id: int) -> dict[str, Any] | None:
+def _game_rows(game_ids: list[int]) -> dict[int, dict[str, Any]]:
+    if not game_ids:
+        return {}
+    placeholders = ", ".join(["?"] * len(game_ids))
     rows = query(
-        """
+        f"""
         SELECT game_id, home_team, away_team, status, home_score, away_score
         FROM mlb_games
-        WHERE game_id = ?
-        LIMIT 1
+        WHERE game_id IN ({placeholders})
         """,
-        (game_id,),
+        tuple(game_ids),
     )
-    return rows[0] if rows else None
+    return {int(row["game_id"]): row for row in rows}
 
 
 def _is_game_final(game: dict[str, Any] | None) -> bool:
@@ -142,8 +144,9 @@ def grade_game_market_outcomes(selections: list[dict[str, Any]]) -> list[dict[st
 
     outcomes: list[dict[str, Any]] = []
     first5_cache: dict[int, tuple[int | None, int | None]] = {}
+    games = _game_rows(list(grouped))
     for game_id, game_rows in grouped.items():
-        game = _game_row(game_id)
+        game = games.get(game_id)
         if not _is_game_final(game):
             continue
         for selection in game_rows:
@@ -35,20 +35,23 @@ def _fetch_boxscore(game_id: int, timeout: int = 20) -> dict[str, Any] | None:
         return None
 
 
-def _is_game_final(game_id: int) -> bool:
+def _final_game_ids(game_ids: list[int]) -> set[int]:
+    if not game_ids:
+        return set()
+    placeholders = ", ".join(["?"] * len(game_ids))
     rows = query(
-        """
-        SELECT status
+        f"""
+        SELECT game_id, status
         FROM mlb_games
-        WHERE game_id = ?
-        LIMIT 1
+        WHERE game_id IN ({placeholders})
         """,
-        (game_id,),
+        tuple(game_ids),
     )
-    if not rows:
-        return False
-    status = str(rows[0].get("status") or "").lower()
-    return status in {"final", "game over", "completed"}
+    return {
+        int(row["game_id"])
+        for row in rows
+        if str(row.get("status") or "").lower() in {"final", "game over", "completed"}
+    }
 
 
 def _extract_player_stats(boxscore: dict[str, Any]) -> dict[int, dict[str, int]]:
@@ -118,8 +121,9 @@ def grade_player_prop_outcomes(selections: list[dict[str, Any]]) -> list[dict[st
         grouped[int(game_id)].append(selection)
 
     outcomes: list[dict[str, Any]] = []
+    final_ids = _final_game_ids(list(grouped))
     for game_id, game_rows in grouped.items():
-        if not _is_game_final(game_id):
+        if game_id not in final_ids:
             continue
         boxscore = _fetch_boxscore(game_id)
         if not boxscore:
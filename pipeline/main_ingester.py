@@ -95,10 +95,9 @@ def job_schedule():
     date = _today_et()
     log.info("fetching schedule + umpires for %s", date)
     with pipeline_run("schedule_fetch", service_name="mlb-data-ingester", source="mlb_stats_api") as run:
-        from fetchers.schedule import fetch_todays_games, fetch_umpire_assignments
-        games = fetch_todays_games(date)
+        from fetchers.schedule import fetch_schedule_and_umpires
+        games, umpires = fetch_schedule_and_umpires(date)
         if games:
-            umpires = fetch_umpire_assignments(date)
             log.info("schedule: %d games, %d umpire assignments", len(games), len(umpires))
             run.records_processed = len(games)
         else:
@@ -160,7 +159,8 @@ def job_outcomes():
     log.info("fetching post-game outcomes for %s", date)
     with pipeline_run("outcomes_fetch", service_name="mlb-data-ingester", source="mlb_stats_api"):
         from grade_results import run_grading
-        run_grading(date)
+        # mlb-scoring-engine refreshes the perf-band rollup at end of day.
+        run_grading(date, refresh_perf_bands=False)
         update_source_health("mlb_stats_api", success=True)
 
 
@@ -9,7 +9,8 @@ MODE env var:
   schedule  (default) — long-running scheduler
   score     — score today's markets and exit
   rescore   — rescore on confirmed lineups and exit
-  grade     — grade yesterday's results and exit
+  grade     — grade yesterday's results, refresh performance bands and exit
+  refresh_perf_bands — refresh the performance summary rollup and exit
 """
 from __future__ import annotations
 
@@ -108,7 +109,8 @@ def job_grade(date: str | None = None):
     log.info("grading results for %s", date)
     with pipeline_run("grade_results", service_name="mlb-scoring-engine"):
         from grade_results import run_grading
-        run_grading(date)
+        # The perf-band rollup is refreshed once by the end-of-day job.
+        run_grading(date, refresh_perf_bands=False)
         log.info("grading complete for %s", date)
 
 
@@ -126,6 +128,13 @@ def job_build_daily_card(date: str | None = None):
     )
 
 
+def job_refresh_perf_bands():
+    """Refresh the performance summary rollup once grading is done (~01:15 AM ET)."""
+    from grade_results import refresh_perf_daily_bands
+    if refresh_perf_daily_bands():
+        log.info("mlb_perf_daily_bands refreshed")
+
+
 # ── Scheduler ────────────────────────────────────────────────────────────────
 
 def run_scheduler():
@@ -143,6 +152,9 @@ def run_scheduler():
     # Daily card builder — after grading at 00:30
     schedule.every().day.at("01:00").do(lambda: _safe_run("build_daily_card", job_build_daily_card))
 
+    # End of day — roll graded results into the performance summary view
+    schedule.every().day.at("01:15").do(lambda: _safe_run("refresh_perf_bands", job_refresh_perf_bands))
+
     log.info("scheduler running — press Ctrl+C to stop")
     while True:
         schedule.run_pending()
@@ -160,6 +172,9 @@ if __name__ == "__main__":
         _safe_run("rescore", job_rescore)
     elif mode == "grade":
         _safe_run("grade", job_grade)
+        _safe_run("refresh_perf_bands", job_refresh_perf_bands)
+    elif mode == "refresh_perf_bands":
+        _safe_run("refresh_perf_bands", job_refresh_perf_bands)
     elif mode == "build_daily_card":
         _safe_run("build_daily_card", job_build_daily_card)
     else:
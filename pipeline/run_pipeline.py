@@ -72,15 +72,14 @@ def run_daily(date: str = None):
     print("STEP 1/6: Game Schedule")
     print("─" * 40)
     try:
-        from fetchers.schedule import fetch_todays_games, fetch_umpire_assignments
-        games = fetch_todays_games(date)
+        from fetchers.schedule import fetch_schedule_and_umpires
+        # Umpire assignments come from the same schedule response
+        games, umpires = fetch_schedule_and_umpires(date)
         
         if not games:
             print("\n⚠️  No games today. Pipeline complete.")
             return
         
-        # Also fetch umpire assignments
-        umpires = fetch_umpire_assignments(date)
         for game in games:
             game["umpire_name"] = umpires.get(game["game_id"])
             
@@ -9,7 +9,7 @@ import json
 from datetime import datetime, timezone
 from typing import Any
 
-from alerts import send_market_alerts
+from alerts import send_market_alerts_batch
 from db.database import complete_score_run, create_score_run, fail_score_run
 from scoring.base_engine import score_market_for_date
 
@@ -129,12 +129,19 @@ def score_markets(
             only_game_id=only_game_id,
             triggered_by=triggered_by,
         )
-        if send_alerts and str(result.get("status", "")).lower() == "completed":
+        results.append(result)
+
+    if send_alerts:
+        completed = [r for r in results if str(r.get("status", "")).lower() == "completed"]
+        if completed:
+            # One query, and as few webhook POSTs as the message limit allows
             try:
-                result["alert"] = send_market_alerts(game_date=game_date, market=mkt)
+                alert = send_market_alerts_batch(game_date=game_date, markets=[r["market"] for r in completed])
             except Exception as exc:
-                result["alert"] = {"sent": False, "reason": f"error:{exc}"}
-        results.append(result)
+                alert = {"sent": False, "reason": f"error:{exc}"}
+            per_market = alert.get("market_results", {})
+            for r in completed:
+                r["alert"] = per_market.get(r["market"], alert)
     return results
 
 
@@ -8,6 +8,7 @@ from __future__ import annotations
 
 from typing import Any
 
+from config import HR_FACTOR_WEIGHTS
 from db.database import query
 from utils.stadiums import get_handedness_hr_factor
 from .base_engine import (
@@ -26,6 +27,9 @@ from .base_engine import (
 MARKET = "HR"
 BET_TYPE_DEFAULT = "HR_1PLUS"
 
+# Built once from config; _score_from_factors runs per batter.
+_WEIGHT_ITEMS = tuple(HR_FACTOR_WEIGHTS.items())
+
 
 def _to_float(value: Any) -> float | None:
     if value is None:
@@ -129,16 +133,7 @@ def _batting_order_for_player(game_date: str, game_id: int, player_id: int) -> t
 
 
 def _score_from_factors(factors: dict[str, float]) -> float:
-    weights = {
-        "barrel_score": 0.22,
-        "matchup_score": 0.18,
-        "park_weather_score": 0.20,
-        "pitcher_vuln_score": 0.15,
-        "hot_cold_score": 0.08,
-        "lineup_order_score": 0.10,
-        "tto_score": 0.07,
-    }
-    return _clamp(sum(factors.get(k, 50.0) * w for k, w in weights.items()))
+    return _clamp(sum(factors.get(k, 50.0) * w for k, w in _WEIGHT_ITEMS))
 
 
 def score_game(game: GameContext, weather: dict | None, park_factor: float, season: int) -> list[dict]:
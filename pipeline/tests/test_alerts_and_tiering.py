@@ -1,7 +1,10 @@
 import os
 import sys
+import threading
 from pathlib import Path
 
+import orjson
+
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
 import alerts  # noqa: E402
@@ -31,3 +34,118 @@ def test_send_market_alerts_skips_when_webhook_missing(monkeypatch):
     assert res["sent"] is False
     assert res["reason"] == "webhook_not_set"
     assert res["count"] == 1
+
+
+def test_threshold_for_market_follows_env_override(monkeypatch):
+    monkeypatch.setenv("ALERT_THRESHOLDS_JSON", '{"HR": {"signals": ["BET"], "min_score": 80, "max_rows": 3}}')
+    assert alerts._threshold_for_market("HR")["min_score"] == 80
+    assert alerts._threshold_for_market("K") == alerts.DEFAULT_THRESHOLDS["*"]
+
+    monkeypatch.setenv("ALERT_THRESHOLDS_JSON", "not json")
+    assert alerts._threshold_for_market("HR") == alerts.DEFAULT_THRESHOLDS["HR"]
+
+
+def test_top_rows_binds_signals_as_array_on_postgres(monkeypatch):
+    calls = []
+    monkeypatch.setattr(alerts, "query", lambda sql, params: calls.append((sql, params)) or [])
+    monkeypatch.setattr(alerts, "is_postgres", lambda: True)
+    monkeypatch.delenv("ALERT_THRESHOLDS_JSON", raising=False)
+
+    alerts._top_rows("2026-03-27", "HR")
+    sql, params = calls[0]
+    assert "signal = ANY(?)" in sql
+    assert params == ("2026-03-27", "HR", ["BET", "LEAN"], 72.0, 5)
+
+
+def test_build_payload_formats_reasons_and_risk():
+    rows = [
+        {"signal": "BET", "player_name": "A", "side": "OVER", "line": 0.5, "model_score": 81.26, "edge": 6.456,
+         "lineup_confirmed": 1, "reasons_json": '["r1", "r2", "r3"]', "risk_flags_json": "[]"},
+        {"signal": "LEAN", "selection_key": "x", "reasons_json": "not json", "risk_flags_json": '["k"]'},
+    ]
+    content = alerts._build_payload("2026-03-27", "HR", rows)["content"]
+    assert content.splitlines() == [
+        "MLBPredicts Alerts — 2026-03-27 HR",
+        " • BET A OVER 0.5 score=81.3 edge=6.46% lineup=Y reasons=r1; r2 ",
+        " • LEAN x   score=0.0 edge=0.0% lineup=N risk=k",
+    ]
+
+
+def test_send_market_alerts_batch_posts_once(monkeypatch):
+    rows = [
+        {"market": "HR", "signal": "BET", "player_name": f"H{i}", "model_score": 90 - i, "edge": 5,
+         "reasons_json": "[]", "risk_flags_json": "[]"}
+        for i in range(7)
+    ] + [
+        {"market": "K", "signal": "LEAN", "player_name": "K1", "model_score": 71, "edge": 3,
+         "reasons_json": "[]", "risk_flags_json": "[]"},
+    ]
+    posts = []
+
+    class _Resp:
+        status_code = 204
+
+        def raise_for_status(self):
+            pass
+
+    monkeypatch.setattr(alerts, "query", lambda *_args, **_kwargs: rows)
+    monkeypatch.setattr(alerts._SESSION, "post", lambda url, **kwargs: posts.append(orjson.loads(kwargs["data"])) or _Resp())
+    monkeypatch.setenv("DISCORD_WEBHOOK_URL", "https://discord.test/hook")
+    monkeypatch.delenv("ALERT_THRESHOLDS_JSON", raising=False)
+
+    res = alerts.send_market_alerts_batch(game_date="2026-03-27", markets=["HR", "K"])
+    assert res["sent"] is True
+    assert res["markets"] == {"HR": 5, "K": 1}
+    assert len(posts) == 1
+    assert "2026-03-27 HR" in posts[0]["content"] and "2026-03-27 K" in posts[0]["content"]
+
+
+def test_send_market_alerts_batch_splits_long_content_and_reports_per_market(monkeypatch):
+    markets = ["HR", "K", "HITS_1P", "TB", "RBI", "RUNS", "ML", "TOTAL"]
+    rows = [
+        {"market": m, "signal": "BET", "player_name": f"{m}-player-{i}", "model_score": 90 - i, "edge": 5,
+         "reasons_json": '["a fairly long reason string", "another long reason string"]',
+         "risk_flags_json": '["some risk flag"]'}
+        for m in sorted(markets)
+        for i in range(5)
+    ]
+    posts = []
+
+    def fake_post(url, payload):
+        posts.append(payload["content"])
+        if len(posts) == 2:
+            raise RuntimeError("boom")
+        return type("_Resp", (), {"status_code": 204})()
+
+    monkeypatch.setattr(alerts, "query", lambda *_args, **_kwargs: rows)
+    monkeypatch.setattr(alerts, "_post_webhook", fake_post)
+    monkeypatch.setenv("DISCORD_WEBHOOK_URL", "https://discord.test/hook")
+    monkeypatch.delenv("ALERT_THRESHOLDS_JSON", raising=False)
+
+    res = alerts.send_market_alerts_batch(game_date="2026-03-27", markets=markets + ["NRFI"])
+
+    assert len(posts) == res["messages"] > 1
+    assert all(len(content) <= alerts.DISCORD_CONTENT_LIMIT for content in posts)
+    for m in markets:
+        # every market section goes out in exactly one message, untruncated
+        assert sum(f"2026-03-27 {m}\n" in content for content in posts) == 1
+        assert sum(f"{m}-player-4 " in content for content in posts) == 1
+
+    failed = {m for m in markets if f"2026-03-27 {m}\n" in posts[1]}
+    assert failed
+    assert res["sent"] is False
+    assert set(res["markets"]) == set(markets) - failed
+    assert all(res["market_results"][m]["sent"] is False for m in failed)
+    assert res["market_results"]["NRFI"] == {"sent": False, "reason": "no_rows", "count": 0}
+
+
+def test_send_market_alerts_async_send_queues_post(monkeypatch):
+    rows = [{"signal": "BET", "player_name": "A", "line": 0.5, "model_score": 80, "edge": 6, "lineup_confirmed": 1, "reasons_json": "[]", "risk_flags_json": "[]"}]
+    posted = threading.Event()
+    monkeypatch.setattr(alerts, "query", lambda *_args, **_kwargs: rows)
+    monkeypatch.setattr(alerts, "_post_webhook", lambda url, payload: posted.set())
+    monkeypatch.setenv("DISCORD_WEBHOOK_URL", "https://discord.test/hook")
+
+    res = alerts.send_market_alerts(game_date="2026-03-27", market="HR", async_send=True)
+    assert res == {"sent": "queued", "count": 1}
+    assert posted.wait(timeout=5)
@@ -0,0 +1,98 @@
+import sys
+import time
+from decimal import Decimal
+from pathlib import Path
+from types import SimpleNamespace
+
+import orjson
+import pytest
+from fastapi import HTTPException
+from jose import jwt
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import api  # noqa: E402
+
+
+def _token(secret: str, exp: float) -> str:
+    return jwt.encode({"sub": "user-1", "aud": "authenticated", "exp": int(exp)}, secret, algorithm="HS256")
+
+
+def test_require_auth_caches_verified_token_until_expiry(monkeypatch):
+    monkeypatch.setattr(api, "_JWT_SECRET", "s3cret")
+    monkeypatch.setattr(api, "_auth_cache", {})
+    token = _token("s3cret", time.time() + 3600)
+
+    assert api._require_auth(token) == "user-1"
+
+    def _fail(*_args, **_kwargs):
+        raise AssertionError("decode should be skipped on cache hit")
+
+    monkeypatch.setattr(jwt, "decode", _fail)
+    assert api._require_auth(token) == "user-1"
+
+
+def test_require_auth_rejects_bad_signature(monkeypatch):
+    monkeypatch.setattr(api, "_JWT_SECRET", "s3cret")
+    monkeypatch.setattr(api, "_auth_cache", {})
+
+    with pytest.raises(HTTPException) as exc:
+        api._require_auth(_token("other", time.time() + 3600))
+    assert exc.value.status_code == 401
+
+
+def test_get_my_picks_pages_with_keyset_cursor(monkeypatch):
+    picks = [{"id": 10 - i, "saved_at": f"2026-03-{27 - i:02d}T12:00:00+00:00"} for i in range(5)]
+    calls = []
+
+    def _query(sql, params):
+        calls.append((sql, params))
+        if "(p.saved_at, p.id) < (?, ?)" in sql:
+            _, saved_at, pick_id, limit = params
+            rest = [p for p in picks if (p["saved_at"], p["id"]) < (saved_at, pick_id)]
+            return rest[:limit]
+        return picks[: params[-1]]
+
+    monkeypatch.setattr(api, "db_query", _query)
+    request = SimpleNamespace()
+
+    first = api.get_my_picks.__wrapped__(request, user_id="user-1", cursor=None, limit=3)
+    assert [r["id"] for r in first["data"]] == [10, 9, 8]
+    assert first["meta"]["next_cursor"]
+
+    second = api.get_my_picks.__wrapped__(request, user_id="user-1", cursor=first["meta"]["next_cursor"], limit=3)
+    assert [r["id"] for r in second["data"]] == [7, 6]
+    assert second["meta"]["next_cursor"] is None
+    assert calls[1][1][:3] == ("user-1", "2026-03-25T12:00:00+00:00", 8)
+
+
+def test_stream_envelope_matches_envelope_shape():
+    rows = [{"player_name": f"P{i}", "model_score": Decimal("71.25"), "line": 0.5} for i in range(2 * api.STREAM_CHUNK_ROWS)]
+    it = (r for r in rows)
+    body = b"".join(api._stream_envelope(next(it), it, "2026-03-27"))
+    parsed = orjson.loads(body)
+    assert parsed["data"] == [{**r, "model_score": 71.25} for r in rows]
+    assert parsed["meta"]["count"] == len(rows)
+
+    empty = orjson.loads(b"".join(api._stream_envelope(None, (r for r in ()), "2026-03-27")))
+    assert empty["data"] == [] and empty["meta"]["count"] == 0
+
+
+def test_performance_summary_falls_back_when_rollup_is_missing(monkeypatch):
+    calls = []
+
+    def fake_query(sql, params=()):
+        calls.append((sql, params))
+        if "mlb_perf_daily_bands" in sql:
+            raise RuntimeError('relation "mlb_perf_daily_bands" does not exist')
+        return [{"band": "80+", "total": 4, "wins": 3, "avg_score": 82.1, "avg_edge": 4.2}]
+
+    monkeypatch.setattr(api, "db_query", fake_query)
+
+    rows = api._load_performance_summary("alltime", "HR")
+
+    assert len(calls) == 2
+    sql, params = calls[1]
+    assert "FROM mlb_model_scores" in sql and "result != 'pending'" in sql and "market = ?" in sql
+    assert params == ("HR",)
+    assert rows == [{"band": "80+", "total": 4, "wins": 3, "avg_score": 82.1, "avg_edge": 4.2, "win_rate": 0.75}]
@@ -0,0 +1,175 @@
+import sys
+import threading
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import backfill_historical  # noqa: E402
+
+
+def test_skip_check_uses_one_range_scan_per_stage(monkeypatch):
+    scanned: list[str] = []
+
+    def fake_populated(stage, start_date, end_date):
+        scanned.append(stage)
+        return {"2024-05-01", "2024-05-02"} if stage != "features" else {"2024-05-01"}
+
+    def fail_query(*_args, **_kwargs):
+        raise AssertionError("per-date existence query issued")
+
+    processed: list[tuple[str, dict]] = []
+
+    def fake_process_day(game_date, **kwargs):
+        processed.append((game_date, kwargs["populated"]))
+        return {
+            "game_date": game_date,
+            "batter_rows": 0,
+            "pitcher_rows": 0,
+            "skipped_stages": [],
+            "feature_runs": 0,
+            "score_rows": 0,
+            "grade_outcomes": 0,
+        }
+
+    monkeypatch.setattr(backfill_historical, "_populated_dates", fake_populated)
+    monkeypatch.setattr(backfill_historical, "_starters_by_date", lambda start, end: {})
+    monkeypatch.setattr(backfill_historical, "query", fail_query)
+    monkeypatch.setattr(backfill_historical, "_process_day", fake_process_day)
+
+    summary = backfill_historical.run_backfill(
+        "2024-05-01", "2024-05-03", build_features=True, bulk=False, workers=1
+    )
+
+    assert sorted(scanned) == ["batter_stats", "features", "games", "pitcher_stats"]
+    assert summary["skipped_days"] == 1
+    # Phase 1 and Phase 2 both see the prefetched sets for the two open dates.
+    assert sorted({d for d, _ in processed}) == ["2024-05-02", "2024-05-03"]
+    assert all(populated is not None and "features" in populated for _, populated in processed)
+
+
+def test_batch_writer_buffers_rows_until_threshold(monkeypatch):
+    writes: list[tuple[str, int, list[str]]] = []
+    monkeypatch.setattr(
+        backfill_historical,
+        "upsert_many",
+        lambda table, rows, conflict_cols: writes.append((table, len(rows), conflict_cols)) or len(rows),
+    )
+    writer = backfill_historical._BatchWriter(flush_rows=5)
+    keys = ["player_id", "stat_date", "window_days"]
+
+    assert writer.add("mlb_batter_stats", [{"player_id": 1}] * 3, keys, "2024-05-01") == 3
+    assert writer.add("mlb_pitcher_stats", [{"player_id": 2}], keys, "2024-05-01") == 1
+    assert writes == []
+
+    writer.add("mlb_batter_stats", [{"player_id": 3}] * 2, keys, "2024-05-02")
+    assert writes == [("mlb_batter_stats", 5, keys), ("mlb_pitcher_stats", 1, keys)]
+
+    assert writer.flush() == 0
+    assert len(writes) == 2
+    assert writer.failed == {}
+
+
+def test_failed_flush_drops_its_dates_from_phase2(monkeypatch):
+    def fake_upsert(table, rows, conflict_cols):
+        if table == "mlb_pitcher_stats":
+            raise RuntimeError("db down")
+        return len(rows)
+
+    phase2_dates: list[str] = []
+
+    def fake_process_day(game_date, **kwargs):
+        writer = kwargs.get("writer")
+        if writer is not None:
+            keys = ["player_id", "stat_date", "window_days"]
+            writer.add("mlb_batter_stats", [{"player_id": 1}], keys, game_date)
+            if game_date != "2024-05-03":
+                writer.add("mlb_pitcher_stats", [{"player_id": 2}], keys, game_date)
+        else:
+            phase2_dates.append(game_date)
+        return {
+            "game_date": game_date,
+            "batter_rows": 1,
+            "pitcher_rows": 1,
+            "skipped_stages": [],
+            "feature_runs": 0,
+            "score_rows": 0,
+            "grade_outcomes": 0,
+        }
+
+    monkeypatch.setattr(backfill_historical, "upsert_many", fake_upsert)
+    monkeypatch.setattr(backfill_historical, "_process_day", fake_process_day)
+    # Flush every three buffered rows, so batches fail mid-run as well as at the end
+    writer_cls = backfill_historical._BatchWriter
+    monkeypatch.setattr(backfill_historical, "_BatchWriter", lambda: writer_cls(flush_rows=3))
+
+    summary = backfill_historical.run_backfill(
+        "2024-05-01", "2024-05-04", build_features=True, bulk=False, workers=1, force=True
+    )
+
+    assert phase2_dates == ["2024-05-03"]
+    assert summary["success_days"] == 1
+    assert sorted(f["game_date"] for f in summary["failures"]) == ["2024-05-01", "2024-05-02", "2024-05-04"]
+
+
+def test_bulk_phase1_fetches_schedule_sequentially(monkeypatch):
+    main_thread = threading.current_thread()
+    fetch_calls: list[tuple[str, str, bool]] = []
+    stat_threads: set[bool] = set()
+
+    def fake_schedule(game_date):
+        fetch_calls.append(("schedule", game_date, threading.current_thread() is main_thread))
+        return [{"home_pitcher_id": 10, "home_team": "NYY", "away_pitcher_id": None}], {}
+
+    def fake_batter_stats(df, game_date, date_order):
+        assert date_order == "desc"
+        stat_threads.add(threading.current_thread() is main_thread)
+        return [{"player_id": 1, "stat_date": game_date, "window_days": 14}]
+
+    def fake_pitcher_rows(df, pitcher_ids, game_date, pitcher_team_map, date_order):
+        assert date_order == "desc"
+        assert pitcher_ids == [10] and pitcher_team_map == {10: "NYY"}
+        return [{"player_id": 10, "stat_date": game_date, "window_days": 14}]
+
+    bulk = pd.DataFrame({"game_date": pd.to_datetime(["2024-05-04", "2024-05-01"])})
+    scans: list[int] = []
+    real_order = backfill_historical.game_date_order
+    monkeypatch.setattr(
+        backfill_historical,
+        "game_date_order",
+        lambda df: scans.append(len(df)) or real_order(df),
+    )
+    monkeypatch.setattr(backfill_historical, "fetch_statcast_bulk", lambda start, end: bulk)
+    monkeypatch.setattr(backfill_historical, "fetch_schedule_and_umpires", fake_schedule)
+    monkeypatch.setattr(backfill_historical, "compute_batter_stats_for_date", fake_batter_stats)
+    monkeypatch.setattr(backfill_historical, "pitcher_stat_rows_from_df", fake_pitcher_rows)
+    monkeypatch.setattr(backfill_historical, "upsert_many", lambda table, rows, conflict_cols: len(rows))
+
+    summary = backfill_historical.run_backfill("2024-05-01", "2024-05-04", force=True, workers=4)
+
+    dates = ["2024-05-01", "2024-05-02", "2024-05-03", "2024-05-04"]
+    assert fetch_calls == [("schedule", d, True) for d in dates]
+    assert stat_threads == {False}
+    assert scans == [2]
+    assert summary["success_days"] == 4
+
+
+def test_backfill_refreshes_perf_bands_once_after_grading(monkeypatch):
+    graded: list[tuple[str, bool]] = []
+    refreshes: list[bool] = []
+
+    def fake_grade(game_date, refresh_perf_bands=True):
+        graded.append((game_date, refresh_perf_bands))
+        return {"outcomes_upserted": 1}
+
+    monkeypatch.setattr(backfill_historical, "grade_results_for_date", fake_grade)
+    monkeypatch.setattr(backfill_historical, "refresh_perf_daily_bands", lambda: refreshes.append(True) or True)
+
+    summary = backfill_historical.run_backfill(
+        "2024-05-01", "2024-05-03", grade=True, skip_fetch=True, force=True, workers=2
+    )
+
+    assert sorted(graded) == [("2024-05-01", False), ("2024-05-02", False), ("2024-05-03", False)]
+    assert refreshes == [True]
+    assert summary["success_days"] == 3
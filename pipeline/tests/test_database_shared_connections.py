@@ -0,0 +1,73 @@
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from db import database  # noqa: E402
+
+
+def _sqlite_db(monkeypatch, tmp_path):
+    monkeypatch.setattr(database, "DB_PATH", tmp_path / "shared.db")
+    monkeypatch.setattr(database, "is_postgres", lambda: False)
+    monkeypatch.setattr(database, "_resolve_postgres_url", lambda: "")
+    opened: list[object] = []
+    connect = database._connect_sqlite
+
+    def counting_connect(*args, **kwargs):
+        conn = connect(*args, **kwargs)
+        opened.append(conn)
+        return conn
+
+    monkeypatch.setattr(database, "_connect_sqlite", counting_connect)
+    return opened
+
+
+def test_shared_connections_reuse_one_connection_per_thread(monkeypatch, tmp_path):
+    opened = _sqlite_db(monkeypatch, tmp_path)
+    database.query("CREATE TABLE t (k INTEGER PRIMARY KEY, v INTEGER)")
+    assert len(opened) == 1
+
+    def work(k: int) -> list[dict]:
+        database.upsert_many("t", [{"k": k, "v": k * 10}], conflict_cols=["k"])
+        return database.query("SELECT v FROM t WHERE k = ?", (k,))
+
+    with database.shared_connections():
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            results = list(pool.map(work, range(20)))
+        shared = opened[1:]
+
+    assert results == [[{"v": k * 10}] for k in range(20)]
+    assert 1 <= len(shared) <= 2
+    assert database._shared_open == []
+
+    # Outside the block each call connects again.
+    database.query("SELECT 1")
+    assert len(opened) == len(shared) + 2
+
+
+def test_shared_connection_is_replaced_after_an_error(monkeypatch, tmp_path):
+    opened = _sqlite_db(monkeypatch, tmp_path)
+
+    with database.shared_connections():
+        try:
+            database.query("SELECT * FROM missing_table")
+        except Exception:
+            pass
+        assert database.query("SELECT 1 AS one") == [{"one": 1}]
+        assert database.query("SELECT 2 AS two") == [{"two": 2}]
+
+    assert len(opened) == 2
+
+
+def test_get_status_counts_on_one_connection(monkeypatch, tmp_path):
+    opened = _sqlite_db(monkeypatch, tmp_path)
+    database.query("CREATE TABLE mlb_games (game_id INTEGER)")
+    database.insert_many("mlb_games", [{"game_id": 1}, {"game_id": 2}])
+    opened.clear()
+
+    status = database.get_status()
+
+    assert len(opened) == 1
+    assert status["mlb_games"] == 2
+    assert status["mlb_bets"] == "TABLE MISSING"
@@ -36,3 +36,62 @@ def test_compute_batter_hr_stats_handles_nullable_na_and_zero_values():
     assert row["xwoba"] is None
     assert row["barrel_pct"] == 0.0
     assert row["pull_pct"] == 100.0
+
+
+def test_fetch_statcast_bulk_reuses_cached_chunks(monkeypatch, tmp_path):
+    from fetchers import statcast
+
+    calls = []
+
+    def fake_statcast(start_dt, end_dt):
+        calls.append((start_dt, end_dt))
+        return pd.DataFrame(
+            {
+                "game_date": pd.to_datetime([end_dt, start_dt]),
+                "batter": [1, 2],
+                "events": ["single", None],
+                "launch_speed": [95.0, float("nan")],
+                "unused": ["x", "y"],
+            }
+        )
+
+    monkeypatch.setattr(statcast, "statcast", fake_statcast)
+    monkeypatch.setattr(statcast, "DATA_DIR", tmp_path)
+
+    first = statcast.fetch_statcast_bulk("2024-04-01", "2024-04-20", chunk_days=10)
+    second = statcast.fetch_statcast_bulk("2024-04-01", "2024-04-20", chunk_days=10)
+
+    assert len(calls) == 2
+    assert "unused" not in first.columns
+    assert first["game_date"].is_monotonic_decreasing
+    pd.testing.assert_frame_equal(first, second)
+
+
+def test_compute_batter_hr_stats_handles_duplicate_index_labels():
+    def chunk(batter, n):
+        return pd.DataFrame(
+            {
+                "launch_speed": [96.0] * n,
+                "events": ["home_run"] + ["single"] * (n - 1),
+                "batter": [batter] * n,
+                "player_name": ["Test Batter"] * n,
+                "stand": ["R"] * n,
+                "launch_speed_angle": [6] * n,
+                "launch_angle": [30.0] * n,
+                "hc_x": [100.0] * n,
+                "p_throws": ["R"] * n,
+                "estimated_woba_using_speedangle": [0.5] * n,
+                "home_team": ["NYY"] * n,
+            }
+        )
+
+    strikeouts = chunk(123, 3).assign(launch_speed=float("nan"), events="strikeout")
+    # pybaseball concatenates per-day pulls without ignore_index
+    df = pd.concat([chunk(123, 10), strikeouts, chunk(456, 12), chunk(789, 2)])
+    assert not df.index.is_unique
+
+    stats = compute_batter_hr_stats(df, window_days=7, stat_date="2023-03-31")
+    expected = compute_batter_hr_stats(df.reset_index(drop=True), window_days=7, stat_date="2023-03-31")
+
+    assert sorted(r["player_id"] for r in stats) == [123, 456]
+    assert stats == expected
@@ -4,6 +4,7 @@ Normalize The Odds API responses into a single internal market-odds shape.
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from functools import lru_cache
 import re
 from typing import Any
 
@@ -60,9 +61,14 @@ def decimal_to_implied_prob(decimal_odds: int | float | None) -> float | None:
     return 1.0 / value
 
 
+_NON_SLUG_RE = re.compile(r"[^a-z0-9]+")
+
+
+@lru_cache(maxsize=4096)
 def _slug(value: str | None) -> str:
+    """Memoized: the same player/team names repeat across every bookmaker."""
     cleaned = (value or "").strip().lower()
-    cleaned = re.sub(r"[^a-z0-9]+", "_", cleaned)
+    cleaned = _NON_SLUG_RE.sub("_", cleaned)
     cleaned = cleaned.strip("_")
     return cleaned or "unknown"
 
@@ -95,11 +101,13 @@ def _date_from_commence(commence_time: str | None) -> str:
         return datetime.now(timezone.utc).strftime("%Y-%m-%d")
 
 
+@lru_cache(maxsize=1024)
 def _normalize_side(
     raw_name: str | None,
     home_team: str | None = None,
     away_team: str | None = None,
 ) -> str | None:
+    """Cached per (name, home, away); each event only has a handful of outcome names."""
     name = (raw_name or "").strip().lower()
     if name == "over":
         return "OVER"
@@ -131,7 +139,9 @@ def _effective_market(source_market_key: str, line: float | None) -> dict[str, s
     return base
 
 
+@lru_cache(maxsize=1024)
 def _line_token(line: float | None) -> str | None:
+    """Cached: lines repeat across books and selections (0.5, 1.5, 8.5, ...)."""
     if line is None:
         return None
     if line.is_integer():